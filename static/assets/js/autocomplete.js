@@ -0,0 +1,38 @@
+// Search-as-you-type for <select data-autocomplete-url="..."> elements.
+// The server renders only the selected options; matches for what the user
+// types are fetched from the JSON endpoint and replace the unselected ones.
+document.querySelectorAll("select[data-autocomplete-url]").forEach((select) => {
+  const input = document.createElement("input");
+  input.type = "search";
+  input.className = "form-control form-control-sm mb-1";
+  input.placeholder = "Type to search…";
+  select.before(input);
+
+  const load = async () => {
+    const url = new URL(select.dataset.autocompleteUrl, window.location.origin);
+    url.searchParams.set("q", input.value.trim());
+    const response = await fetch(url, { headers: { Accept: "application/json" } });
+    if (!response.ok) {
+      return;
+    }
+    const { results } = await response.json();
+    for (const option of [...select.options]) {
+      if (!option.selected && option.value !== "") {
+        option.remove();
+      }
+    }
+    const present = new Set([...select.options].map((option) => option.value));
+    for (const { id, text } of results) {
+      if (!present.has(String(id))) {
+        select.add(new Option(text, id));
+      }
+    }
+  };
+
+  let timer;
+  input.addEventListener("input", () => {
+    clearTimeout(timer);
+    timer = setTimeout(load, 250);
+  });
+  select.addEventListener("focus", load, { once: true });
+});
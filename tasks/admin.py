@@ -2,7 +2,8 @@ from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
 from django.utils.html import format_html
 
-from tasks.models import Category, CustomUser, Tag, Task, Report
+from tasks.models import (Category, CustomUser, Tag, Task, Report,
+                          OutboxEmail, PendingAssignment, StatCounter)
 
 
 @admin.register(Category)
@@ -58,3 +59,22 @@ class ReportAdmin(admin.ModelAdmin):
                     "task", "verified_by", "verified_at"]
     list_filter = ("author", "task", "created_at")
     search_fields = ("author",)
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    list_display = ["subject", "to_email", "status", "attempts",
+                    "available_at", "sent_at"]
+    list_filter = ("status",)
+    search_fields = ("to_email", "subject")
+
+
+@admin.register(PendingAssignment)
+class PendingAssignmentAdmin(admin.ModelAdmin):
+    list_display = ["recipient", "task", "created_at"]
+
+
+@admin.register(StatCounter)
+class StatCounterAdmin(admin.ModelAdmin):
+    list_display = ["key", "value"]
+    search_fields = ("key",)
@@ -0,0 +1,394 @@
+"""Performance scenarios run by ``manage.py benchmark``.
+
+Every scenario runs inside a transaction that is rolled back afterwards,
+so seeding data for a measurement never leaves anything behind.
+"""
+import os
+import random
+import string
+import tempfile
+import time
+import tracemalloc
+
+from django.contrib.auth.hashers import make_password
+from django.core import serializers
+from django.core.mail import EmailMultiAlternatives, send_mail
+from django.core.mail.backends.locmem import EmailBackend as LocmemBackend
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models import Count
+from django.test import RequestFactory
+from django.forms.models import model_to_dict
+from django.test.utils import override_settings
+
+from tasks.bulk import update_tasks
+from tasks.filters import (exists_all_tags, exists_any_tag, filter_by_tags,
+                           having_all_tags, in_any_tag)
+from tasks.models import Category, CustomUser, Report, Tag, Task
+from tasks.forms import TaskForm
+from tasks.loading import load_fixture
+from tasks.notifications import notify_task_assigned, send_email_messages
+from tasks.search import TRIGRAM_INDEXES, similar_names
+from tasks.seeding import seed_tasks
+from tasks.views import (ReportListView, TaskExportView, TaskListView,
+                         VolunteerListView)
+
+SCENARIOS = {}
+
+
+def random_name(rng, length=10):
+    return "".join(rng.choices(string.ascii_lowercase, k=length))
+
+
+def scenario(name):
+    def register(func):
+        SCENARIOS[name] = func
+        return func
+    return register
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def count_queries(func, *args, **kwargs):
+    """Return ``(result, queries executed, seconds)``."""
+    executed = 0
+
+    def counter(execute, sql, params, many, context):
+        nonlocal executed
+        executed += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(counter):
+        result, elapsed = timed(func, *args, **kwargs)
+    return result, executed, elapsed
+
+
+class ConnectionCountingBackend(LocmemBackend):
+    """Locmem backend that opens and closes connections like SMTP does.
+
+    ``opened`` counts real connection opens across instances and every open
+    sleeps ``handshake_delay`` seconds to stand in for the TLS handshake.
+    """
+    opened = 0
+    handshake_delay = 0.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.is_open = False
+
+    def open(self):
+        if self.is_open:
+            return False
+        time.sleep(self.handshake_delay)
+        self.is_open = True
+        type(self).opened += 1
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, messages):
+        new_connection = self.open()
+        try:
+            return super().send_messages(messages)
+        finally:
+            if new_connection:
+                self.close()
+
+
+@scenario("notifications")
+def bench_notifications(out, size=None, batch_size=None):
+    size = size or 100
+    backend = "tasks.benchmarks.ConnectionCountingBackend"
+    messages = [
+        EmailMultiAlternatives(f"Task {i}", "body", None,
+                               [f"volunteer{i}@example.com"])
+        for i in range(size)
+    ]
+
+    with override_settings(EMAIL_BACKEND=backend):
+        ConnectionCountingBackend.handshake_delay = 0.005
+        try:
+            ConnectionCountingBackend.opened = 0
+            _, elapsed = timed(lambda: [
+                send_mail(m.subject, m.body, None, m.to) for m in messages
+            ])
+            out.write(f"send_mail per message: "
+                      f"{ConnectionCountingBackend.opened} connections, "
+                      f"{elapsed * 1000:.1f} ms")
+
+            ConnectionCountingBackend.opened = 0
+            _, elapsed = timed(send_email_messages, messages, batch_size)
+            out.write(f"send_email_messages:   "
+                      f"{ConnectionCountingBackend.opened} connections, "
+                      f"{elapsed * 1000:.1f} ms")
+        finally:
+            ConnectionCountingBackend.handshake_delay = 0.0
+
+
+@scenario("trigram")
+def bench_trigram(out, size=None, batch_size=None):
+    size = size or 100_000
+    batch_size = batch_size or 5_000
+    rng = random.Random(0)
+    CustomUser.objects.bulk_create(
+        (CustomUser(username=f"{random_name(rng)}{i}", password="!",
+                    role="volunteer") for i in range(size)),
+        batch_size=batch_size,
+    )
+    Tag.objects.bulk_create(
+        (Tag(name=f"{random_name(rng)}{i}") for i in range(size)),
+        batch_size=batch_size,
+    )
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE tasks_customuser, tasks_tag")
+
+    users = CustomUser.objects.filter(role="volunteer")
+    terms = [random_name(rng, 4) for _ in range(20)]
+    queries = {
+        "username icontains": lambda term: list(
+            users.filter(username__icontains=term)[:6]),
+        "tag icontains": lambda term: list(
+            Tag.objects.filter(name__icontains=term)[:6]),
+        "did you mean": lambda term: similar_names(
+            users, "username", term + "x"),
+    }
+
+    def measure(label):
+        for name, query in queries.items():
+            _, elapsed = timed(lambda: [query(term) for term in terms])
+            out.write(f"{label:<16} {name:<20} "
+                      f"{elapsed / len(terms) * 1000:.2f} ms/query")
+
+    out.write(f"{size} volunteers and {size} tags, {len(terms)} terms")
+    if connection.vendor != "postgresql":
+        out.write("Trigram indexes need Postgres; measuring scans only.")
+        measure("scan")
+        return
+    measure("trigram index")
+    # DDL is transactional on Postgres: the rollback restores the indexes.
+    with connection.cursor() as cursor:
+        for name in TRIGRAM_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+    measure("sequential scan")
+
+
+@scenario("tags")
+def bench_tags(out, size=None, batch_size=None):
+    size = size or 20_000
+    seed_tasks(size, batch_size, tags_per_task=12)
+    tags = list(Tag.objects.annotate(n=Count("tasks")).order_by("-n"))
+    selections = {
+        "2 common tags": [tags[0], tags[1]],
+        "3 mixed tags": [tags[0], tags[10], tags[60]],
+        "2 rare tags": [tags[-2], tags[-1]],
+    }
+    tasks = Task.objects.all()
+
+    def joined_any(selected):
+        return tasks.filter(tags__in=selected).distinct()
+
+    def joined_all(selected):
+        queryset = tasks
+        for tag in selected:
+            queryset = queryset.filter(tags=tag)
+        return queryset
+
+    def ids(selected):
+        return [tag.pk for tag in selected]
+
+    variants = {
+        "any": {
+            "JOIN + DISTINCT": joined_any,
+            "EXISTS": lambda selected: exists_any_tag(tasks, ids(selected)),
+            "IN": lambda selected: in_any_tag(tasks, ids(selected)),
+            "filter_by_tags": lambda selected: filter_by_tags(
+                tasks, selected),
+        },
+        "all": {
+            "JOIN per tag": joined_all,
+            "EXISTS per tag": lambda selected: exists_all_tags(
+                tasks, ids(selected)),
+            "HAVING COUNT": lambda selected: having_all_tags(
+                tasks, ids(selected)),
+            "filter_by_tags": lambda selected: filter_by_tags(
+                tasks, selected, "all"),
+        },
+    }
+
+    out.write(f"{size} tasks with 12 tags each")
+    for label, selected in selections.items():
+        for match, builders in variants.items():
+            for name, build in builders.items():
+                queryset = build(selected).order_by("deadline", "pk")
+                _, first_page = timed(lambda: list(queryset[:6]))
+                total, counting = timed(queryset.count)
+                out.write(f"{label:<14} {match}: {name:<16} first page "
+                          f"{first_page * 1000:7.2f} ms, count {total:>6} "
+                          f"in {counting * 1000:7.2f} ms")
+
+
+def fetched_bytes(queryset):
+    """Size of the column values the database sends back for ``queryset``."""
+    sql, params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return sum(len(str(value).encode()) for row in cursor.fetchall()
+                   for value in row if value is not None)
+
+
+def allocations(queryset):
+    """Memory blocks and bytes still held after evaluating ``queryset``."""
+    queryset = queryset.all()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        rows = list(queryset)
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del rows
+    diff = after.compare_to(before, "filename")
+    return (sum(stat.count_diff for stat in diff),
+            sum(stat.size_diff for stat in diff))
+
+
+@scenario("projection")
+def bench_projection(out, size=None, batch_size=None):
+    size = size or 20_000
+    seed_tasks(size, batch_size)
+    # Seeded rows are minimal; give them the wide columns real data has.
+    coordinator = CustomUser.objects.create(
+        username="projection-coordinator", role="coordinator")
+    CustomUser.objects.update(password=make_password("password"))
+    Task.objects.update(description="Long description. " * 27,
+                        created_by=coordinator)
+    Report.objects.update(comment="Detailed report. " * 29)
+
+    page_size = 100
+    request = RequestFactory().get("/")
+    request.user = coordinator
+    out.write(f"{size} tasks, pages of {page_size} rows")
+    for view_class in (TaskListView, ReportListView, VolunteerListView):
+        view = view_class()
+        view.setup(request)
+        projected = view.get_queryset()[:page_size]
+        # defer(None) clears only(): every column, same joins and filters.
+        variants = {"all columns": projected.defer(None),
+                    "projected": projected}
+        for label, queryset in variants.items():
+            blocks, allocated = allocations(queryset)
+            out.write(f"{view_class.__name__:<18} {label:<12} "
+                      f"{fetched_bytes(queryset) / 1024:8.1f} KiB fetched, "
+                      f"{blocks:>6} blocks / {allocated / 1024:7.1f} KiB "
+                      f"allocated")
+
+
+@scenario("export")
+def bench_export(out, size=None, batch_size=None):
+    size = size or 20_000
+    seed_tasks(size, batch_size)
+    coordinator = CustomUser.objects.create(
+        username="export-coordinator", role="coordinator")
+    view = TaskExportView.as_view()
+    out.write(f"{size} tasks")
+    for label, params in (("one status", {"status": "active"}),
+                          ("all tasks", {}),
+                          ("all tasks gzip", {"gzip": "1"})):
+        request = RequestFactory().get("/", params)
+        request.user = coordinator
+        tracemalloc.start()
+        try:
+            response = view(request)
+            written, elapsed = timed(
+                lambda: sum(len(part) for part in response.streaming_content))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        out.write(f"{label:<16} {written / 1024:9.1f} KiB streamed in "
+                  f"{elapsed * 1000:7.1f} ms, peak {peak / 1024:8.1f} KiB")
+
+
+@scenario("bulk_update")
+def bench_bulk_update(out, size=None, batch_size=None):
+    size = size or 1_000
+    seeder = seed_tasks(size, batch_size)
+    target = CustomUser.objects.filter(
+        role="volunteer", username__startswith=seeder.prefix).first()
+    CustomUser.objects.filter(pk=target.pk).update(email="bench@example.com")
+    target.refresh_from_db()
+    task_ids = list(Task.objects.values_list("pk", flat=True)[:size])
+
+    def one_by_one(changes):
+        # What a TaskUpdateView round trip per task does.
+        for task in Task.objects.filter(pk__in=task_ids):
+            data = {**model_to_dict(task), **changes}
+            data["tags"] = [tag.pk for tag in data["tags"]]
+            form = TaskForm(data, instance=task)
+            if form.is_valid():
+                assigned_changed = "assigned_to" in form.changed_data
+                form.save()
+                if assigned_changed:
+                    notify_task_assigned(form.instance)
+
+    actions = {
+        "set status": ({"status": "completed"}, {"status": "completed"}),
+        "reassign": ({"assigned_to": target.pk}, {"assigned_to": target}),
+    }
+    out.write(f"{len(task_ids)} tasks")
+    for label, (form_changes, values) in actions.items():
+        variants = {
+            "per task": lambda: one_by_one(form_changes),
+            "bulk": lambda: update_tasks(task_ids, values),
+        }
+        for name, run in variants.items():
+            savepoint = transaction.savepoint()
+            _, queries, elapsed = count_queries(run)
+            out.write(f"{label:<11} {name:<9} {queries:>6} queries "
+                      f"{elapsed * 1000:9.1f} ms")
+            transaction.savepoint_rollback(savepoint)
+
+
+@scenario("fixtures")
+def bench_fixtures(out, size=None, batch_size=None):
+    size = size or 2_000
+    seed_tasks(size, batch_size)
+    models = [CustomUser, Category, Tag, Task, Report]
+    querysets = [model.objects.order_by("pk") for model in models]
+    querysets[models.index(Task)] = querysets[models.index(Task)] \
+        .prefetch_related("tags")
+
+    with tempfile.NamedTemporaryFile("w", suffix=".json",
+                                     encoding="utf-8") as fixture:
+        serializers.serialize(
+            "json", (obj for queryset in querysets for obj in queryset),
+            stream=fixture)
+        fixture.flush()
+        out.write(f"{size} tasks, "
+                  f"{os.path.getsize(fixture.name) / 1024:.0f} KiB fixture")
+
+        def bulk():
+            with open(fixture.name, encoding="utf-8") as stream:
+                load_fixture(stream, batch_size=batch_size or 2_000)
+
+        variants = {
+            "loaddata": lambda: call_command("loaddata", fixture.name,
+                                             verbosity=0),
+            "load_fixture": bulk,
+        }
+        for name, run in variants.items():
+            savepoint = transaction.savepoint()
+            # Load into empty tables; the savepoint brings the rows back.
+            with connection.cursor() as cursor:
+                for model in [Task.tags.through, *reversed(models)]:
+                    table = connection.ops.quote_name(model._meta.db_table)
+                    cursor.execute(f"DELETE FROM {table}")
+            _, queries, elapsed = count_queries(run)
+            out.write(f"{name:<13} {queries:>7} queries "
+                      f"{elapsed * 1000:9.1f} ms")
+            transaction.savepoint_rollback(savepoint)
@@ -0,0 +1,151 @@
+"""Create many tasks at once in a fixed number of queries.
+
+Rows are validated with a plain form, and every referenced category,
+volunteer and tag is looked up with one query per model. Tasks and
+their tag links are then written with ``bulk_create``. ``bulk_create``
+sends no signals, so the counters, cache versions, change log and
+notifications they would have updated are handled here in batches.
+"""
+from collections import Counter
+
+from django import forms
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.caching import bump_version
+from tasks.fields import IdListField
+from tasks.models import Category, CustomUser, Tag, Task
+from tasks.notifications import notify_tasks_assigned
+from tasks.stats import bump_counters, tag_key, task_counter_keys
+from tasks.sync import record_changes
+
+
+class BulkTaskForm(forms.Form):
+    title = forms.CharField(max_length=100)
+    description = forms.CharField(max_length=500, required=False)
+    status = forms.ChoiceField(choices=Task.STATUS_CHOICES, required=False)
+    deadline = forms.DateTimeField(required=False)
+    category = forms.IntegerField(required=False)
+    assigned_to = forms.IntegerField(required=False)
+    tags = IdListField(required=False)
+
+    def clean_status(self):
+        return self.cleaned_data["status"] or "active"
+
+
+def validate_tasks(rows) -> tuple[list, dict]:
+    """Return the cleaned rows and ``{index: {field: [messages]}}``."""
+    if not isinstance(rows, list) or not rows:
+        return [], {"tasks": ["Send a non-empty list of tasks."]}
+    if len(rows) > settings.BULK_CREATE_MAX_TASKS:
+        return [], {"tasks": [f"Send at most "
+                              f"{settings.BULK_CREATE_MAX_TASKS} tasks."]}
+
+    row_forms = [BulkTaskForm(row if isinstance(row, dict) else {})
+                 for row in rows]
+    cleaned = [form.cleaned_data if form.is_valid() else None
+               for form in row_forms]
+    valid = [data for data in cleaned if data]
+
+    def existing(queryset, field):
+        wanted = set()
+        for data in valid:
+            value = data[field]
+            wanted.update(value if isinstance(value, list)
+                          else [value] if value else [])
+        return queryset.in_bulk(wanted) if wanted else {}
+
+    references = {
+        "category": existing(Category.objects.only("pk"), "category"),
+        "assigned_to": existing(CustomUser.objects.filter(role="volunteer"),
+                                "assigned_to"),
+        "tags": existing(Tag.objects.only("pk"), "tags"),
+    }
+
+    errors = {}
+    for index, (form, data) in enumerate(zip(row_forms, cleaned)):
+        if data is None:
+            errors[index] = {field: list(messages)
+                             for field, messages in form.errors.items()}
+            continue
+        for field, found in references.items():
+            values = data[field] if field == "tags" else [data[field]]
+            missing = [pk for pk in values if pk and pk not in found]
+            if missing:
+                errors.setdefault(index, {})[field] = [
+                    f"Unknown id: {', '.join(map(str, missing))}."]
+            elif field != "tags":
+                data[field] = found.get(data[field])
+    return cleaned, errors
+
+
+@transaction.atomic
+def create_tasks(cleaned_rows, created_by=None) -> list:
+    """Insert validated rows; see ``validate_tasks``."""
+    tasks = Task.objects.bulk_create(
+        Task(title=data["title"], description=data["description"],
+             status=data["status"], deadline=data["deadline"],
+             category=data["category"], assigned_to=data["assigned_to"],
+             created_by=created_by)
+        for data in cleaned_rows
+    )
+    Task.tags.through.objects.bulk_create(
+        Task.tags.through(task_id=task.pk, tag_id=tag_id)
+        for task, data in zip(tasks, cleaned_rows)
+        for tag_id in data["tags"]
+    )
+
+    deltas = Counter()
+    for task, data in zip(tasks, cleaned_rows):
+        deltas.update(task_counter_keys(task.status, task.assigned_to_id))
+        deltas.update(tag_key(tag_id) for tag_id in data["tags"])
+    bump_counters(deltas)
+    record_changes("task", [(task.pk, task.assigned_to_id)
+                            for task in tasks])
+    notify_tasks_assigned(tasks)
+    bump_version("dashboard", "counts")
+    transaction.on_commit(lambda: bump_version("dashboard", "counts"))
+    return tasks
+
+
+@transaction.atomic
+def update_tasks(task_ids, values: dict) -> int:
+    """Set ``values`` on the given tasks with a single ``UPDATE``.
+
+    The previous status and assignee are read first, under a row lock,
+    to adjust the counters and the change log. Only volunteers who
+    actually gained a task are notified.
+    """
+    tasks = Task.objects.filter(pk__in=task_ids)
+    before = list(tasks.select_for_update()
+                  .values_list("pk", "status", "assigned_to_id"))
+    if not before:
+        return 0
+    tasks.update(**values, updated_at=timezone.now())
+
+    assignee = values.get("assigned_to")
+    assigned_to_id = assignee.pk if assignee else None
+    deltas = Counter()
+    changes = []
+    reassigned = []
+    for pk, status, old_assignee in before:
+        new_status = values.get("status", status)
+        new_assignee = (assigned_to_id if "assigned_to" in values
+                        else old_assignee)
+        deltas.subtract(task_counter_keys(status, old_assignee))
+        deltas.update(task_counter_keys(new_status, new_assignee))
+        changes.append((pk, new_assignee))
+        if new_assignee != old_assignee:
+            changes.append((pk, old_assignee))
+            if new_assignee:
+                reassigned.append(pk)
+    bump_counters(deltas)
+    record_changes("task", changes)
+    if reassigned:
+        notify_tasks_assigned(
+            Task.objects.filter(pk__in=reassigned)
+            .select_related("assigned_to").order_by("deadline", "pk"))
+    bump_version("dashboard", "counts")
+    transaction.on_commit(lambda: bump_version("dashboard", "counts"))
+    return len(before)
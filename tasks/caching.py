@@ -0,0 +1,61 @@
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+
+
+def version_key(namespace: str) -> str:
+    return f"tasks:version:{namespace}"
+
+
+def get_version(namespace: str) -> int:
+    version = cache.get(version_key(namespace))
+    if version is None:
+        # Start from the clock so a lost version never revives old entries.
+        cache.add(version_key(namespace), time.time_ns(), None)
+        version = cache.get(version_key(namespace), 0)
+    return version
+
+
+def bump_version(*namespaces: str) -> None:
+    for namespace in namespaces:
+        try:
+            cache.incr(version_key(namespace))
+        except ValueError:
+            cache.set(version_key(namespace), time.time_ns(), None)
+
+
+def get_or_compute(namespace: str, name: str, compute, timeout: int = None):
+    """Return the cached value of ``compute()`` for the current version.
+
+    Only the caller that wins the lock recomputes after an invalidation.
+    The others get the previous value while it is being rebuilt, or wait
+    briefly for the new one when there is nothing to fall back on.
+    """
+    timeout = timeout or settings.DASHBOARD_CACHE_TIMEOUT
+    key = f"tasks:{namespace}:{name}:{get_version(namespace)}"
+    latest_key = f"tasks:{namespace}:{name}:latest"
+
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f"{key}:lock"
+    if cache.add(lock_key, True, settings.CACHE_LOCK_TIMEOUT):
+        try:
+            value = compute()
+            cache.set_many({key: value, latest_key: value}, timeout)
+        finally:
+            cache.delete(lock_key)
+        return value
+
+    value = cache.get(latest_key)
+    if value is not None:
+        return value
+    deadline = time.monotonic() + settings.CACHE_LOCK_TIMEOUT
+    while time.monotonic() < deadline:
+        time.sleep(0.05)
+        value = cache.get(key)
+        if value is not None:
+            return value
+    return compute()
@@ -0,0 +1,75 @@
+import hashlib
+
+from django import forms
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator, ModelChoiceIteratorValue
+
+from tasks.caching import get_or_compute
+
+
+class CachedModelChoiceIterator(ModelChoiceIterator):
+    """Yield ``(pk, label)`` pairs from the cache instead of the queryset.
+
+    The pairs are cached under the "choices" version namespace, which is
+    bumped whenever a model used for choices is written, and keyed by the
+    queryset's SQL so differently filtered fields never share an entry.
+    """
+
+    def cached_choices(self):
+        queryset = self.queryset
+        digest = hashlib.md5(str(queryset.query).encode(),
+                             usedforsecurity=False).hexdigest()
+        return get_or_compute(
+            "choices", f"{queryset.model._meta.label_lower}:{digest}",
+            lambda: [(obj.pk, self.field.label_from_instance(obj))
+                     for obj in queryset],
+            timeout=settings.CHOICES_CACHE_TIMEOUT,
+        )
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ("", self.field.empty_label)
+        for pk, label in self.cached_choices():
+            yield (ModelChoiceIteratorValue(pk, None),
+                   self.field.label_from_choice(pk, label))
+
+    def __len__(self):
+        return (len(self.cached_choices())
+                + (1 if self.field.empty_label is not None else 0))
+
+    def __bool__(self):
+        return self.field.empty_label is not None or bool(
+            self.cached_choices())
+
+
+class CachedChoicesMixin:
+    iterator = CachedModelChoiceIterator
+
+    def label_from_choice(self, pk, label):
+        """The option label shown for a cached ``(pk, label)`` pair."""
+        return label
+
+
+class CachedModelChoiceField(CachedChoicesMixin, forms.ModelChoiceField):
+    pass
+
+
+class CachedModelMultipleChoiceField(CachedChoicesMixin,
+                                     forms.ModelMultipleChoiceField):
+    pass
+
+
+class IdListField(forms.Field):
+    """A list of primary keys, from a JSON list or repeated parameters."""
+    widget = forms.SelectMultiple
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return []
+        if not isinstance(value, (list, tuple)):
+            raise ValidationError("Enter a list of ids.", code="invalid")
+        try:
+            return sorted({int(pk) for pk in value})
+        except (TypeError, ValueError):
+            raise ValidationError("Enter a list of ids.", code="invalid")
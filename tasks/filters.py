@@ -0,0 +1,147 @@
+import hashlib
+import json
+from datetime import datetime, time, timedelta
+
+from django.db.models import Count, Exists, OuterRef, Q
+from django.utils import timezone
+
+from tasks.models import Task
+from tasks.search import search_tasks
+from tasks.stats import read_counters, tag_key
+
+# Tags on at most this share of all tasks are looked up from the through
+# table; more common ones are checked row by row in list order.
+SELECTIVE_TAG_FRACTION = 0.05
+
+
+def date_range_q(field: str, start=None, end=None) -> Q:
+    """Match ``field`` between the dates ``start`` and ``end``, inclusive.
+
+    Compares the raw column against the half-open range
+    ``[start 00:00, end + 1 day 00:00)`` in the current timezone, where
+    ``field__date`` would cast every row and rule out its index.
+    """
+    condition = Q()
+    if start:
+        condition &= Q(**{f"{field}__gte": start_of_day(start)})
+    if end:
+        condition &= Q(**{f"{field}__lt":
+                          start_of_day(end + timedelta(days=1))})
+    return condition
+
+
+def start_of_day(day):
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def filter_by_tags(queryset, tags, match: str = "any"):
+    """Tasks carrying any (or all) of ``tags``, each task exactly once.
+
+    None of the strategies joins the tags into the outer query, so no
+    ``distinct()`` is needed and pagination sees one row per task. The tag
+    counters pick the strategy: when the tags are on few tasks, the
+    through table drives the query (``IN`` or ``HAVING COUNT``);
+    otherwise the list order drives it and correlated ``EXISTS`` checks
+    stop as soon as a page is full.
+    """
+    tag_ids = sorted({tag.pk for tag in tags})
+    counters = read_counters("tasks", *(tag_key(tag_id) for tag_id in tag_ids))
+    limit = counters.pop("tasks") * SELECTIVE_TAG_FRACTION
+    if match == "all":
+        if min(counters.values()) <= limit:
+            return having_all_tags(queryset, tag_ids)
+        return exists_all_tags(queryset, tag_ids)
+    if sum(counters.values()) <= limit:
+        return in_any_tag(queryset, tag_ids)
+    return exists_any_tag(queryset, tag_ids)
+
+
+def exists_any_tag(queryset, tag_ids):
+    return queryset.filter(Exists(Task.tags.through.objects.filter(
+        task_id=OuterRef("pk"), tag_id__in=tag_ids)))
+
+
+def in_any_tag(queryset, tag_ids):
+    return queryset.filter(pk__in=Task.tags.through.objects
+                           .filter(tag_id__in=tag_ids).values("task_id"))
+
+
+def exists_all_tags(queryset, tag_ids):
+    for tag_id in tag_ids:
+        queryset = queryset.filter(Exists(Task.tags.through.objects.filter(
+            task_id=OuterRef("pk"), tag_id=tag_id)))
+    return queryset
+
+
+def having_all_tags(queryset, tag_ids):
+    tasks_with_all = (Task.tags.through.objects
+                      .filter(tag_id__in=tag_ids)
+                      .values("task_id")
+                      .annotate(matched=Count("tag_id"))
+                      .filter(matched=len(tag_ids))
+                      .values("task_id"))
+    return queryset.filter(pk__in=tasks_with_all)
+
+
+def apply_task_filters(queryset, filters: dict, exclude: str = None,
+                       ranked: bool = True):
+    """Apply the cleaned ``TaskSearchForm`` data in ``filters``.
+
+    ``exclude`` names one filter to leave out, so facet counts for that
+    dimension can be computed given all the other filters.
+    """
+    title = filters.get("title")
+    if title:
+        queryset = search_tasks(queryset, title, ranked=ranked)
+    if filters.get("status") and exclude != "status":
+        queryset = queryset.filter(status=filters["status"])
+    if filters.get("category") and exclude != "category":
+        queryset = queryset.filter(category=filters["category"])
+    if filters.get("tags") and exclude != "tags":
+        queryset = filter_by_tags(queryset, filters["tags"],
+                                  filters.get("tag_match") or "any")
+    if filters.get("volunteer") and exclude != "volunteer":
+        queryset = queryset.filter(assigned_to=filters["volunteer"])
+    return queryset
+
+
+def task_facets(queryset, filters: dict) -> dict:
+    """Task counts per option of every filter, given the other filters.
+
+    One grouped query per dimension; the keys are status values and
+    category, tag and volunteer ids (``None`` for tasks without one).
+    """
+    def grouped(dimension, field):
+        return dict(
+            apply_task_filters(queryset, filters, exclude=dimension,
+                               ranked=False)
+            .order_by()
+            .values_list(field)
+            .annotate(count=Count("pk"))
+        )
+
+    tagged = apply_task_filters(queryset, filters, exclude="tags",
+                                ranked=False).order_by().values("pk")
+    return {
+        "status": grouped("status", "status"),
+        "category": grouped("category", "category"),
+        "volunteer": grouped("volunteer", "assigned_to"),
+        "tags": dict(Task.tags.through.objects
+                     .filter(task_id__in=tagged)
+                     .order_by()
+                     .values_list("tag_id")
+                     .annotate(count=Count("task_id"))),
+    }
+
+
+def filters_digest(filters: dict) -> str:
+    """A stable cache name for a combination of cleaned filter values."""
+    normalized = {}
+    for name, value in filters.items():
+        if hasattr(value, "pk"):
+            value = value.pk
+        elif hasattr(value, "__iter__") and not isinstance(value, str):
+            value = sorted(item.pk for item in value)
+        normalized[name] = value
+    payload = json.dumps(normalized, sort_keys=True, default=str)
+    return hashlib.md5(payload.encode(), usedforsecurity=False).hexdigest()
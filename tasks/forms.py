@@ -1,7 +1,10 @@
 from django import forms
 from django.contrib.auth.forms import UserCreationForm, UserChangeForm
 
+from tasks.fields import (CachedModelChoiceField,
+                          CachedModelMultipleChoiceField, IdListField)
 from tasks.models import Category, CustomUser, Task, Tag, Report
+from tasks.widgets import AutocompleteSelect, AutocompleteSelectMultiple
 
 
 class CategoryForm(forms.ModelForm):
@@ -56,10 +59,22 @@ class TaskForm(forms.ModelForm):
     class Meta:
         model = Task
         fields = "__all__"
+        field_classes = {
+            "category": CachedModelChoiceField,
+            "assigned_to": CachedModelChoiceField,
+            "created_by": CachedModelChoiceField,
+            "tags": CachedModelMultipleChoiceField,
+        }
         widgets = {
             "deadline": forms.DateTimeInput(attrs={
                 "type": "datetime-local",
-            })
+            }),
+            "category": AutocompleteSelect("tasks:autocomplete-categories"),
+            "assigned_to": AutocompleteSelect(
+                "tasks:autocomplete-volunteers"),
+            "created_by": AutocompleteSelect(
+                "tasks:autocomplete-coordinators"),
+            "tags": AutocompleteSelectMultiple("tasks:autocomplete-tags"),
         }
 
     def __init__(self, *args, **kwargs):
@@ -77,7 +92,7 @@ class TaskSearchForm(forms.Form):
         label="",
         widget=forms.TextInput(
             attrs={
-                "placeholder": "Search by title",
+                "placeholder": "Search title and description",
             }
         )
     )
@@ -89,23 +104,95 @@ class TaskSearchForm(forms.Form):
         required=False,
         label="Status",
     )
-    category = forms.ModelChoiceField(
+    category = CachedModelChoiceField(
         queryset=Category.objects.all(),
         required=False,
         empty_label="All categories",
         label="Category",
     )
-    tags = forms.ModelChoiceField(
+    tags = CachedModelMultipleChoiceField(
         queryset=Tag.objects.all(),
         required=False,
-        empty_label="All tags",
         label="Tags",
     )
-    volunteer = forms.ModelChoiceField(
+    tag_match = forms.ChoiceField(
+        choices=[("any", "Any selected tag"), ("all", "All selected tags")],
+        required=False,
+        label="Match",
+    )
+    volunteer = CachedModelChoiceField(
         queryset=CustomUser.objects.filter(role="volunteer"),
         required=False,
         empty_label="All volunteers",
         label="Volunteers",
+        widget=AutocompleteSelect("tasks:autocomplete-volunteers"),
+    )
+
+    def show_counts(self, facets: dict):
+        """Append the matching task count to every filter option."""
+        status_counts = facets["status"]
+        self.fields["status"].choices = [
+            (value, f"{label} ({status_counts.get(value, 0)})"
+             if value else label)
+            for value, label in self.fields["status"].choices
+        ]
+        for name in ("category", "tags", "volunteer"):
+            self.fields[name].label_from_choice = (
+                lambda pk, label, counts=facets[name]:
+                f"{label} ({counts.get(pk, 0)})"
+            )
+
+
+class BulkActionForm(forms.Form):
+    """Set one field on the tasks selected in the task list."""
+    ACTION_FIELDS = {
+        "status": "status",
+        "assign": "assigned_to",
+        "deadline": "deadline",
+    }
+
+    tasks = IdListField()
+    action = forms.ChoiceField(
+        choices=[("status", "Set status"), ("assign", "Reassign"),
+                 ("deadline", "Set deadline")],
+        label="Action",
+    )
+    status = forms.ChoiceField(
+        choices=[("", "Status")] + list(Task.STATUS_CHOICES),
+        required=False,
+        label="Status",
+    )
+    assigned_to = CachedModelChoiceField(
+        queryset=CustomUser.objects.filter(role="volunteer"),
+        required=False,
+        empty_label="Unassigned",
+        label="Volunteer",
+        widget=AutocompleteSelect("tasks:autocomplete-volunteers"),
+    )
+    deadline = forms.DateTimeField(
+        required=False,
+        label="Deadline",
+        widget=forms.DateTimeInput(attrs={"type": "datetime-local"}),
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        field = self.ACTION_FIELDS.get(cleaned_data.get("action"))
+        # Reassigning to nobody is allowed; the other actions need a value.
+        if field in ("status", "deadline") and not cleaned_data.get(field):
+            self.add_error(field, "This field is required.")
+        return cleaned_data
+
+    def values(self) -> dict:
+        field = self.ACTION_FIELDS[self.cleaned_data["action"]]
+        return {field: self.cleaned_data[field]}
+
+
+class TaskImportForm(forms.Form):
+    file = forms.FileField(
+        label="CSV file",
+        help_text="Columns: title, description, status, deadline, "
+                  "category, assigned_to, tags (separated by ;).",
     )
 
 
@@ -168,11 +255,12 @@ class ReportSearchForm(forms.Form):
             }
         )
     )
-    author_filter = forms.ModelChoiceField(
+    author_filter = CachedModelChoiceField(
         queryset=CustomUser.objects.filter(role="volunteer"),
         required=False,
         empty_label="All authors",
         label="Author",
+        widget=AutocompleteSelect("tasks:autocomplete-volunteers"),
     )
     created_filter = forms.DateField(
         required=False,
@@ -183,3 +271,34 @@ class ReportSearchForm(forms.Form):
             }
         )
     )
+    created_from = forms.DateField(
+        required=False,
+        label="Created from",
+        widget=forms.DateInput(
+            attrs={
+                "type": "date",
+            }
+        )
+    )
+    created_to = forms.DateField(
+        required=False,
+        label="Created to",
+        widget=forms.DateInput(
+            attrs={
+                "type": "date",
+            }
+        )
+    )
+    unverified = forms.BooleanField(
+        required=False,
+        label="Unverified only",
+    )
+
+    def clean(self):
+        cleaned_data = super().clean()
+        created_from = cleaned_data.get("created_from")
+        created_to = cleaned_data.get("created_to")
+        if created_from and created_to and created_from > created_to:
+            raise forms.ValidationError(
+                "The start date must not be after the end date.")
+        return cleaned_data
@@ -0,0 +1,124 @@
+"""Streaming CSV import of tasks.
+
+The file is read one row at a time. Category, tag and volunteer names
+are resolved through dicts loaded once per import. Valid rows are
+written in ``bulk_create`` batches, each in its own transaction, so a
+bad row or a failed batch never throws away the rest of the file. The
+columns match the CSV export: ``title``, ``description``, ``status``,
+``deadline``, ``category``, ``assigned_to`` (a username) and ``tags``
+(separated by ``;``). Other columns are ignored.
+"""
+import csv
+from dataclasses import dataclass, field
+
+from django.conf import settings
+from django.db import DatabaseError
+
+from tasks.bulk import BulkTaskForm, create_tasks
+from tasks.models import Category, CustomUser, Tag
+
+AMBIGUOUS = object()
+
+
+@dataclass
+class ImportResult:
+    created: int = 0
+    # (spreadsheet row number, {column: [messages]})
+    errors: list = field(default_factory=list)
+
+
+def name_lookup(objects, attribute):
+    """``{lowercased name: object}``; names used twice map to AMBIGUOUS."""
+    lookup = {}
+    for obj in objects:
+        name = getattr(obj, attribute).strip().lower()
+        lookup[name] = AMBIGUOUS if name in lookup else obj
+    return lookup
+
+
+class RowResolver:
+    """Turn a CSV row into the input of ``create_tasks``."""
+
+    def __init__(self):
+        self.lookups = {
+            "category": name_lookup(Category.objects.only("pk", "name"),
+                                    "name"),
+            "assigned_to": name_lookup(
+                CustomUser.objects.filter(role="volunteer"), "username"),
+            "tags": name_lookup(Tag.objects.all(), "name"),
+        }
+
+    def find(self, column, name, errors):
+        obj = self.lookups[column].get(name.strip().lower())
+        if obj is None:
+            errors.setdefault(column, []).append(f"Unknown name: {name}.")
+        elif obj is AMBIGUOUS:
+            errors.setdefault(column, []).append(f"Ambiguous name: {name}.")
+        else:
+            return obj
+        return None
+
+    def resolve(self, row):
+        """Return ``(cleaned data, errors)`` for one row."""
+        errors = {}
+        references = {}
+        for column in ("category", "assigned_to"):
+            name = (row.get(column) or "").strip()
+            references[column] = (self.find(column, name, errors)
+                                  if name else None)
+        tags = [self.find("tags", name, errors)
+                for name in (row.get("tags") or "").split(";")
+                if name.strip()]
+
+        form = BulkTaskForm({
+            "title": (row.get("title") or "").strip(),
+            "description": row.get("description") or "",
+            "status": (row.get("status") or "").strip(),
+            "deadline": (row.get("deadline") or "").strip(),
+        })
+        if not form.is_valid():
+            errors.update({column: list(messages)
+                           for column, messages in form.errors.items()})
+        if errors:
+            return None, errors
+        data = form.cleaned_data
+        data.update(references,
+                    tags=sorted({tag.pk for tag in tags}))
+        return data, {}
+
+
+def import_tasks(lines, created_by=None, batch_size=None) -> ImportResult:
+    """Import tasks from an iterable of CSV text lines, e.g. an open file."""
+    batch_size = batch_size or settings.IMPORT_BATCH_SIZE
+    result = ImportResult()
+    resolver = RowResolver()
+    batch, batch_rows = [], []
+
+    def flush():
+        try:
+            result.created += len(create_tasks(batch, created_by))
+        except DatabaseError as exc:
+            result.errors.extend((number, {"__all__": [str(exc)]})
+                                 for number in batch_rows)
+        batch.clear()
+        batch_rows.clear()
+
+    # Row 1 is the header, as in a spreadsheet.
+    number = 1
+    rows = csv.DictReader(lines)
+    try:
+        for number, row in enumerate(rows, start=2):
+            data, errors = resolver.resolve(row)
+            if errors:
+                result.errors.append((number, errors))
+                continue
+            batch.append(data)
+            batch_rows.append(number)
+            if len(batch) >= batch_size:
+                flush()
+    except (csv.Error, UnicodeDecodeError) as exc:
+        result.errors.append((number + 1, {
+            "__all__": [f"Stopped reading the file: {exc}"]}))
+    if batch:
+        flush()
+    return result
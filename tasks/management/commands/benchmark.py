@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from tasks.benchmarks import SCENARIOS
+
+
+class Command(BaseCommand):
+    help = "Run a performance scenario and print its measurements."
+
+    def add_arguments(self, parser):
+        parser.add_argument("scenario", choices=sorted(SCENARIOS))
+        parser.add_argument(
+            "--size", type=int, default=None,
+            help="Number of rows or messages the scenario works with.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=None,
+            help="Batch size for scenarios that compare batching.",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            SCENARIOS[options["scenario"]](
+                self.stdout,
+                size=options["size"],
+                batch_size=options["batch_size"],
+            )
+            transaction.set_rollback(True)
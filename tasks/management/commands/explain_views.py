@@ -0,0 +1,122 @@
+import re
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import RequestFactory
+
+from tasks.models import CustomUser, Tag
+from tasks.pagination import CountlessPaginator, KeysetPaginator
+from tasks.seeding import seed_tasks
+from tasks.views import ReportListView, TaskListView, VolunteerListView
+
+# (label, view, role of the requesting user, query string); None values
+# are filled in from the data, see Command.explain_all().
+ACCESS_PATHS = [
+    ("tasks", TaskListView, "coordinator", {}),
+    ("tasks of a volunteer", TaskListView, "volunteer", {}),
+    ("tasks by status", TaskListView, "coordinator", {"status": "active"}),
+    ("tasks by assignee", TaskListView, "coordinator", {"volunteer": None}),
+    ("tasks by any tag", TaskListView, "coordinator", {"tags": None}),
+    ("tasks by all tags", TaskListView, "coordinator",
+     {"tags": None, "tag_match": "all"}),
+    ("reports", ReportListView, "coordinator", {}),
+    ("reports of a volunteer", ReportListView, "volunteer", {}),
+    ("unverified reports", ReportListView, "coordinator",
+     {"unverified": "on"}),
+    ("reports by date", ReportListView, "coordinator",
+     {"created_from": "2025-01-01", "created_to": "2025-01-31"}),
+    ("volunteers", VolunteerListView, "coordinator", {}),
+]
+
+SEQUENTIAL_SCAN = {
+    "postgresql": r"Seq Scan on (\w+)",
+    "sqlite": r"\bSCAN (\w+)\s*$",
+}
+
+
+def page_querysets(view, queryset):
+    """The first and second page queries the view would run."""
+    cursor_key = view.get_cursor_key() \
+        if hasattr(view, "get_cursor_key") else None
+    if cursor_key is None:
+        paginator = CountlessPaginator(queryset, view.paginate_by)
+        yield "page 1", paginator.page_queryset(1)
+        yield "page 2", paginator.page_queryset(2)
+        return
+    paginator = KeysetPaginator(queryset, view.paginate_by, cursor_key,
+                                view.cursor_descending)
+    first = paginator.page_queryset()
+    yield "first page", first
+    rows = list(first)
+    if len(rows) > paginator.per_page:
+        last = rows[paginator.per_page - 1]
+        yield "next page", paginator.page_queryset(
+            "next", getattr(last, cursor_key), last.pk)
+
+
+class Command(BaseCommand):
+    help = ("EXPLAIN the page queries of the list views and fail when one "
+            "falls back to a sequential scan of its table.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed", type=int, default=0,
+            help="Seed this many tasks first, inside a transaction that is "
+                 "rolled back afterwards.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=None,
+            help="Insert batch size used when seeding.",
+        )
+
+    def handle(self, *args, **options):
+        pattern = SEQUENTIAL_SCAN.get(connection.vendor)
+        if pattern is None:
+            raise CommandError(f"Unsupported database: {connection.vendor}")
+
+        with transaction.atomic():
+            if options["seed"]:
+                seed_tasks(options["seed"], options["batch_size"])
+            failures = self.explain_all(re.compile(pattern, re.MULTILINE),
+                                        options["verbosity"])
+            transaction.set_rollback(True)
+
+        if failures:
+            raise CommandError(
+                f"{len(failures)} quer(ies) scan their whole table: "
+                + ", ".join(failures))
+        self.stdout.write("Every list view query uses an index.")
+
+    def explain_all(self, pattern, verbosity):
+        factory = RequestFactory()
+        users = {
+            role: (CustomUser.objects.filter(role=role).first()
+                   or CustomUser(pk=0, role=role))
+            for role in ("coordinator", "volunteer")
+        }
+        sample_values = {
+            "volunteer": users["volunteer"].pk,
+            "tags": list(Tag.objects.values_list("pk", flat=True)[:2]),
+        }
+        failures = []
+        for label, view_class, role, params in ACCESS_PATHS:
+            params = {key: sample_values[key] if value is None else value
+                      for key, value in params.items()}
+            request = factory.get("/", params)
+            request.user = users[role]
+            view = view_class()
+            view.setup(request)
+            queryset = view.get_queryset()
+            table = queryset.model._meta.db_table
+
+            for page, page_queryset in page_querysets(view, queryset):
+                plan = page_queryset.explain()
+                scanned = [name for name in pattern.findall(plan)
+                           if name == table]
+                status = "SEQ SCAN" if scanned else "ok"
+                self.stdout.write(f"{label} ({page}): {status}")
+                if verbosity > 1 or scanned:
+                    self.stdout.write(plan)
+                if scanned:
+                    failures.append(f"{label} ({page})")
+        return failures
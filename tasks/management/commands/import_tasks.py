@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.imports import import_tasks
+from tasks.models import CustomUser
+
+
+def format_errors(errors) -> str:
+    return "; ".join(
+        " ".join(messages) if column == "__all__"
+        else f"{column}: {' '.join(messages)}"
+        for column, messages in errors.items())
+
+
+class Command(BaseCommand):
+    help = ("Import tasks from a CSV file in batches. Rows that fail "
+            "validation are reported and skipped.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV file with a header row.")
+        parser.add_argument(
+            "--batch-size", type=int, default=None,
+            help="Tasks inserted per transaction.",
+        )
+        parser.add_argument(
+            "--created-by", default=None,
+            help="Username of the coordinator recorded as the creator.",
+        )
+
+    def handle(self, *args, **options):
+        created_by = None
+        if options["created_by"]:
+            created_by = CustomUser.objects.filter(
+                username=options["created_by"], role="coordinator").first()
+            if created_by is None:
+                raise CommandError(
+                    f"No coordinator named {options['created_by']}.")
+
+        try:
+            with open(options["path"], newline="",
+                      encoding="utf-8-sig") as lines:
+                result = import_tasks(lines, created_by,
+                                      options["batch_size"])
+        except OSError as exc:
+            raise CommandError(exc)
+
+        for number, errors in result.errors:
+            self.stderr.write(f"Row {number}: {format_errors(errors)}")
+        self.stdout.write(f"Imported {result.created} task(s), "
+                          f"rejected {len(result.errors)} row(s).")
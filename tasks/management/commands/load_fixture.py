@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.base import DeserializationError
+from django.db import DEFAULT_DB_ALIAS
+
+from tasks.loading import load_fixture
+
+
+class Command(BaseCommand):
+    help = ("Load a JSON fixture such as fixtures/data.json with batched "
+            "inserts. Much faster than loaddata on large files; no model "
+            "signals are sent.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Fixture file in Django's JSON "
+                                         "serialization format.")
+        parser.add_argument(
+            "--batch-size", type=int, default=2_000,
+            help="Objects inserted per query.",
+        )
+        parser.add_argument(
+            "--database", default=DEFAULT_DB_ALIAS,
+            help="Database to load the fixture into.",
+        )
+        parser.add_argument(
+            "--ignorenonexistent", "-i", action="store_true",
+            help="Ignore fields in the fixture that the models do not have.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            with open(options["path"], encoding="utf-8") as stream:
+                loaded = load_fixture(
+                    stream, using=options["database"],
+                    batch_size=options["batch_size"],
+                    ignorenonexistent=options["ignorenonexistent"])
+        except OSError as exc:
+            raise CommandError(exc)
+        except (DeserializationError, ValueError) as exc:
+            raise CommandError(f"Could not load {options['path']}: {exc}")
+
+        for label, count in sorted(loaded.items()):
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(f"Loaded {sum(loaded.values())} object(s).")
@@ -0,0 +1,42 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from tasks.notifications import deliver_outbox, flush_assignment_digests
+
+
+class Command(BaseCommand):
+    help = ("Flush due assignment digests and deliver queued notification "
+            "emails from the outbox.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=None,
+            help="Emails per batch (defaults to EMAIL_OUTBOX_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--loop", action="store_true",
+            help="Keep polling the outbox instead of exiting when it is "
+                 "empty.",
+        )
+        parser.add_argument(
+            "--interval", type=float, default=5.0,
+            help="Seconds to sleep between polls in --loop mode.",
+        )
+
+    def handle(self, *args, **options):
+        total_sent = total_failed = 0
+        while True:
+            flush_assignment_digests()
+            sent, failed = deliver_outbox(options["batch_size"])
+            total_sent += sent
+            total_failed += failed
+            if sent or failed:
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+
+        self.stdout.write(
+            f"Sent {total_sent} email(s), {total_failed} failed attempt(s)."
+        )
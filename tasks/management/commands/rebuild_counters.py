@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from tasks.stats import rebuild_counters, verify_counters
+
+
+class Command(BaseCommand):
+    help = ("Rebuild the statistics counters from the tables and verify "
+            "them against a fresh count.")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check", action="store_true",
+            help="Only verify the stored counters, do not rebuild them.",
+        )
+
+    def handle(self, *args, **options):
+        if not options["check"]:
+            rebuilt = rebuild_counters()
+            self.stdout.write(f"Rebuilt {rebuilt} counter(s).")
+
+        mismatches = verify_counters()
+        for key, stored, expected in mismatches:
+            self.stderr.write(f"{key}: stored {stored}, expected {expected}")
+        if mismatches:
+            raise CommandError(f"{len(mismatches)} counter(s) out of date.")
+        self.stdout.write("Counters match the tables.")
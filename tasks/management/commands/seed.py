@@ -0,0 +1,58 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from tasks.models import CustomUser
+from tasks.seeding import Seeder
+
+
+class Command(BaseCommand):
+    help = ("Generate a large synthetic dataset for load testing. The same "
+            "--seed always produces the same rows.")
+
+    def add_arguments(self, parser):
+        volumes = (("coordinators", 5), ("volunteers", 1_000),
+                   ("categories", 20), ("tags", 100), ("tasks", 10_000),
+                   ("reports", 20_000))
+        for name, default in volumes:
+            parser.add_argument(
+                f"--{name}", type=int, default=default,
+                help=f"Number of {name} to create (default {default}).",
+            )
+        parser.add_argument(
+            "--seed", type=int, default=0,
+            help="Random seed; also part of the generated usernames.",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=5_000,
+            help="Rows generated and inserted per query.",
+        )
+        parser.add_argument(
+            "--password", default="volunteer",
+            help="Password of every generated user.",
+        )
+
+    def handle(self, *args, **options):
+        seeder = Seeder(
+            seed=options["seed"], batch_size=options["batch_size"],
+            password=options["password"],
+            progress=(self.stdout.write if options["verbosity"] > 1
+                      else None),
+        )
+        if CustomUser.objects.filter(
+                username__startswith=seeder.prefix).exists():
+            raise CommandError(
+                f"Seed {options['seed']} has already been loaded; pick "
+                f"another --seed.")
+
+        start = time.perf_counter()
+        with transaction.atomic():
+            created = seeder.run(
+                options["coordinators"], options["volunteers"],
+                options["categories"], options["tags"], options["tasks"],
+                options["reports"])
+        for label, count in sorted(created.items()):
+            self.stdout.write(f"{label}: {count}")
+        self.stdout.write(f"Seeded {sum(created.values())} row(s) in "
+                          f"{time.perf_counter() - start:.1f} s.")
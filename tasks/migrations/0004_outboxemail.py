@@ -0,0 +1,100 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:42
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0003_report_created_at_report_updated_at_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="customuser",
+            options={"ordering": ("username",)},
+        ),
+        migrations.AlterModelOptions(
+            name="report",
+            options={"ordering": ("-created_at",)},
+        ),
+        migrations.AlterModelOptions(
+            name="task",
+            options={"ordering": ("deadline",)},
+        ),
+        migrations.AlterField(
+            model_name="customuser",
+            name="phone_number",
+            field=models.CharField(blank=True, max_length=25, null=True, unique=True),
+        ),
+        migrations.AlterField(
+            model_name="report",
+            name="task",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="reports_task",
+                to="tasks.task",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="report",
+            name="verified_by",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="reports_verified_by",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.CreateModel(
+            name="OutboxEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("to_email", models.EmailField(max_length=254)),
+                ("subject", models.CharField(max_length=255)),
+                ("body", models.TextField()),
+                ("html_body", models.TextField(blank=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("sent", "Sent"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=20,
+                    ),
+                ),
+                ("attempts", models.PositiveIntegerField(default=0)),
+                ("last_error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "available_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ("available_at", "id"),
+                "indexes": [
+                    models.Index(
+                        fields=["status", "available_at"],
+                        name="outbox_status_available_idx",
+                    )
+                ],
+            },
+        ),
+    ]
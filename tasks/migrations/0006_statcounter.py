@@ -0,0 +1,78 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:46
+
+from collections import Counter
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def build_counters(apps, schema_editor):
+    # A frozen copy of tasks.stats.compute_counters as of this migration.
+    CustomUser = apps.get_model("tasks", "CustomUser")
+    Task = apps.get_model("tasks", "Task")
+    Category = apps.get_model("tasks", "Category")
+    Report = apps.get_model("tasks", "Report")
+    StatCounter = apps.get_model("tasks", "StatCounter")
+
+    counters = Counter({
+        "volunteers": CustomUser.objects.filter(role="volunteer").count(),
+        "tasks": Task.objects.count(),
+        "categories": Category.objects.count(),
+        "reports": Report.objects.count(),
+    })
+    task_groups = (Task.objects.order_by()
+                   .values_list("status", "assigned_to")
+                   .annotate(count=Count("id")))
+    for status, assigned_to_id, count in task_groups:
+        counters[f"tasks:status:{status}"] += count
+        if assigned_to_id:
+            counters[f"volunteer:{assigned_to_id}:tasks"] += count
+            counters[f"volunteer:{assigned_to_id}:tasks:status:{status}"] \
+                += count
+    report_groups = (Report.objects.order_by()
+                     .filter(author__isnull=False)
+                     .values_list("author")
+                     .annotate(count=Count("id")))
+    for author_id, count in report_groups:
+        counters[f"volunteer:{author_id}:reports"] += count
+    tag_groups = (Task.tags.through.objects.order_by()
+                  .values_list("tag")
+                  .annotate(count=Count("id")))
+    for tag_id, count in tag_groups:
+        counters[f"tag:{tag_id}:tasks"] += count
+
+    StatCounter.objects.all().delete()
+    StatCounter.objects.bulk_create(
+        StatCounter(key=key, value=value)
+        for key, value in counters.items() if value
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0005_pendingassignment"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatCounter",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=100, unique=True)),
+                ("value", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "ordering": ("key",),
+            },
+        ),
+        migrations.RunPython(build_counters, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def install(apps, schema_editor):
+    from tasks.search import install_search
+
+    install_search(schema_editor)
+
+
+def uninstall(apps, schema_editor):
+    from tasks.search import uninstall_search
+
+    uninstall_search(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0006_statcounter"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+
+
+def install(apps, schema_editor):
+    from tasks.search import install_trigram_indexes
+
+    install_trigram_indexes(schema_editor)
+
+
+def uninstall(apps, schema_editor):
+    from tasks.search import uninstall_trigram_indexes
+
+    uninstall_trigram_indexes(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_task_search"),
+    ]
+
+    operations = [
+        migrations.RunPython(install, uninstall),
+    ]
@@ -0,0 +1,63 @@
+# Generated by Django 5.2.7 on 2026-10-18 00:56
+
+from django.db import migrations, models
+
+
+def reinstall_search(apps, schema_editor):
+    # SQLite rebuilds tasks_task for the AlterField and drops its triggers.
+    from tasks.search import install_search
+
+    install_search(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0008_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="task",
+            name="status",
+            field=models.CharField(
+                choices=[
+                    ("active", "Active"),
+                    ("in_progress", "In Progress"),
+                    ("completed", "Completed"),
+                    ("suspended", "Suspended"),
+                ],
+                default="active",
+                max_length=20,
+            ),
+        ),
+        migrations.RunPython(reinstall_search, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="report",
+            index=models.Index(
+                fields=["author", "-created_at", "-id"],
+                name="report_author_created_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="report",
+            index=models.Index(
+                condition=models.Q(("verified_at__isnull", True)),
+                fields=["-created_at", "-id"],
+                name="report_unverified_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["assigned_to", "deadline", "id"],
+                name="task_assignee_deadline_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="task",
+            index=models.Index(
+                fields=["status", "deadline", "id"], name="task_status_deadline_idx"
+            ),
+        ),
+    ]
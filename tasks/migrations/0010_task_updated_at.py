@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-18 01:40
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def reinstall_search(apps, schema_editor):
+    # SQLite rebuilds tasks_task for the AddField and drops its triggers.
+    from tasks.search import install_search
+
+    install_search(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0009_list_view_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="task",
+            name="updated_at",
+            field=models.DateTimeField(
+                auto_now=True, db_index=True, default=django.utils.timezone.now
+            ),
+            preserve_default=False,
+        ),
+        migrations.RunPython(reinstall_search, migrations.RunPython.noop),
+    ]
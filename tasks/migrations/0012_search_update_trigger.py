@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def replace_update_trigger(apps, schema_editor):
+    # The trigger now only fires for title and description updates.
+    from tasks.search import FTS_TABLE, install_search
+
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au")
+    install_search(schema_editor)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0011_changelog"),
+    ]
+
+    operations = [
+        migrations.RunPython(replace_update_trigger,
+                             migrations.RunPython.noop),
+    ]
@@ -1,4 +1,19 @@
+import hashlib
+
+from django.conf import settings
 from django.core.exceptions import PermissionDenied
+from django.core.paginator import InvalidPage
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max
+from django.http import Http404
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from tasks.caching import get_version
+from tasks.pagination import (CountlessPaginator, KeysetPaginator,
+                              get_cached_count, set_cached_count)
+from tasks.search import similar_names
+from tasks.templatetags.query_transform import query_transform
 
 
 class CoordinatorRequiredMixin:
@@ -7,3 +22,146 @@ class CoordinatorRequiredMixin:
                 request.user.role != "coordinator"):
             raise PermissionDenied
         return super().dispatch(request, *args, **kwargs)
+
+
+class CursorPaginationMixin:
+    """Keyset pagination for list views, see ``KeysetPaginator``.
+
+    When ``get_cursor_key()`` returns ``None``, for example because the
+    list is ordered by something else, the next paginator in the MRO is
+    used instead.
+    """
+    cursor_key = None
+    cursor_descending = False
+
+    def get_cursor_key(self):
+        return self.cursor_key
+
+    def paginate_queryset(self, queryset, page_size):
+        cursor_key = self.get_cursor_key()
+        if cursor_key is None:
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, cursor_key,
+                                    self.cursor_descending)
+        page = paginator.page(self.request.GET.get("cursor"))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class CountlessPaginationMixin:
+    """Numbered pages without ``COUNT(*)``, see ``CountlessPaginator``.
+
+    ``get_total_count()`` may return a total that is cheap to know, such as
+    a counter for the unfiltered list. Otherwise the total learned on the
+    last page is cached until the next write.
+    """
+
+    def get_total_count(self, queryset):
+        return None
+
+    def paginate_queryset(self, queryset, page_size):
+        count = self.get_total_count(queryset)
+        if count is None:
+            count = get_cached_count(queryset)
+        paginator = CountlessPaginator(
+            queryset, page_size, count=count,
+            estimate=settings.PAGINATION_ESTIMATE_COUNT)
+        try:
+            page = paginator.page(self.request.GET.get("page") or 1)
+        except InvalidPage as exc:
+            raise Http404(f"Invalid page: {exc}")
+        if count is None and not paginator.count_is_estimate \
+                and paginator.count is not None:
+            set_cached_count(queryset, paginator.count)
+        return paginator, page, page.object_list, page.has_other_pages()
+
+
+class SuggestionMixin:
+    """Offer "did you mean" links when a name search finds nothing.
+
+    ``suggest_param`` is the GET parameter holding the search text and
+    ``suggest_field`` the field of ``get_suggestion_queryset()`` to match.
+    """
+    suggest_param = None
+    suggest_field = None
+
+    def get_suggestion_queryset(self):
+        return self.model._default_manager.all()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        text = self.request.GET.get(self.suggest_param, "").strip()
+        if text and not context["object_list"]:
+            names = similar_names(self.get_suggestion_queryset(),
+                                  self.suggest_field, text)
+            context["suggestions"] = [
+                (name, query_transform(self.request, page=None, cursor=None,
+                                       **{self.suggest_param: name}))
+                for name in names if name.lower() != text.lower()
+            ]
+        return context
+
+
+class ConditionalGetMixin:
+    """Answer conditional GETs with 304 before the page is built.
+
+    The validators come from ``MAX(updated_at)`` and a count over
+    ``get_validator_queryset()``, which narrows the view's filtered
+    queryset; that queryset is built once and shared with the page. The
+    ETag also covers the cache versions in ``validator_versions``, which
+    change when related rows shown on the page do, plus the session and
+    the query string. Pages with pending flash messages get neither
+    validators nor a 304 and are sent with ``no-store``.
+
+    ``Last-Modified`` only sees ``MAX(updated_at)``, which stays put when
+    a listed row is deleted or a related row changes. Views whose page
+    depends on more than that set ``send_last_modified = False`` and are
+    validated by the ETag alone.
+    """
+    validator_versions = ("counts", "choices")
+    send_last_modified = True
+
+    def get_validator_queryset(self, queryset):
+        return queryset
+
+    def get_validators(self, queryset):
+        validators = (self.get_validator_queryset(queryset).order_by()
+                      .aggregate(last_modified=Max("updated_at"),
+                                 count=Count("pk")))
+        last_modified = validators["last_modified"]
+        parts = [
+            last_modified.isoformat() if last_modified else "",
+            validators["count"],
+            *(get_version(namespace)
+              for namespace in self.validator_versions),
+            self.request.session.session_key,
+            self.request.get_full_path(),
+        ]
+        etag = hashlib.md5(repr(parts).encode(),
+                           usedforsecurity=False).hexdigest()
+        return quote_etag(etag), last_modified
+
+    def get(self, request, *args, **kwargs):
+        # The page shows the flash messages once, so it must not be stored
+        # and must not hand out validators a later request could match.
+        if len(get_messages(request)):
+            response = super().get(request, *args, **kwargs)
+            patch_cache_control(response, no_store=True)
+            return response
+        queryset = self.get_queryset()
+        # The generic get() builds the page from this same queryset instead
+        # of running the filters, search and search form a second time.
+        self.get_queryset = lambda: queryset
+        etag, last_modified = self.get_validators(queryset)
+        timestamp = None
+        if last_modified and self.send_last_modified:
+            timestamp = int(last_modified.timestamp())
+        response = get_conditional_response(request, etag=etag,
+                                            last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        response.headers.setdefault("ETag", etag)
+        if timestamp is not None:
+            response.headers.setdefault("Last-Modified", http_date(timestamp))
+        # Pages are per user: browsers may keep them, but must revalidate.
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -1,6 +1,7 @@
 from django.contrib.auth.models import AbstractUser
 from django.db import models
 from django.conf import settings
+from django.utils import timezone
 
 
 class Category(models.Model):
@@ -67,15 +68,23 @@ class Task(models.Model):
         blank=True,
     )
     status = models.CharField(max_length=20, choices=STATUS_CHOICES,
-                              default="active", db_index=True)
+                              default="active")
     deadline = models.DateTimeField(null=True, blank=True, db_index=True)
     category = models.ForeignKey(Category, on_delete=models.SET_NULL,
                                  null=True, db_index=True,
                                  related_name="tasks")
     tags = models.ManyToManyField(Tag, blank=True, related_name="tasks")
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ("deadline",)
+        # Match the list filters followed by the (deadline, id) keyset order.
+        indexes = [
+            models.Index(fields=("assigned_to", "deadline", "id"),
+                         name="task_assignee_deadline_idx"),
+            models.Index(fields=("status", "deadline", "id"),
+                         name="task_status_deadline_idx"),
+        ]
 
     def __str__(self):
         return self.title
@@ -105,6 +114,98 @@ class Report(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
+        indexes = [
+            models.Index(fields=("author", "-created_at", "-id"),
+                         name="report_author_created_idx"),
+            models.Index(fields=("-created_at", "-id"),
+                         condition=models.Q(verified_at__isnull=True),
+                         name="report_unverified_idx"),
+        ]
 
     def __str__(self):
         return f"Report for {self.task.title}"
+
+
+class OutboxEmail(models.Model):
+    STATUS_CHOICES = (
+        ("pending", "Pending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+    )
+
+    to_email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    html_body = models.TextField(blank=True)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES,
+                              default="pending")
+    attempts = models.PositiveIntegerField(default=0)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    available_at = models.DateTimeField(default=timezone.now)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("available_at", "id")
+        indexes = [
+            models.Index(fields=["status", "available_at"],
+                         name="outbox_status_available_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {self.to_email}"
+
+
+class PendingAssignment(models.Model):
+    recipient = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="pending_assignments",
+    )
+    task = models.ForeignKey(Task, on_delete=models.CASCADE,
+                             related_name="pending_assignments")
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        ordering = ("created_at",)
+
+    def __str__(self):
+        return f"{self.task.title} -> {self.recipient.username}"
+
+
+class StatCounter(models.Model):
+    key = models.CharField(max_length=100, unique=True)
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        ordering = ("key",)
+
+    def __str__(self):
+        return f"{self.key} = {self.value}"
+
+
+class ChangeLogEntry(models.Model):
+    """A write to a synced row; the id is the change token clients keep.
+
+    ``user`` is a volunteer who sees the row, so their sync only reads their
+    own entries. Unassigned rows are logged with no user.
+    """
+    model = models.CharField(max_length=20)
+    object_id = models.BigIntegerField()
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        null=True,
+        db_index=False,
+        related_name="+",
+    )
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        ordering = ("id",)
+        indexes = [
+            models.Index(fields=("user", "id"), name="changelog_user_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.id}: {self.model} {self.object_id}"
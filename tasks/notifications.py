@@ -1,35 +1,94 @@
-from django.core.mail import send_mail
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F, Min
 from django.template.loader import render_to_string
+from django.utils import timezone
 from django.utils.html import strip_tags
 from django.conf import settings
 
+from tasks.models import OutboxEmail, PendingAssignment
+
+
+def render_email_notification(subject: str, template: str,
+                              context: dict, to_email: str) -> OutboxEmail:
+    html_message = render_to_string(template, context)
+    plain_message = strip_tags(html_message)
+    return OutboxEmail(
+        to_email=to_email,
+        subject=subject,
+        body=plain_message,
+        html_body=html_message,
+    )
+
 
 def send_email_notification(subject: str, template: str,
                             context: dict, to_email: str):
+    """Render the message and queue it in the outbox.
+
+    The row is written in the caller's transaction, so a rolled back save
+    never produces an email. Delivery happens in ``process_outbox``.
+    """
     if not to_email:
-        return
-    html_message = render_to_string(template, context)
-    plain_message = strip_tags(html_message)
+        return None
+    email = render_email_notification(subject, template, context, to_email)
+    email.save()
+    return email
 
-    send_mail(
-        subject,
-        plain_message,
-        settings.DEFAULT_FROM_EMAIL,
-        [to_email],
-        html_message=html_message,
+
+def task_assigned_email(task, to_email: str) -> OutboxEmail:
+    return render_email_notification(
+        subject=f"You have been assigned a task {task.title}",
+        template="emails/task_assigned.html",
+        context={"task": task},
+        to_email=to_email,
+    )
+
+
+def tasks_assigned_email(tasks: list, to_email: str) -> OutboxEmail:
+    """One email for all of ``tasks``; a lone task uses the regular one."""
+    if len(tasks) == 1:
+        return task_assigned_email(tasks[0], to_email)
+    return render_email_notification(
+        subject=f"You have been assigned {len(tasks)} new tasks",
+        template="emails/task_assigned_digest.html",
+        context={"tasks": tasks},
+        to_email=to_email,
     )
 
 
 def notify_task_assigned(task):
     user = task.assigned_to
     if user and user.email:
-        context = {"task": task}
-        send_email_notification(
-            subject=f"You have been assigned a task {task.title}",
-            template="emails/task_assigned.html",
-            context=context,
-            to_email=user.email,
+        if settings.NOTIFICATION_DIGEST_WINDOW:
+            PendingAssignment.objects.create(recipient=user, task=task)
+        else:
+            task_assigned_email(task, user.email).save()
+
+
+def notify_tasks_assigned(tasks) -> None:
+    """Notify the assignees of many new tasks with one bulk insert.
+
+    Each volunteer gets a single email for all of their tasks, or pending
+    digest entries when digests are enabled.
+    """
+    tasks_by_recipient = {}
+    for task in tasks:
+        user = task.assigned_to
+        if user and user.email:
+            tasks_by_recipient.setdefault(user, []).append(task)
+    if settings.NOTIFICATION_DIGEST_WINDOW:
+        PendingAssignment.objects.bulk_create(
+            PendingAssignment(recipient=user, task=task)
+            for user, user_tasks in tasks_by_recipient.items()
+            for task in user_tasks
         )
+        return
+    OutboxEmail.objects.bulk_create(
+        tasks_assigned_email(user_tasks, user.email)
+        for user, user_tasks in tasks_by_recipient.items()
+    )
 
 
 def notify_report_verified(report):
@@ -42,3 +101,156 @@ def notify_report_verified(report):
             context=context,
             to_email=user.email,
         )
+
+
+def flush_assignment_digests() -> int:
+    """Turn buffered assignments whose window has elapsed into emails.
+
+    A volunteer's window opens with their oldest pending assignment. All
+    tasks still assigned to them are sent in one digest rendered in a
+    single template pass; a lone assignment uses the regular template.
+    Returns the number of emails queued.
+    """
+    window = timedelta(seconds=settings.NOTIFICATION_DIGEST_WINDOW)
+    due_recipients = (
+        PendingAssignment.objects
+        .values("recipient")
+        .annotate(first_created=Min("created_at"))
+        .filter(first_created__lte=timezone.now() - window)
+        .values("recipient")
+    )
+    with transaction.atomic():
+        pending = list(
+            PendingAssignment.objects
+            # Only the pending rows: locking the joined tasks and users
+            # would block their edits and logins while digests are built.
+            .select_for_update(skip_locked=True, of=("self",))
+            .filter(recipient__in=due_recipients)
+            .select_related("recipient", "task")
+            .order_by("recipient", "created_at")
+        )
+        tasks_by_recipient = {}
+        for entry in pending:
+            tasks = tasks_by_recipient.setdefault(entry.recipient, {})
+            if entry.task.assigned_to_id == entry.recipient_id:
+                tasks[entry.task_id] = entry.task
+
+        emails = []
+        for recipient, tasks in tasks_by_recipient.items():
+            if not tasks or not recipient.email:
+                continue
+            emails.append(tasks_assigned_email(list(tasks.values()),
+                                               recipient.email))
+        OutboxEmail.objects.bulk_create(emails)
+        PendingAssignment.objects.filter(
+            pk__in=[entry.pk for entry in pending]).delete()
+    return len(emails)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    delay = settings.EMAIL_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1)
+    return timedelta(seconds=min(delay, settings.EMAIL_OUTBOX_MAX_RETRY_DELAY))
+
+
+def build_email_message(email: OutboxEmail) -> EmailMultiAlternatives:
+    message = EmailMultiAlternatives(
+        email.subject,
+        email.body,
+        settings.DEFAULT_FROM_EMAIL,
+        [email.to_email],
+    )
+    if email.html_body:
+        message.attach_alternative(email.html_body, "text/html")
+    return message
+
+
+def send_email_messages(messages: list, batch_size: int = None) -> list:
+    """Send messages reusing one connection per batch.
+
+    Returns one entry per message, in order: ``None`` when it was delivered
+    or the exception it raised. A failed message resets the connection so
+    the rest of the batch goes out over a fresh one.
+    """
+    batch_size = batch_size or settings.EMAIL_SEND_BATCH_SIZE
+    results = []
+    for start in range(0, len(messages), batch_size):
+        connection = get_connection()
+        try:
+            for message in messages[start:start + batch_size]:
+                try:
+                    connection.open()
+                    connection.send_messages([message])
+                except Exception as exc:
+                    results.append(exc)
+                    connection.close()
+                else:
+                    results.append(None)
+        finally:
+            connection.close()
+    return results
+
+
+def deliver_outbox(batch_size: int = None) -> tuple[int, int]:
+    """Send one batch of due outbox emails.
+
+    Returns ``(sent, failed)``. Failed messages are rescheduled with an
+    exponential backoff until ``EMAIL_OUTBOX_MAX_ATTEMPTS`` is reached.
+
+    The batch is claimed in a short transaction by moving its
+    ``available_at`` past ``EMAIL_OUTBOX_CLAIM_TIMEOUT``, and sent after
+    the commit, so no row lock is held during the SMTP round trip. Rows
+    of a worker that dies while sending are picked up again once the
+    claim expires; the claim counts as an attempt, so they are marked
+    failed after ``EMAIL_OUTBOX_MAX_ATTEMPTS`` tries like any other.
+    """
+    batch_size = batch_size or settings.EMAIL_OUTBOX_BATCH_SIZE
+    now = timezone.now()
+    sent = failed = 0
+
+    with transaction.atomic():
+        claimed = list(
+            OutboxEmail.objects
+            .select_for_update(skip_locked=True)
+            .filter(status="pending", available_at__lte=now)
+            .order_by("available_at", "id")[:batch_size]
+        )
+        # Claiming counts as the attempt, so a message that keeps killing
+        # the worker mid-send still runs out of attempts.
+        batch, exhausted = [], []
+        for email in claimed:
+            if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                email.status = "failed"
+                email.last_error = (email.last_error
+                                    or "The worker stopped while sending.")
+                exhausted.append(email)
+            else:
+                email.attempts += 1
+                batch.append(email)
+        OutboxEmail.objects.bulk_update(exhausted, ["status", "last_error"])
+        OutboxEmail.objects.filter(pk__in=[email.pk for email in batch]) \
+            .update(attempts=F("attempts") + 1,
+                    available_at=now + timedelta(
+                        seconds=settings.EMAIL_OUTBOX_CLAIM_TIMEOUT))
+    failed = len(exhausted)
+    if not batch:
+        return sent, failed
+
+    results = send_email_messages(
+        [build_email_message(email) for email in batch])
+    for email, error in zip(batch, results):
+        if error is not None:
+            failed += 1
+            email.last_error = f"{type(error).__name__}: {error}"
+            if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                email.status = "failed"
+            else:
+                email.available_at = now + retry_delay(email.attempts)
+        else:
+            sent += 1
+            email.status = "sent"
+            email.sent_at = timezone.now()
+            email.last_error = ""
+    OutboxEmail.objects.bulk_update(
+        batch, ["attempts", "status", "last_error", "available_at",
+                "sent_at"])
+    return sent, failed
@@ -0,0 +1,264 @@
+import hashlib
+import json
+from math import ceil
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet, ValidationError
+from django.core.paginator import EmptyPage, PageNotAnInteger
+from django.db import connections
+from django.db.models import F, Q
+from django.http import Http404
+
+from tasks.caching import get_version
+
+CURSOR_SALT = "tasks.pagination.cursor"
+
+
+class CursorPage:
+    def __init__(self, object_list, paginator, next_cursor=None,
+                 previous_cursor=None):
+        self.object_list = object_list
+        self.paginator = paginator
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __repr__(self):
+        return f"<CursorPage of {len(self.object_list)} items>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class KeysetPaginator:
+    """Paginate by seeking past the last row instead of using OFFSET.
+
+    Rows are ordered by ``(key, pk)`` with NULL keys last, and each page
+    is fetched with a ``WHERE`` on that position, so a deep page costs the
+    same as the first one and no ``COUNT(*)`` is needed. Pages are
+    addressed by signed, opaque cursor tokens.
+    """
+    is_cursor = True
+
+    def __init__(self, queryset, per_page, key, descending=False):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.key = key
+        self.descending = descending
+        self.field = queryset.model._meta.get_field(key)
+
+    def ordering(self, reverse=False):
+        # Only spell out NULL placement when the key can be NULL; otherwise
+        # the ORDER BY matches a plain index on the key.
+        nulls = {}
+        if self.field.null:
+            nulls = {"nulls_first": True} if reverse else {"nulls_last": True}
+        if self.descending != reverse:
+            return F(self.key).desc(**nulls), F("pk").desc()
+        return F(self.key).asc(**nulls), F("pk").asc()
+
+    def seek(self, value, pk, reverse=False):
+        """Rows after ``(value, pk)``, or before it when ``reverse``."""
+        lookup = "lt" if self.descending != reverse else "gt"
+        if value is None:
+            condition = Q(**{f"{self.key}__isnull": True,
+                             f"pk__{lookup}": pk})
+            if reverse:
+                condition |= Q(**{f"{self.key}__isnull": False})
+            return condition
+        condition = (Q(**{f"{self.key}__{lookup}": value})
+                     | Q(**{self.key: value, f"pk__{lookup}": pk}))
+        if self.field.null and not reverse:
+            condition |= Q(**{f"{self.key}__isnull": True})
+        return condition
+
+    def encode(self, direction, obj):
+        value = getattr(obj, self.key)
+        if hasattr(value, "isoformat"):
+            value = value.isoformat()
+        return signing.dumps([direction, value, obj.pk], salt=CURSOR_SALT)
+
+    def decode(self, cursor):
+        try:
+            direction, value, pk = signing.loads(cursor, salt=CURSOR_SALT)
+            if direction not in ("next", "previous"):
+                raise ValueError(direction)
+            return direction, self.field.to_python(value), int(pk)
+        except (signing.BadSignature, TypeError, ValueError,
+                ValidationError) as exc:
+            raise Http404("Invalid cursor.") from exc
+
+    def page_queryset(self, direction=None, value=None, pk=None):
+        """The query for one page, plus one row to detect the next page."""
+        queryset = self.queryset
+        reverse = direction == "previous"
+        if direction:
+            queryset = queryset.filter(self.seek(value, pk, reverse))
+        return queryset.order_by(*self.ordering(reverse))[:self.per_page + 1]
+
+    def page(self, cursor=None):
+        direction = value = pk = None
+        if cursor:
+            direction, value, pk = self.decode(cursor)
+        reverse = direction == "previous"
+        rows = list(self.page_queryset(direction, value, pk))
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if reverse:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, direction is not None
+
+        return CursorPage(
+            rows, self,
+            next_cursor=(self.encode("next", rows[-1])
+                         if has_next and rows else None),
+            previous_cursor=(self.encode("previous", rows[0])
+                             if has_previous and rows else None),
+        )
+
+
+class CountlessPage:
+    def __init__(self, object_list, number, paginator, has_next):
+        self.object_list = object_list
+        self.number = number
+        self.paginator = paginator
+        self._has_next = has_next
+
+    def __repr__(self):
+        return f"<Page {self.number}>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self.number > 1
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    def next_page_number(self):
+        return self.number + 1
+
+    def previous_page_number(self):
+        return self.number - 1
+
+
+class CountlessPaginator:
+    """Offset pagination that never runs ``COUNT(*)``.
+
+    A page fetches ``per_page + 1`` rows, and the extra row only says
+    whether there is a next page. ``count`` is the exact total when it was
+    passed in or the last page was reached, otherwise the planner estimate
+    when ``estimate`` is set, otherwise ``None``.
+    """
+    is_countless = True
+
+    def __init__(self, queryset, per_page, count=None, estimate=False):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.count = count
+        self.count_is_estimate = False
+        self.estimate = estimate
+
+    @property
+    def num_pages(self):
+        if self.count is None:
+            return None
+        return max(1, ceil(self.count / self.per_page))
+
+    def validate_number(self, number):
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return number
+
+    def page_queryset(self, number=1):
+        offset = (number - 1) * self.per_page
+        return self.queryset[offset:offset + self.per_page + 1]
+
+    def page(self, number):
+        number = self.validate_number(number)
+        offset = (number - 1) * self.per_page
+        rows = list(self.page_queryset(number))
+        if not rows and number > 1:
+            raise EmptyPage("That page contains no results")
+        has_next = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+        if not has_next:
+            self.count = offset + len(rows)
+        elif self.count is None and self.estimate:
+            estimate = estimate_count(self.queryset)
+            if estimate is not None:
+                # Never claim fewer rows than the pages already seen.
+                self.count = max(estimate, offset + len(rows) + 1)
+                self.count_is_estimate = True
+        return CountlessPage(rows, number, self, has_next)
+
+
+def estimate_count(queryset):
+    """Row estimate from the Postgres planner, ``None`` elsewhere."""
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return None
+    try:
+        sql, params = queryset.order_by().query.sql_with_params()
+    except EmptyResultSet:
+        return 0
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def count_cache_key(queryset) -> str:
+    sql, params = queryset.order_by().query.sql_with_params()
+    digest = hashlib.md5(f"{sql}{params!r}".encode(),
+                         usedforsecurity=False).hexdigest()
+    return f"tasks:counts:{digest}:{get_version('counts')}"
+
+
+def get_cached_count(queryset):
+    try:
+        return cache.get(count_cache_key(queryset))
+    except EmptyResultSet:
+        return 0
+
+
+def set_cached_count(queryset, count) -> None:
+    try:
+        cache.set(count_cache_key(queryset), count,
+                  settings.DASHBOARD_CACHE_TIMEOUT)
+    except EmptyResultSet:
+        pass
@@ -0,0 +1,192 @@
+import difflib
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+TASK_TABLE = "tasks_task"
+FTS_TABLE = "tasks_task_fts"
+
+POSTGRES_INSTALL = [
+    # A stored generated column is recomputed by Postgres on every write.
+    f"""
+    ALTER TABLE {TASK_TABLE} ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('english', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('english', coalesce(description, '')), 'B')
+    ) STORED
+    """,
+    f"""
+    CREATE INDEX IF NOT EXISTS tasks_task_search_idx
+    ON {TASK_TABLE} USING gin (search_vector)
+    """,
+]
+POSTGRES_UNINSTALL = [
+    f"ALTER TABLE {TASK_TABLE} DROP COLUMN IF EXISTS search_vector",
+]
+
+SQLITE_INSTALL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, description, content='{TASK_TABLE}', content_rowid='id'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON {TASK_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON {TASK_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au
+    AFTER UPDATE OF title, description ON {TASK_TABLE}
+    BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO {FTS_TABLE}(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+]
+SQLITE_UNINSTALL = [
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+
+# icontains compiles to UPPER(col::text) LIKE UPPER(%s) on Postgres, so the
+# trigram indexes are built on that same expression.
+TRIGRAM_INDEXES = {
+    "tasks_customuser_username_trgm": ("tasks_customuser", "username"),
+    "tasks_tag_name_trgm": ("tasks_tag", "name"),
+    "tasks_category_name_trgm": ("tasks_category", "name"),
+}
+
+
+def install_search(schema_editor):
+    """Create the search column or shadow table for this database.
+
+    Safe to run again: SQLite drops the triggers whenever a migration
+    rebuilds ``tasks_task``, so such migrations call this afterwards.
+    """
+    vendor = schema_editor.connection.vendor
+    statements = {"postgresql": POSTGRES_INSTALL,
+                  "sqlite": SQLITE_INSTALL}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def uninstall_search(schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"postgresql": POSTGRES_UNINSTALL,
+                  "sqlite": SQLITE_UNINSTALL}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def install_trigram_indexes(schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for name, (table, column) in TRIGRAM_INDEXES.items():
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+            f"USING gin ((UPPER({column}::text)) gin_trgm_ops)")
+
+
+def uninstall_trigram_indexes(schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {name}")
+
+
+def fts5_query(text: str) -> str:
+    # Quote every word so user input can't produce FTS5 syntax errors;
+    # the trailing * makes the last word match as a prefix while typing.
+    words = [f'"{word}"' for word in re.findall(r"\w+", text)]
+    if words:
+        words[-1] += "*"
+    return " ".join(words)
+
+
+def search_tasks(queryset, text: str, ranked: bool = True):
+    """Filter ``queryset`` to tasks matching ``text``, best matches first.
+
+    Adds a ``search_rank`` annotation where higher is more relevant, unless
+    ``ranked`` is false. Other databases fall back to ``icontains`` on the
+    title and description.
+    """
+    vendor = connections[queryset.db].vendor
+    # Matches are selected by id in a subquery, so the filter also works
+    # when this queryset is itself nested under another table alias.
+    if vendor == "postgresql":
+        tsquery = "websearch_to_tsquery('english', %s)"
+        matches = (f"SELECT id FROM {TASK_TABLE} "
+                   f"WHERE search_vector @@ {tsquery}")
+        rank = f"ts_rank({TASK_TABLE}.search_vector, {tsquery})"
+        params = (text,)
+    elif vendor == "sqlite":
+        params = (fts5_query(text),)
+        if not params[0]:
+            return queryset
+        matches = f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s"
+        # bm25() is lower for better matches; titles weigh more than text.
+        rank = (f"SELECT -bm25({FTS_TABLE}, 10.0, 1.0) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = {TASK_TABLE}.id")
+    else:
+        return queryset.filter(Q(title__icontains=text)
+                               | Q(description__icontains=text))
+    queryset = queryset.filter(pk__in=RawSQL(matches, params))
+    if not ranked:
+        return queryset
+    return (queryset
+            .annotate(search_rank=RawSQL(rank, params))
+            .order_by("-search_rank", "deadline", "pk"))
+
+
+def similar_names(queryset, field: str, text: str, limit: int = 5) -> list:
+    """Values of ``field`` that look like ``text``, closest first.
+
+    Postgres ranks by trigram similarity using the trigram indexes. Other
+    databases narrow the candidates to names sharing a trigram with
+    ``text`` and rank those with ``difflib``.
+    """
+    connection = connections[queryset.db]
+    queryset = queryset.order_by()
+    if connection.vendor == "postgresql":
+        model_field = queryset.model._meta.get_field(field)
+        column = (f"{connection.ops.quote_name(queryset.model._meta.db_table)}"
+                  f".{connection.ops.quote_name(model_field.column)}")
+        expression = f"UPPER({column}::text)"
+        return list(
+            queryset
+            .annotate(similarity=RawSQL(
+                f"similarity({expression}, UPPER(%s))", (text,)))
+            .extra(where=[f"{expression} %% UPPER(%s)"], params=[text])
+            .order_by("-similarity", field)
+            .values_list(field, flat=True)[:limit]
+        )
+
+    lowered = text.lower()
+    grams = sorted({lowered[i:i + 3]
+                    for i in range(max(1, len(lowered) - 2))})
+    condition = Q()
+    for gram in grams[:10]:
+        condition |= Q(**{f"{field}__icontains": gram})
+    names = {name.lower(): name for name in
+             queryset.filter(condition).values_list(field, flat=True)[:1000]}
+    return [names[match] for match in
+            difflib.get_close_matches(lowered, names, limit, 0.5)]
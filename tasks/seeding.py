@@ -0,0 +1,266 @@
+"""Synthetic data for load testing, see ``manage.py seed``.
+
+Every value is drawn from one ``random.Random(seed)``, so a seed always
+produces the same rows; dates are relative to the day of the run. Rows
+are generated lazily and inserted with ``bulk_create`` one chunk at a
+time, and only primary keys are kept between models, so memory stays
+flat at millions of rows.
+
+The shape follows the real data: a few volunteers do most of the work,
+popular tags are on most tasks, past deadlines are mostly completed and
+reports are written by the task's volunteer.
+"""
+import itertools
+import random
+from collections import Counter
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.db import connection, transaction
+from django.utils import timezone
+
+from tasks.caching import bump_version
+from tasks.loading import bulk_create_raw
+from tasks.models import Category, CustomUser, Report, Tag, Task
+from tasks.stats import rebuild_counters
+from tasks.sync import record_changes
+
+FIRST_NAMES = ["Olena", "Andrii", "Iryna", "Taras", "Sofiia", "Maksym",
+               "Kateryna", "Dmytro", "Yuliia", "Oleh", "Nataliia", "Bohdan"]
+LAST_NAMES = ["Kovalenko", "Shevchenko", "Bondarenko", "Tkachenko",
+              "Kravchenko", "Melnyk", "Boiko", "Oliinyk", "Lysenko"]
+CITIES = ["Kyiv", "Lviv", "Kharkiv", "Odesa", "Dnipro", "Zaporizhzhia",
+          "Vinnytsia", "Poltava", "Chernihiv", "Mykolaiv"]
+CATEGORY_NAMES = ["Humanitarian Aid", "Medical Assistance",
+                  "Evacuation Support", "Reconstruction", "Logistics",
+                  "Psychological Support", "Education", "Fundraising"]
+TAG_NAMES = ["food", "water", "medicine", "transport", "clothes", "shelter",
+             "children", "elderly", "urgent", "weekend", "driver",
+             "generators", "packing", "frontline", "donations", "repair"]
+VERBS = ["Deliver", "Collect", "Sort", "Transport", "Repair", "Organize",
+         "Pack", "Distribute", "Unload", "Register"]
+GOODS = ["food packages", "medical kits", "winter clothes", "generators",
+         "drinking water", "blankets", "school supplies", "hygiene kits",
+         "building materials", "baby food"]
+SENTENCES = [
+    "Volunteers meet at the warehouse in the morning.",
+    "Bring gloves and a charged phone.",
+    "A van and a driver are needed for the whole day.",
+    "Coordinate with the local administration before arrival.",
+    "The shelter expects around forty people.",
+    "Everything has to be labelled and counted twice.",
+    "Helped load the boxes and checked the lists with the driver.",
+    "Families with children were served first.",
+    "Some items were missing and have been reordered.",
+    "The work went smoothly and finished on time.",
+]
+
+# (status, weight) by deadline: none, in the past, in the future.
+STATUS_WEIGHTS = {
+    None: {"active": 50, "in_progress": 30, "suspended": 10,
+           "completed": 10},
+    "past": {"active": 5, "in_progress": 10, "suspended": 10,
+             "completed": 75},
+    "future": {"active": 55, "in_progress": 35, "suspended": 5,
+               "completed": 5},
+}
+TAGS_PER_TASK_WEIGHTS = {0: 10, 1: 25, 2: 30, 3: 20, 4: 10, 5: 5}
+
+
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, size)):
+        yield chunk
+
+
+def skewed_weights(count, exponent=1.0):
+    """Cumulative weights where the first items are picked the most."""
+    return list(itertools.accumulate(1 / (rank + 1) ** exponent
+                                     for rank in range(count)))
+
+
+def weighted(rng, weights):
+    return rng.choices(list(weights), list(weights.values()))[0]
+
+
+def text(rng, low, high):
+    return " ".join(rng.choices(SENTENCES, k=rng.randint(low, high)))
+
+
+class Seeder:
+    """Generate and insert the rows for one ``seed`` run."""
+
+    def __init__(self, seed=0, batch_size=5_000, password="volunteer",
+                 progress=None, tags_per_task=None):
+        self.rng = random.Random(seed)
+        self.prefix = f"seed{seed}-"
+        self.batch_size = batch_size
+        self.password = password
+        # None draws the count from TAGS_PER_TASK_WEIGHTS.
+        self.tags_per_task = tags_per_task
+        self.progress = progress or (lambda message: None)
+        self.now = timezone.now().replace(minute=0, second=0, microsecond=0)
+        self.created = Counter()
+
+    def insert(self, model, objects, on_chunk=None):
+        """Insert ``objects`` in chunks and return their primary keys."""
+        pks = []
+        for chunk in chunked(objects, self.batch_size):
+            bulk_create_raw(model, chunk)
+            pks.extend(obj.pk for obj in chunk)
+            if on_chunk:
+                on_chunk(chunk)
+            self.created[model._meta.label] += len(chunk)
+            self.progress(f"{model._meta.verbose_name_plural}: "
+                          f"{self.created[model._meta.label]}")
+        return pks
+
+    def users(self, count, role):
+        # Hashing is slow on purpose, so every user shares one hash.
+        password = make_password(self.password)
+        rng = self.rng
+        for i in range(count):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            username = f"{self.prefix}{role}{i}"
+            yield CustomUser(
+                username=username, password=password, role=role,
+                first_name=first, last_name=last,
+                email=f"{username}@example.com",
+                city=rng.choice(CITIES),
+                date_joined=self.now - timedelta(days=rng.randint(0, 730)),
+            )
+
+    def categories(self, count):
+        for i in range(count):
+            name = CATEGORY_NAMES[i % len(CATEGORY_NAMES)]
+            yield Category(name=f"{name} {i // len(CATEGORY_NAMES) + 1}",
+                           description=text(self.rng, 1, 2))
+
+    def tags(self, count):
+        for i in range(count):
+            name = TAG_NAMES[i % len(TAG_NAMES)]
+            yield Tag(name=f"{self.prefix}{name}-{i // len(TAG_NAMES) + 1}")
+
+    def tasks(self, count, coordinators, volunteers, categories):
+        rng = self.rng
+        activity = skewed_weights(len(volunteers), 0.8)
+        for i in range(count):
+            deadline = None
+            period = None
+            if rng.random() < 0.95:
+                # Most deadlines are behind us, like in a long-running site.
+                days = rng.triangular(-365, 90, 20)
+                deadline = self.now + timedelta(days=days,
+                                                hours=rng.randint(0, 23))
+                period = "past" if deadline < self.now else "future"
+            status = weighted(rng, STATUS_WEIGHTS[period])
+            assigned = rng.random() < (0.6 if status == "active" else 0.97)
+            updated = min(deadline or self.now, self.now)
+            yield Task(
+                title=(f"{rng.choice(VERBS)} {rng.choice(GOODS)} "
+                       f"in {rng.choice(CITIES)}"),
+                description=text(rng, 0, 5),
+                created_by_id=rng.choice(coordinators),
+                assigned_to_id=(rng.choices(volunteers, cum_weights=activity)
+                                [0] if assigned and volunteers else None),
+                status=status,
+                deadline=deadline,
+                category_id=rng.choice(categories) if categories else None,
+                updated_at=updated - timedelta(hours=rng.randint(0, 240)),
+            )
+
+    def task_tags(self, task_ids, tags):
+        rng = self.rng
+        popularity = skewed_weights(len(tags))
+        through = Task.tags.through
+        for task_id in task_ids:
+            wanted = min(self.tags_per_task
+                         or weighted(rng, TAGS_PER_TASK_WEIGHTS), len(tags))
+            chosen = set()
+            while len(chosen) < wanted:
+                chosen.add(rng.choices(tags, cum_weights=popularity)[0])
+            for tag_id in chosen:
+                yield through(task_id=task_id, tag_id=tag_id)
+
+    def reports(self, count, targets, coordinators, volunteers):
+        """``targets`` is a list of ``(task_id, volunteer_id, status)``."""
+        rng = self.rng
+        for _ in range(count):
+            task_id, owner, status = rng.choice(targets)
+            if rng.random() < 0.1:
+                owner = rng.choice(volunteers)
+            created = self.now - timedelta(minutes=rng.randint(0, 525_600))
+            verified = rng.random() < (0.85 if status == "completed" else 0.2)
+            verified_at = (created + timedelta(hours=rng.randint(1, 72))
+                           if verified else None)
+            yield Report(
+                comment=text(rng, 2, 6),
+                author_id=owner,
+                task_id=task_id,
+                created_at=created,
+                updated_at=verified_at or created,
+                verified_by_id=rng.choice(coordinators) if verified else None,
+                verified_at=verified_at,
+            )
+
+    def run(self, coordinators, volunteers, categories, tags, tasks,
+            reports):
+        coordinator_ids = self.insert(
+            CustomUser, self.users(max(1, coordinators), "coordinator"))
+        volunteer_ids = self.insert(
+            CustomUser, self.users(volunteers, "volunteer"))
+        category_ids = self.insert(Category, self.categories(categories))
+        tag_ids = self.insert(Tag, self.tags(tags))
+
+        targets = []
+
+        def task_chunk(chunk):
+            record_changes("task", [(task.pk, task.assigned_to_id)
+                                    for task in chunk])
+            targets.extend((task.pk, task.assigned_to_id, task.status)
+                           for task in chunk if task.assigned_to_id
+                           and task.status in ("in_progress", "completed"))
+
+        task_ids = self.insert(
+            Task, self.tasks(tasks, coordinator_ids, volunteer_ids,
+                             category_ids), task_chunk)
+        if tag_ids:
+            self.insert(Task.tags.through, self.task_tags(task_ids, tag_ids))
+        if targets:
+            self.insert(
+                Report,
+                self.reports(reports, targets, coordinator_ids, volunteer_ids),
+                lambda chunk: record_changes(
+                    "report", [(report.pk, report.author_id)
+                               for report in chunk]))
+
+        self.progress("rebuilding counters")
+        rebuild_counters()
+        bump_version("dashboard", "counts", "choices")
+        transaction.on_commit(
+            lambda: bump_version("dashboard", "counts", "choices"))
+        # Fresh planner statistics, both databases understand plain ANALYZE.
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE")
+        return self.created
+
+
+def seed_tasks(tasks, batch_size=None, seed=0, tags_per_task=None):
+    """Seed ``tasks`` tasks with users, labels and reports in proportion.
+
+    Used by the benchmarks and ``explain_views``, which roll the rows back
+    afterwards. A seed already loaded with ``manage.py seed`` is skipped
+    so the usernames stay unique. Returns the ``Seeder``.
+    """
+    while True:
+        seeder = Seeder(seed=seed, batch_size=batch_size or 5_000,
+                        tags_per_task=tags_per_task)
+        if not CustomUser.objects.filter(
+                username__startswith=seeder.prefix).exists():
+            break
+        seed += 1
+    seeder.run(coordinators=max(1, tasks // 1_000),
+               volunteers=max(10, tasks // 100), categories=10,
+               tags=max(20, (tags_per_task or 3) * 10), tasks=tasks,
+               reports=tasks // 2)
+    return seeder
@@ -0,0 +1,241 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models.signals import (m2m_changed, post_delete, post_init,
+                                      post_save, pre_delete, pre_save)
+from django.dispatch import receiver
+from django.utils import timezone
+
+from tasks.caching import bump_version
+from tasks.models import Category, CustomUser, Report, StatCounter, Tag, Task
+from tasks.stats import (bump_counters, tag_key, task_counter_keys,
+                         volunteer_key)
+from tasks.sync import SYNCED_MODELS, record_changes
+
+TRACKED_FIELDS = {
+    Task: ("status", "assigned_to_id"),
+    Report: ("author_id",),
+    CustomUser: ("role",),
+}
+
+
+def counter_keys(instance, state) -> list:
+    if isinstance(instance, Task):
+        return task_counter_keys(*state)
+    if isinstance(instance, Report):
+        author_id, = state
+        keys = ["reports"]
+        if author_id:
+            keys.append(volunteer_key(author_id, "reports"))
+        return keys
+    role, = state
+    return ["volunteers"] if role == "volunteer" else []
+
+
+def current_state(instance, fallback=None):
+    # Read __dict__ directly so deferred fields are not fetched one by one;
+    # a deferred field was not saved either, so it keeps its old value.
+    values = instance.__dict__
+    fields = TRACKED_FIELDS[type(instance)]
+    if fallback is not None:
+        return tuple(values.get(field, old)
+                     for field, old in zip(fields, fallback))
+    if all(field in values for field in fields):
+        return tuple(values[field] for field in fields)
+    return None
+
+
+@receiver(post_init, sender=Task)
+@receiver(post_init, sender=Report)
+@receiver(post_init, sender=CustomUser)
+def remember_counter_state(sender, instance, **kwargs):
+    instance._counter_state = current_state(instance)
+
+
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=Report)
+@receiver(pre_save, sender=CustomUser)
+@receiver(pre_delete, sender=Task)
+@receiver(pre_delete, sender=Report)
+@receiver(pre_delete, sender=CustomUser)
+def load_counter_state(sender, instance, **kwargs):
+    if instance._state.adding or instance._counter_state is not None:
+        return
+    fields = TRACKED_FIELDS[sender]
+    instance._counter_state = (sender._base_manager
+                               .filter(pk=instance.pk)
+                               .values_list(*fields).first())
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Report)
+@receiver(post_save, sender=CustomUser)
+def update_counters_on_save(sender, instance, created, **kwargs):
+    old_state = None if created else instance._counter_state
+    new_state = current_state(instance, old_state)
+    if new_state == old_state:
+        return
+    deltas = Counter(counter_keys(instance, new_state))
+    if old_state is not None:
+        deltas.subtract(counter_keys(instance, old_state))
+    bump_counters(deltas)
+    instance._counter_state = new_state
+
+
+@receiver(post_save, sender=Category)
+def count_created_category(sender, instance, created, **kwargs):
+    if created:
+        bump_counters({"categories": 1})
+
+
+@receiver(pre_delete, sender=Task)
+def remember_task_tags(sender, instance, **kwargs):
+    # The through rows are gone by the time post_delete fires.
+    instance._counter_tag_ids = list(
+        instance.tags.through.objects.filter(task_id=instance.pk)
+        .values_list("tag_id", flat=True))
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Report)
+@receiver(post_delete, sender=CustomUser)
+def update_counters_on_delete(sender, instance, **kwargs):
+    state = instance._counter_state
+    deltas = Counter()
+    deltas.subtract(counter_keys(instance, state))
+    for tag_id in getattr(instance, "_counter_tag_ids", ()):
+        deltas[tag_key(tag_id)] -= 1
+    bump_counters(deltas)
+    if sender is CustomUser:
+        StatCounter.objects.filter(
+            key__startswith=volunteer_key(instance.pk, "")).delete()
+
+
+@receiver(post_delete, sender=Category)
+def count_deleted_category(sender, instance, **kwargs):
+    bump_counters({"categories": -1})
+
+
+@receiver(post_delete, sender=Tag)
+def drop_tag_counter(sender, instance, **kwargs):
+    StatCounter.objects.filter(key=tag_key(instance.pk)).delete()
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def update_tag_counters(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        instance._counter_cleared = list(
+            sender.objects.filter(**{"tag_id" if reverse else "task_id":
+                                     instance.pk})
+            .values_list("task_id" if reverse else "tag_id", flat=True))
+        return
+    if action == "post_clear":
+        pk_set, sign = instance._counter_cleared, -1
+    elif action in ("post_add", "post_remove"):
+        sign = 1 if action == "post_add" else -1
+    else:
+        return
+    if reverse:
+        deltas = {tag_key(instance.pk): sign * len(pk_set)}
+    else:
+        deltas = {tag_key(tag_id): sign for tag_id in pk_set}
+    bump_counters(deltas)
+    bump_version("counts")
+
+
+@receiver(m2m_changed, sender=Task.tags.through)
+def touch_retagged_tasks(sender, instance, action, reverse, pk_set,
+                         **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if not reverse:
+        task_ids = [instance.pk]
+    elif action == "post_clear":
+        task_ids = instance._counter_cleared
+    else:
+        task_ids = pk_set
+    tasks = Task.objects.filter(pk__in=task_ids)
+    tasks.update(updated_at=timezone.now())
+    record_changes("task", tasks.values_list("pk", "assigned_to_id"))
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Report)
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Report)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_dashboard(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    # Bump again on commit: a reader may cache pre-commit data in between.
+    bump_version("dashboard", "counts")
+    transaction.on_commit(lambda: bump_version("dashboard", "counts"))
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+@receiver(post_save, sender=CustomUser)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=Tag)
+@receiver(post_delete, sender=CustomUser)
+def invalidate_choices(sender, instance, update_fields=None, **kwargs):
+    if update_fields and set(update_fields) <= {"last_login"}:
+        return
+    bump_version("choices")
+    transaction.on_commit(lambda: bump_version("choices"))
+
+
+def synced_owner(sender, instance):
+    """The volunteer who sees the row as last saved."""
+    # load_counter_state has already loaded the saved row's state.
+    state = instance._counter_state
+    if state is None:
+        return None
+    owner = SYNCED_MODELS[sender._meta.model_name]
+    return dict(zip(TRACKED_FIELDS[sender], state))[owner]
+
+
+@receiver(pre_save, sender=Task)
+@receiver(pre_save, sender=Report)
+def remember_sync_owner(sender, instance, **kwargs):
+    instance._sync_owner = synced_owner(sender, instance)
+
+
+@receiver(post_save, sender=Task)
+@receiver(post_save, sender=Report)
+def log_saved_change(sender, instance, created, **kwargs):
+    name = sender._meta.model_name
+    previous = instance._sync_owner
+    current = instance.__dict__.get(SYNCED_MODELS[name], previous)
+    # The previous volunteer is told too, so the row leaves their device.
+    owners = {current} if created else {previous, current}
+    record_changes(name, [(instance.pk, owner) for owner in owners])
+
+
+@receiver(post_delete, sender=Task)
+@receiver(post_delete, sender=Report)
+def log_deleted_change(sender, instance, **kwargs):
+    record_changes(sender._meta.model_name,
+                   [(instance.pk, synced_owner(sender, instance))])
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_save, sender=Tag)
+def log_renamed_labels(sender, instance, created, **kwargs):
+    # Synced tasks carry category and tag names.
+    if not created:
+        record_changes("task", instance.tasks.values_list(
+            "pk", "assigned_to_id"))
+
+
+@receiver(pre_delete, sender=Category)
+@receiver(pre_delete, sender=Tag)
+def log_unlabelled_tasks(sender, instance, **kwargs):
+    # The delete unlinks the tasks with a queryset update or delete, which
+    # sends no task signals.
+    tasks = instance.tasks.all()
+    tasks.update(updated_at=timezone.now())
+    record_changes("task", tasks.values_list("pk", "assigned_to_id"))
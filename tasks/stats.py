@@ -0,0 +1,154 @@
+from collections import Counter
+
+from django.apps import apps as global_apps
+from django.core.exceptions import EmptyResultSet
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.models import Case, Count, F, Value, When
+
+from tasks.caching import bump_version
+from tasks.models import StatCounter, Task
+
+GLOBAL_KEYS = ("volunteers", "tasks", "categories", "reports")
+
+
+def count_querysets(using: str = DEFAULT_DB_ALIAS, **querysets) -> dict:
+    """Count several querysets in a single round trip.
+
+    Each queryset is compiled to SQL and wrapped in its own scalar
+    ``(SELECT COUNT(*) ...)`` so the database returns every count in one
+    row.
+    """
+    connection = connections[using]
+    names, selects, params = [], [], []
+    for name, queryset in querysets.items():
+        names.append(name)
+        try:
+            sql, query_params = (queryset.order_by().values("pk")
+                                 .query.sql_with_params())
+        except EmptyResultSet:
+            selects.append("0")
+            continue
+        alias = connection.ops.quote_name(f"{name}_rows")
+        selects.append(f"(SELECT COUNT(*) FROM ({sql}) {alias})")
+        params.extend(query_params)
+
+    if not selects:
+        return {}
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT " + ", ".join(selects), params)
+        row = cursor.fetchone()
+    return dict(zip(names, row))
+
+
+def status_key(status: str) -> str:
+    return f"tasks:status:{status}"
+
+
+def volunteer_key(user_id: int, suffix: str) -> str:
+    return f"volunteer:{user_id}:{suffix}"
+
+
+def tag_key(tag_id: int) -> str:
+    return f"tag:{tag_id}:tasks"
+
+
+def task_counter_keys(status: str, assigned_to_id: int | None) -> list:
+    keys = ["tasks", status_key(status)]
+    if assigned_to_id:
+        keys += [volunteer_key(assigned_to_id, "tasks"),
+                 volunteer_key(assigned_to_id, status_key(status))]
+    return keys
+
+
+def bump_counters(deltas: dict) -> None:
+    """Apply ``{key: delta}`` with one ``value = value + CASE ...`` update.
+
+    Missing keys are first inserted as zero with ``ignore_conflicts``, so
+    the cost is two queries however many keys change, and concurrent
+    writers still only ever add to the stored value.
+    """
+    deltas = {key: delta for key, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    StatCounter.objects.bulk_create(
+        [StatCounter(key=key, value=0) for key in deltas],
+        ignore_conflicts=True)
+    StatCounter.objects.filter(key__in=deltas).update(value=F("value") + Case(
+        *[When(key=key, then=Value(delta)) for key, delta in deltas.items()],
+        default=Value(0)))
+
+
+def read_counters(*keys) -> dict:
+    """Return the counters for ``keys``, missing ones as zero."""
+    values = dict(StatCounter.objects.filter(key__in=keys)
+                  .values_list("key", "value"))
+    return {key: values.get(key, 0) for key in keys}
+
+
+def compute_counters(apps=global_apps) -> Counter:
+    """Count everything the counters track straight from the tables."""
+    CustomUser = apps.get_model("tasks", "CustomUser")
+    Task = apps.get_model("tasks", "Task")
+    Category = apps.get_model("tasks", "Category")
+    Report = apps.get_model("tasks", "Report")
+
+    counters = Counter(count_querysets(
+        volunteers=CustomUser.objects.filter(role="volunteer"),
+        tasks=Task.objects.all(),
+        categories=Category.objects.all(),
+        reports=Report.objects.all(),
+    ))
+    task_groups = (Task.objects.order_by()
+                   .values_list("status", "assigned_to")
+                   .annotate(count=Count("id")))
+    for status, assigned_to_id, count in task_groups:
+        for key in task_counter_keys(status, assigned_to_id)[1:]:
+            counters[key] += count
+    report_groups = (Report.objects.order_by()
+                     .filter(author__isnull=False)
+                     .values_list("author")
+                     .annotate(count=Count("id")))
+    for author_id, count in report_groups:
+        counters[volunteer_key(author_id, "reports")] += count
+    tag_groups = (Task.tags.through.objects.order_by()
+                  .values_list("tag")
+                  .annotate(count=Count("id")))
+    for tag_id, count in tag_groups:
+        counters[tag_key(tag_id)] += count
+    return counters
+
+
+def rebuild_counters(apps=global_apps) -> int:
+    counter_model = apps.get_model("tasks", "StatCounter")
+    counters = compute_counters(apps)
+    with transaction.atomic():
+        counter_model.objects.all().delete()
+        counter_model.objects.bulk_create(
+            counter_model(key=key, value=value)
+            for key, value in counters.items() if value
+        )
+    bump_version("dashboard")
+    return len(counters)
+
+
+def verify_counters() -> list:
+    """Return ``(key, stored, expected)`` for every counter that is off."""
+    expected = compute_counters()
+    stored = dict(StatCounter.objects.values_list("key", "value"))
+    return [
+        (key, stored.get(key, 0), expected.get(key, 0))
+        for key in sorted(set(expected) | set(stored))
+        if stored.get(key, 0) != expected.get(key, 0)
+    ]
+
+
+def dashboard_counts() -> dict:
+    statuses = [status for status, _ in Task.STATUS_CHOICES]
+    counters = read_counters(*GLOBAL_KEYS,
+                             *(status_key(status) for status in statuses))
+    context = {f"num_{key}": counters[key] for key in GLOBAL_KEYS}
+    context["status_counts"] = [
+        {"status": status, "count": counters[status_key(status)]}
+        for status in statuses if counters[status_key(status)]
+    ]
+    return context
@@ -0,0 +1,139 @@
+"""Incremental sync from the change log.
+
+Every save or delete of a task or report appends a ``ChangeLogEntry``,
+so a client holding the token of the last entry it saw only reads the
+entries after it. Entries are resolved against the current rows: rows
+that are gone, or no longer visible to the user, come back as deleted.
+"""
+from collections import defaultdict
+from datetime import timedelta
+
+from django.apps import apps as global_apps
+from django.conf import settings
+from django.utils import timezone
+
+from tasks.models import ChangeLogEntry, Report, Task
+
+# Model name in the log -> the field whose volunteer sees the row.
+SYNCED_MODELS = {
+    "task": "assigned_to_id",
+    "report": "author_id",
+}
+
+TASK_FIELDS = {
+    "id": "id",
+    "title": "title",
+    "description": "description",
+    "status": "status",
+    "deadline": "deadline",
+    "category": "category__name",
+    "created_by": "created_by__username",
+    "assigned_to": "assigned_to__username",
+    "updated_at": "updated_at",
+}
+REPORT_FIELDS = {
+    "id": "id",
+    "task": "task_id",
+    "comment": "comment",
+    "author": "author__username",
+    "created_at": "created_at",
+    "updated_at": "updated_at",
+    "verified_by": "verified_by__username",
+    "verified_at": "verified_at",
+}
+
+
+def record_changes(model_name, rows, apps=global_apps):
+    """Log ``(object_id, volunteer_id)`` pairs as changed rows."""
+    entry_model = apps.get_model("tasks", "ChangeLogEntry")
+    now = timezone.now()
+    entry_model.objects.bulk_create(
+        entry_model(model=model_name, object_id=object_id, user_id=user_id,
+                    created_at=now)
+        for object_id, user_id in rows
+    )
+
+
+def backfill_changes(apps=global_apps, batch_size=5_000):
+    """Log every existing task and report, so token 0 means everything."""
+    for model_name, owner in SYNCED_MODELS.items():
+        model = apps.get_model("tasks", model_name)
+        rows = model.objects.order_by("pk").values_list("pk", owner)
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                record_changes(model_name, batch, apps)
+                batch = []
+        record_changes(model_name, batch, apps)
+
+
+def visible(queryset, user, owner):
+    if user.role == "volunteer":
+        return queryset.filter(**{owner: user.pk})
+    return queryset
+
+
+def fetch_rows(queryset, fields):
+    names = list(fields)
+    return [dict(zip(names, row))
+            for row in queryset.values_list(*fields.values())]
+
+
+def changes_since(user, since, limit=None):
+    """The changes after token ``since`` that ``user`` may see.
+
+    Entries younger than ``SYNC_SAFETY_LAG`` seconds are held back: ids
+    are handed out before commit, so a slow transaction can commit an
+    entry below a token a client has already moved past.
+
+    The lag is a heuristic, not a guarantee. ``created_at`` is stamped
+    when the entry is written, not when its transaction commits. A
+    writer that commits more than ``SYNC_SAFETY_LAG`` seconds later
+    leaves entries below tokens already handed out, and clients past
+    them never see those changes. Keep the lag above the longest write
+    transaction; a client can recover with a full sync from token 0.
+    """
+    limit = limit or settings.SYNC_PAGE_SIZE
+    cutoff = timezone.now() - timedelta(seconds=settings.SYNC_SAFETY_LAG)
+    entries = ChangeLogEntry.objects.filter(id__gt=since,
+                                            created_at__lte=cutoff)
+    if user.role == "volunteer":
+        entries = entries.filter(user=user)
+    page = list(entries.order_by("id")
+                .values_list("id", "model", "object_id")[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+
+    changed = defaultdict(set)
+    for _, model_name, object_id in page:
+        changed[model_name].add(object_id)
+
+    tasks = fetch_rows(
+        visible(Task.objects.filter(pk__in=changed["task"]), user,
+                SYNCED_MODELS["task"]).order_by("pk"),
+        TASK_FIELDS)
+    tags = defaultdict(list)
+    for task_id, name in (Task.tags.through.objects
+                          .filter(task_id__in=[row["id"] for row in tasks])
+                          .order_by("tag__name")
+                          .values_list("task_id", "tag__name")):
+        tags[task_id].append(name)
+    for row in tasks:
+        row["tags"] = tags[row["id"]]
+
+    reports = fetch_rows(
+        visible(Report.objects.filter(pk__in=changed["report"]), user,
+                SYNCED_MODELS["report"]).order_by("pk"),
+        REPORT_FIELDS)
+
+    return {
+        "token": page[-1][0] if page else since,
+        "has_more": has_more,
+        "tasks": tasks,
+        "deleted_tasks": sorted(changed["task"]
+                                - {row["id"] for row in tasks}),
+        "reports": reports,
+        "deleted_reports": sorted(changed["report"]
+                                  - {row["id"] for row in reports}),
+    }
@@ -3,10 +3,18 @@ from django.http import HttpRequest
 
 register = template.Library()
 
+# Page numbers and cursor tokens address pages in different ways, so
+# setting one of them drops the other from the query string.
+PAGINATION_PARAMS = ("page", "cursor")
+
 
 @register.simple_tag
 def query_transform(request: HttpRequest, **kwargs):
     updated = request.GET.copy()
+    if any(key in kwargs for key in PAGINATION_PARAMS):
+        for key in PAGINATION_PARAMS:
+            if key not in kwargs:
+                updated.pop(key, 0)
     for key, value in kwargs.items():
         if value is not None:
             updated[key] = value
@@ -12,7 +12,11 @@ from tasks.views import (index, CategoryListView,
                          TaskCreateView, TaskUpdateView, TaskDeleteView,
                          TagCreateView, TagUpdateView, TagDeleteView,
                          ReportCreateView, ReportUpdateView,
-                         ReportDeleteView)
+                         ReportDeleteView, VolunteerAutocompleteView,
+                         CoordinatorAutocompleteView, TagAutocompleteView,
+                         CategoryAutocompleteView, TaskExportView,
+                         ReportExportView, SyncView, TaskBulkCreateView,
+                         TaskBulkUpdateView, TaskImportView)
 
 
 urlpatterns = [
@@ -37,7 +41,13 @@ urlpatterns = [
          name="category-delete"),
     path("tasks/", TaskListView.as_view(), name="task-list"),
     path("tasks/<int:pk>/", TaskDetailView.as_view(), name="task-detail"),
+    path("tasks/export/", TaskExportView.as_view(), name="task-export"),
     path("tasks/create/", TaskCreateView.as_view(), name="task-create"),
+    path("tasks/bulk-create/", TaskBulkCreateView.as_view(),
+         name="task-bulk-create"),
+    path("tasks/bulk-update/", TaskBulkUpdateView.as_view(),
+         name="task-bulk-update"),
+    path("tasks/import/", TaskImportView.as_view(), name="task-import"),
     path("tasks/update/<int:pk>/", TaskUpdateView.as_view(),
          name="task-update"),
     path("tasks/delete/<int:pk>/", TaskDeleteView.as_view(),
@@ -50,6 +60,8 @@ urlpatterns = [
     path("reports/", ReportListView.as_view(), name="report-list"),
     path("reports/<int:pk>/", ReportDetailView.as_view(),
          name="report-detail"),
+    path("reports/export/", ReportExportView.as_view(),
+         name="report-export"),
     path("reports/create/", ReportCreateView.as_view(),
          name="report-create"),
     path("reports/update/<int:pk>/", ReportUpdateView.as_view(),
@@ -58,6 +70,15 @@ urlpatterns = [
          name="report-delete"),
     path("coordinator/", views.coordinator_index, name="coordinator-index"),
     path("volunteer/", views.volunteer_index, name="volunteer-index"),
+    path("sync/", SyncView.as_view(), name="sync"),
+    path("autocomplete/volunteers/", VolunteerAutocompleteView.as_view(),
+         name="autocomplete-volunteers"),
+    path("autocomplete/coordinators/", CoordinatorAutocompleteView.as_view(),
+         name="autocomplete-coordinators"),
+    path("autocomplete/tags/", TagAutocompleteView.as_view(),
+         name="autocomplete-tags"),
+    path("autocomplete/categories/", CategoryAutocompleteView.as_view(),
+         name="autocomplete-categories"),
 ]
 
 app_name = "tasks"
@@ -3,4 +3,7 @@ from .categories import *
 from .tasks import *
 from .tags import *
 from .reports import *
-from .indexes import *
\ No newline at end of file
+from .indexes import *
+from .autocomplete import *
+from .exports import *
+from .sync import *
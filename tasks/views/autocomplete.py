@@ -0,0 +1,83 @@
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.core.exceptions import ImproperlyConfigured
+from django.http import JsonResponse
+from django.views import View
+
+from tasks.caching import get_or_compute
+from tasks.mixins import CoordinatorRequiredMixin
+from tasks.models import Category, CustomUser, Tag
+
+
+class AutocompleteMixin:
+    """JSON options for ``AutocompleteSelect`` widgets.
+
+    Matches ``search_field`` of ``model`` rows narrowed by ``filters``, by
+    case-insensitive prefix, in field order and at most
+    ``AUTOCOMPLETE_LIMIT`` results, so the index on the field (and the
+    trigram index on Postgres) serves the lookup. Results are cached under
+    ``name`` until the next write to a model used for choices.
+    """
+    name = None
+    model = None
+    search_field = None
+    filters = {}
+
+    def get_queryset(self):
+        if self.model is None or self.search_field is None:
+            raise ImproperlyConfigured(
+                f"{type(self).__name__} needs a model and a search_field.")
+        return self.model._default_manager.filter(**self.filters)
+
+    def search(self, term):
+        queryset = self.get_queryset().order_by(self.search_field)
+        if term:
+            queryset = queryset.filter(
+                **{f"{self.search_field}__istartswith": term})
+        return [
+            {"id": pk, "text": text}
+            for pk, text in queryset.values_list(
+                "pk", self.search_field)[:settings.AUTOCOMPLETE_LIMIT]
+        ]
+
+    def get(self, request, *args, **kwargs):
+        term = request.GET.get("q", "").strip()
+        digest = hashlib.md5(term.lower().encode(),
+                             usedforsecurity=False).hexdigest()
+        results = get_or_compute(
+            "choices", f"autocomplete:{self.name}:{digest}",
+            lambda: self.search(term),
+            timeout=settings.CHOICES_CACHE_TIMEOUT,
+        )
+        return JsonResponse({"results": results})
+
+
+class VolunteerAutocompleteView(LoginRequiredMixin, CoordinatorRequiredMixin,
+                                AutocompleteMixin, View):
+    name = "volunteers"
+    model = CustomUser
+    search_field = "username"
+    filters = {"role": "volunteer"}
+
+
+class CoordinatorAutocompleteView(LoginRequiredMixin,
+                                  CoordinatorRequiredMixin,
+                                  AutocompleteMixin, View):
+    name = "coordinators"
+    model = CustomUser
+    search_field = "username"
+    filters = {"role": "coordinator"}
+
+
+class TagAutocompleteView(LoginRequiredMixin, AutocompleteMixin, View):
+    name = "tags"
+    model = Tag
+    search_field = "name"
+
+
+class CategoryAutocompleteView(LoginRequiredMixin, AutocompleteMixin, View):
+    name = "categories"
+    model = Category
+    search_field = "name"
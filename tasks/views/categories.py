@@ -4,13 +4,16 @@ from django.views import generic
 from django.views.generic import CreateView, UpdateView, DeleteView
 
 from tasks.forms import CategorySearchForm, CategoryForm
-from tasks.mixins import CoordinatorRequiredMixin
+from tasks.mixins import CoordinatorRequiredMixin, SuggestionMixin
 from tasks.models import Category
 
 
-class CategoryListView(LoginRequiredMixin, generic.ListView):
+class CategoryListView(LoginRequiredMixin, SuggestionMixin,
+                       generic.ListView):
     model = Category
     paginate_by = 5
+    suggest_param = "name"
+    suggest_field = "name"
 
     def get_context_data(self, **kwargs):
         context = super(CategoryListView, self).get_context_data(**kwargs)
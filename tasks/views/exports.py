@@ -0,0 +1,89 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404
+from django.views import View
+
+from tasks.exports import EXPORT_FORMATS, export_chunks, export_response
+from tasks.mixins import CoordinatorRequiredMixin
+from tasks.models import Task
+from tasks.views.reports import ReportListView
+from tasks.views.tasks import TaskListView
+
+
+class ExportView(View):
+    """Stream the rows of ``list_view`` with its search filters applied.
+
+    ``?format=`` is ``csv`` (the default) or ``ndjson`` and ``?gzip=1``
+    compresses the download. ``export_columns`` maps column names to
+    ``values_list`` lookups.
+    """
+    list_view = None
+    export_name = None
+    export_columns = {}
+
+    def get_export_queryset(self):
+        view = self.list_view()
+        view.setup(self.request, *self.args, **self.kwargs)
+        return view.get_queryset()
+
+    def get_export_chunks(self, queryset):
+        return export_chunks(queryset, self.export_columns,
+                             settings.EXPORT_CHUNK_SIZE)
+
+    def get(self, request, *args, **kwargs):
+        export_format = request.GET.get("format", "csv")
+        if export_format not in EXPORT_FORMATS:
+            raise Http404(f"Unknown export format: {export_format}")
+        chunks = self.get_export_chunks(self.get_export_queryset())
+        return export_response(chunks, list(self.export_columns),
+                               export_format, self.export_name,
+                               compress=request.GET.get("gzip") == "1")
+
+
+class TaskExportView(LoginRequiredMixin, CoordinatorRequiredMixin,
+                     ExportView):
+    list_view = TaskListView
+    export_name = "tasks"
+    export_columns = {
+        "id": "id",
+        "title": "title",
+        "description": "description",
+        "status": "status",
+        "deadline": "deadline",
+        "category": "category__name",
+        "created_by": "created_by__username",
+        "assigned_to": "assigned_to__username",
+        "tags": None,
+    }
+
+    def get_export_chunks(self, queryset):
+        # One query per chunk for the tags instead of a row per tag.
+        for chunk in super().get_export_chunks(queryset):
+            tags = defaultdict(list)
+            for task_id, name in (
+                Task.tags.through.objects
+                .filter(task_id__in=[row["id"] for row in chunk])
+                .order_by("tag__name")
+                .values_list("task_id", "tag__name")
+            ):
+                tags[task_id].append(name)
+            for row in chunk:
+                row["tags"] = ";".join(tags[row["id"]])
+            yield chunk
+
+
+class ReportExportView(LoginRequiredMixin, CoordinatorRequiredMixin,
+                       ExportView):
+    list_view = ReportListView
+    export_name = "reports"
+    export_columns = {
+        "id": "id",
+        "task": "task__title",
+        "author": "author__username",
+        "comment": "comment",
+        "created_at": "created_at",
+        "verified_by": "verified_by__username",
+        "verified_at": "verified_at",
+    }
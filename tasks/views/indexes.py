@@ -1,10 +1,10 @@
 from django.contrib.auth.decorators import login_required
 from django.core.exceptions import PermissionDenied
-from django.db.models import Count
 from django.http import HttpRequest, HttpResponse
 from django.shortcuts import redirect, render
 
-from tasks.models import CustomUser, Task, Category, Report
+from tasks.caching import get_or_compute
+from tasks.stats import dashboard_counts, read_counters
 
 
 @login_required
@@ -19,36 +19,22 @@ def coordinator_index(request: HttpRequest) -> HttpResponse:
     if request.user.role != "coordinator":
         raise PermissionDenied
 
-    num_volunteers = CustomUser.objects.filter(role="volunteer").count()
-    num_tasks = Task.objects.count()
-    num_categories = Category.objects.count()
-    num_reports = Report.objects.count()
-
-    status_counts = (Task.objects.values("status")
-                     .annotate(count=Count("status"))
-                     .order_by()
-                )
-
-    context = {
-        "num_volunteers": num_volunteers,
-        "num_tasks": num_tasks,
-        "num_categories": num_categories,
-        "num_reports": num_reports,
-        "status_counts": list(status_counts),
-    }
+    context = get_or_compute("dashboard", "coordinator", dashboard_counts)
     return render(request, "tasks/index_coordinator.html", context=context)
 
 
 @login_required
 def volunteer_index(request: HttpRequest) -> HttpResponse:
     user = request.user
-    num_tasks = Task.objects.count()
-    num_categories = Category.objects.count()
+    counters = get_or_compute(
+        "dashboard", "volunteer",
+        lambda: read_counters("tasks", "categories"),
+    )
 
     context = {
         "user": user,
-        "num_tasks": num_tasks,
-        "num_categories": num_categories,
+        "num_tasks": counters["tasks"],
+        "num_categories": counters["categories"],
     }
 
     return render(request, "tasks/index_volunteer.html", context=context)
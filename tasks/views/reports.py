@@ -1,19 +1,41 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import PermissionDenied
+from django.db import transaction
 from django.urls import reverse_lazy
 from django.utils import timezone
 from django.views import generic
 from django.views.generic import CreateView, UpdateView, DeleteView
 
+from tasks.filters import date_range_q
 from tasks.forms import ReportSearchForm, VolunteerReportForm, CoordinatorReportForm
-from tasks.mixins import CoordinatorRequiredMixin
-from tasks.models import Report
+from tasks.mixins import (ConditionalGetMixin, CoordinatorRequiredMixin,
+                          CursorPaginationMixin, SuggestionMixin)
+from tasks.models import CustomUser, Report
 from tasks.notifications import notify_report_verified
 
 
-class ReportListView(LoginRequiredMixin, generic.ListView):
+class ReportListView(LoginRequiredMixin, ConditionalGetMixin,
+                     CursorPaginationMixin, SuggestionMixin,
+                     generic.ListView):
     model = Report
     paginate_by = 5
+    cursor_key = "created_at"
+    cursor_descending = True
+    # Deleted rows and renamed labels only show in the ETag.
+    send_last_modified = False
+    suggest_param = "author"
+    suggest_field = "username"
+    # The columns report_list.html renders.
+    list_fields = ("comment", "created_at", "verified_at",
+                   "author", "author__username",
+                   "task", "task__title",
+                   "verified_by", "verified_by__username")
+
+    def get_suggestion_queryset(self):
+        if self.request.user.role == "volunteer":
+            return CustomUser.objects.filter(pk=self.request.user.pk)
+        return CustomUser.objects.filter(
+            id__in=Report.objects.values("author"))
 
     def get_context_data(
         self, *, object_list=..., **kwargs
@@ -26,6 +48,7 @@ class ReportListView(LoginRequiredMixin, generic.ListView):
         queryset = (
             Report.objects
             .select_related("author", "task", "verified_by")
+            .only(*self.list_fields)
         )
         if self.request.user.role == "volunteer":
             queryset = queryset.filter(author=self.request.user)
@@ -35,19 +58,32 @@ class ReportListView(LoginRequiredMixin, generic.ListView):
             author_text = form.cleaned_data.get("author")
             author_filter = form.cleaned_data.get("author_filter")
             created_filter = form.cleaned_data.get("created_filter")
+            created_from = form.cleaned_data.get("created_from")
+            created_to = form.cleaned_data.get("created_to")
+            unverified = form.cleaned_data.get("unverified")
             if author_text:
                 queryset = queryset.filter(
                     author__username__icontains=author_text)
             if author_filter:
                 queryset = queryset.filter(author=author_filter)
             if created_filter:
-                queryset = queryset.filter(created_at__date=created_filter)
+                queryset = queryset.filter(
+                    date_range_q("created_at", created_filter, created_filter))
+            if created_from or created_to:
+                queryset = queryset.filter(
+                    date_range_q("created_at", created_from, created_to))
+            if unverified:
+                queryset = queryset.filter(verified_at__isnull=True)
         return queryset
 
 
-class ReportDetailView(LoginRequiredMixin, generic.DetailView):
+class ReportDetailView(LoginRequiredMixin, ConditionalGetMixin,
+                       generic.DetailView):
     model = Report
 
+    def get_validator_queryset(self, queryset):
+        return queryset.filter(pk=self.kwargs["pk"])
+
     def get_queryset(self):
         queryset = (
             Report.objects
@@ -79,6 +115,7 @@ class ReportUpdateView(LoginRequiredMixin,
     form_class = CoordinatorReportForm
     success_url = reverse_lazy("tasks:report-list")
 
+    @transaction.atomic
     def form_valid(self, form):
         form.instance.verified_by = self.request.user
         form.instance.verified_at = timezone.now()
@@ -0,0 +1,22 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.http import Http404, JsonResponse
+from django.views import View
+
+from tasks.sync import changes_since
+
+
+class SyncView(LoginRequiredMixin, View):
+    """Tasks and reports changed since ``?since=<token>``, in pages.
+
+    Clients start from token 0, store the returned ``token`` and ask again
+    while ``has_more`` is true.
+    """
+
+    def get(self, request, *args, **kwargs):
+        try:
+            since = int(request.GET.get("since", 0))
+        except ValueError:
+            raise Http404("Invalid change token.")
+        if since < 0:
+            raise Http404("Invalid change token.")
+        return JsonResponse(changes_since(request.user, since))
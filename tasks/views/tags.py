@@ -4,13 +4,15 @@ from django.views import generic
 from django.views.generic import CreateView, UpdateView, DeleteView
 
 from tasks.forms import TagSearchForm, TagForm
-from tasks.mixins import CoordinatorRequiredMixin
+from tasks.mixins import CoordinatorRequiredMixin, SuggestionMixin
 from tasks.models import Tag
 
 
-class TagListView(LoginRequiredMixin, generic.ListView):
+class TagListView(LoginRequiredMixin, SuggestionMixin, generic.ListView):
     model = Tag
     paginate_by = 5
+    suggest_param = "name"
+    suggest_field = "name"
 
     def get_context_data(
         self, *, object_list=..., **kwargs
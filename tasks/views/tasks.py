@@ -1,56 +1,105 @@
-from django.contrib.auth.mixins import LoginRequiredMixin
-from django.urls import reverse_lazy
-from django.views import generic
-from django.views.generic import CreateView, DeleteView, UpdateView
+import io
+import json
 
-from tasks.forms import TaskSearchForm, TaskForm
-from tasks.mixins import CoordinatorRequiredMixin
+from django.conf import settings
+from django.contrib import messages
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
+from django.db.models.functions import Left
+from django.http import JsonResponse
+from django.shortcuts import redirect
+from django.urls import reverse, reverse_lazy
+from django.utils.http import url_has_allowed_host_and_scheme
+from django.views import View, generic
+from django.views.generic import CreateView, DeleteView, FormView, UpdateView
+
+from tasks.bulk import create_tasks, update_tasks, validate_tasks
+from tasks.caching import get_or_compute
+from tasks.filters import apply_task_filters, filters_digest, task_facets
+from tasks.forms import (BulkActionForm, TaskImportForm, TaskSearchForm,
+                         TaskForm)
+from tasks.imports import import_tasks
+from tasks.mixins import (ConditionalGetMixin, CoordinatorRequiredMixin,
+                          CountlessPaginationMixin, CursorPaginationMixin)
 from tasks.models import Task
 from tasks.notifications import notify_task_assigned
 
 
-class TaskListView(LoginRequiredMixin, generic.ListView):
+class TaskListView(LoginRequiredMixin, ConditionalGetMixin,
+                   CursorPaginationMixin, CountlessPaginationMixin,
+                   generic.ListView):
     model = Task
     paginate_by = 5
+    cursor_key = "deadline"
+    # Deleted rows and renamed labels only show in the ETag.
+    send_last_modified = False
+    # The columns task_list.html renders; the foreign keys themselves must
+    # stay loaded for select_related to follow them.
+    list_fields = ("title", "status", "deadline",
+                   "category", "category__name",
+                   "created_by", "created_by__username",
+                   "assigned_to", "assigned_to__username")
+    # Enough of the description for the truncated cell and its tooltip.
+    description_preview_length = 200
+
+    def get_cursor_key(self):
+        # Search results are ordered by rank, which has no usable keyset.
+        if self.request.GET.get("title", "").strip():
+            return None
+        return self.cursor_key
 
     def get_context_data(
         self, *, object_list=..., **kwargs
     ):
         context = super(TaskListView, self).get_context_data(**kwargs)
-        context["search_form"] = TaskSearchForm(self.request.GET)
+        form = self.search_form
+        if form.is_valid():
+            context["facets"] = self.get_facets(form.cleaned_data)
+            form.show_counts(context["facets"])
+        context["search_form"] = form
+        if self.request.user.role == "coordinator":
+            context["bulk_form"] = BulkActionForm()
         return context
 
-    def get_queryset(self):
+    def get_base_queryset(self):
         queryset = (
             Task.objects
             .select_related("category", "created_by", "assigned_to")
-            .prefetch_related("tags")
         )
         if self.request.user.role == "volunteer":
             queryset = queryset.filter(assigned_to=self.request.user)
+        return queryset
 
-        form = TaskSearchForm(self.request.GET)
-        if form.is_valid():
-            title = form.cleaned_data.get("title")
-            status = form.cleaned_data.get("status")
-            category = form.cleaned_data.get("category")
-            tag = form.cleaned_data.get("tags")
-            volunteer = form.cleaned_data.get("volunteer")
-            if title:
-                queryset = queryset.filter(title__icontains=title)
-            if status:
-                queryset = queryset.filter(status=status)
-            if category:
-                queryset = queryset.filter(category=category)
-            if tag:
-                queryset = queryset.filter(tags=tag)
-            if volunteer:
-                queryset = queryset.filter(assigned_to=volunteer)
+    def get_facets(self, filters):
+        user = self.request.user
+        scope = user.pk if user.role == "volunteer" else "all"
+        return get_or_compute(
+            "counts", f"facets:{scope}:{filters_digest(filters)}",
+            lambda: task_facets(self.get_base_queryset(), filters),
+            timeout=settings.FACET_CACHE_TIMEOUT,
+        )
+
+    def get_queryset(self):
+        self.search_form = TaskSearchForm(self.request.GET)
+        queryset = (
+            self.get_base_queryset()
+            .only(*self.list_fields)
+            .annotate(description_preview=Left(
+                "description", self.description_preview_length))
+        )
+        if self.search_form.is_valid():
+            queryset = apply_task_filters(queryset,
+                                          self.search_form.cleaned_data)
         return queryset
 
 
-class TaskDetailView(LoginRequiredMixin, generic.DetailView):
+class TaskDetailView(LoginRequiredMixin, ConditionalGetMixin,
+                     generic.DetailView):
     model = Task
+    validator_versions = ("choices",)
+
+    def get_validator_queryset(self, queryset):
+        return queryset.filter(pk=self.kwargs["pk"])
 
     def get_queryset(self):
         queryset = (
@@ -68,17 +117,76 @@ class TaskCreateView(LoginRequiredMixin, CoordinatorRequiredMixin, CreateView):
     form_class = TaskForm
     success_url = reverse_lazy("tasks:task-list")
 
+    @transaction.atomic
     def form_valid(self, form):
         response = super().form_valid(form)
         notify_task_assigned(self.object)
         return response
 
 
+class TaskBulkCreateView(LoginRequiredMixin, CoordinatorRequiredMixin, View):
+    """Create the tasks in a ``{"tasks": [...]}`` JSON body at once.
+
+    Nothing is written unless every row is valid; see ``tasks.bulk``.
+    """
+
+    def post(self, request, *args, **kwargs):
+        try:
+            payload = json.loads(request.body)
+        except ValueError:
+            return JsonResponse({"errors": {"tasks": ["Invalid JSON."]}},
+                                status=400)
+        rows = payload.get("tasks") if isinstance(payload, dict) else None
+        cleaned, errors = validate_tasks(rows)
+        if errors:
+            return JsonResponse({"errors": errors}, status=400)
+        tasks = create_tasks(cleaned, created_by=request.user)
+        return JsonResponse({"created": [task.pk for task in tasks]},
+                            status=201)
+
+
+class TaskImportView(LoginRequiredMixin, CoordinatorRequiredMixin, FormView):
+    """Upload a CSV file of tasks, see ``tasks.imports``."""
+    form_class = TaskImportForm
+    template_name = "tasks/task_import.html"
+    errors_shown = 100
+
+    def form_valid(self, form):
+        upload = form.cleaned_data["file"]
+        lines = io.TextIOWrapper(upload.file, encoding="utf-8-sig",
+                                 newline="")
+        result = import_tasks(lines, created_by=self.request.user)
+        return self.render_to_response(self.get_context_data(
+            form=self.form_class(), result=result,
+            errors=result.errors[:self.errors_shown]))
+
+
+class TaskBulkUpdateView(LoginRequiredMixin, CoordinatorRequiredMixin, View):
+    """Apply a ``BulkActionForm`` to the selected tasks in one UPDATE."""
+
+    def post(self, request, *args, **kwargs):
+        form = BulkActionForm(request.POST)
+        if form.is_valid():
+            count = update_tasks(form.cleaned_data["tasks"], form.values())
+            messages.success(request, f"Updated {count} task(s).")
+        else:
+            messages.error(request, "No tasks were updated: " + " ".join(
+                f"{field}: {error}" for field, errors in form.errors.items()
+                for error in errors))
+        next_url = request.POST.get("next")
+        if not url_has_allowed_host_and_scheme(
+                next_url, allowed_hosts={request.get_host()},
+                require_https=request.is_secure()):
+            next_url = reverse("tasks:task-list")
+        return redirect(next_url)
+
+
 class TaskUpdateView(LoginRequiredMixin, CoordinatorRequiredMixin, UpdateView):
     model = Task
     form_class = TaskForm
     success_url = reverse_lazy("tasks:task-list")
 
+    @transaction.atomic
     def form_valid(self, form):
         assigned_changed = "assigned_to" in form.changed_data
         response = super().form_valid(form)
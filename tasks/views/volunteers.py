@@ -4,15 +4,26 @@ from django.views import generic
 from django.views.generic import CreateView, UpdateView, DeleteView
 
 from tasks.forms import CustomUserSearchForm, CustomUserCreateForm, CustomUserUpdateForm
-from tasks.mixins import CoordinatorRequiredMixin
+from tasks.mixins import (CoordinatorRequiredMixin, CountlessPaginationMixin,
+                          SuggestionMixin)
 from tasks.models import CustomUser
+from tasks.stats import read_counters, status_key, volunteer_key
 
 
-class VolunteerListView(LoginRequiredMixin, generic.ListView):
+class VolunteerListView(LoginRequiredMixin, CountlessPaginationMixin,
+                        SuggestionMixin, generic.ListView):
     model = CustomUser
     template_name = "tasks/volunteer_list.html"
     context_object_name = "volunteer_list"
     paginate_by = 5
+    suggest_param = "username"
+    suggest_field = "username"
+    # The columns volunteer_list.html renders; no password hashes or images.
+    list_fields = ("username", "first_name", "last_name", "email",
+                   "phone_number", "city")
+
+    def get_suggestion_queryset(self):
+        return CustomUser.objects.filter(role="volunteer")
 
     def get_context_data(self, **kwargs):
         context = super(VolunteerListView, self).get_context_data(**kwargs)
@@ -22,8 +33,14 @@ class VolunteerListView(LoginRequiredMixin, generic.ListView):
         )
         return context
 
+    def get_total_count(self, queryset):
+        if not self.request.GET.get("username"):
+            return read_counters("volunteers")["volunteers"]
+        return None
+
     def get_queryset(self):
-        queryset = CustomUser.objects.filter(role="volunteer")
+        queryset = (CustomUser.objects.filter(role="volunteer")
+                    .only(*self.list_fields))
         form = CustomUserSearchForm(self.request.GET)
         if form.is_valid():
             username = form.cleaned_data.get("username")
@@ -38,22 +55,23 @@ class VolunteerDetailView(LoginRequiredMixin, generic.DetailView):
     context_object_name = "volunteer"
 
     def get_queryset(self):
-        return (
-            CustomUser.objects
-            .filter(role="volunteer")
-            .prefetch_related("assigned_tasks", "reports_authored")
-        )
+        return CustomUser.objects.filter(role="volunteer")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        volunteer = self.get_object()
-
-        tasks = volunteer.assigned_tasks.all()
-        context["tasks_count"] = tasks.count()
-        context["reports_count"] = volunteer.reports_authored.count()
-        context["tasks_completed"] = tasks.filter(status="completed").count()
-        context["tasks_in_progress"] = tasks.filter(
-            status="in_progress").count()
+        volunteer = self.object
+
+        keys = {
+            "tasks_count": volunteer_key(volunteer.pk, "tasks"),
+            "reports_count": volunteer_key(volunteer.pk, "reports"),
+            "tasks_completed": volunteer_key(volunteer.pk,
+                                             status_key("completed")),
+            "tasks_in_progress": volunteer_key(volunteer.pk,
+                                               status_key("in_progress")),
+        }
+        counters = read_counters(*keys.values())
+        for name, key in keys.items():
+            context[name] = counters[key]
 
         return context
 
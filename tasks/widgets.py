@@ -0,0 +1,45 @@
+from django import forms
+from django.urls import reverse
+
+
+class AutocompleteSelect(forms.Select):
+    """A ``<select>`` that renders only the selected options.
+
+    ``autocomplete.js`` adds a search box that loads the other options from
+    the JSON endpoint named by ``url_name``, so the page never carries the
+    whole table and rendering never evaluates the field's queryset.
+    """
+
+    def __init__(self, url_name, attrs=None):
+        super().__init__(attrs)
+        self.url_name = url_name
+
+    def build_attrs(self, base_attrs, extra_attrs=None):
+        attrs = super().build_attrs(base_attrs, extra_attrs)
+        attrs["data-autocomplete-url"] = reverse(self.url_name)
+        return attrs
+
+    def selected_choices(self, choices, value):
+        field = choices.field
+        if field.empty_label is not None:
+            yield ("", field.empty_label)
+        pks = [pk for pk in value if str(pk).isdigit()]
+        if not pks:
+            return
+        for obj in choices.queryset.filter(pk__in=pks):
+            label = field.label_from_instance(obj)
+            if hasattr(field, "label_from_choice"):
+                label = field.label_from_choice(obj.pk, label)
+            yield (obj.pk, label)
+
+    def optgroups(self, name, value, attrs=None):
+        choices = self.choices
+        self.choices = list(self.selected_choices(choices, value))
+        try:
+            return super().optgroups(name, value, attrs)
+        finally:
+            self.choices = choices
+
+
+class AutocompleteSelectMultiple(AutocompleteSelect, forms.SelectMultiple):
+    pass
@@ -0,0 +1,99 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tasks.forms import TaskForm, TaskSearchForm
+from tasks.models import Category, Tag, Task
+
+
+class AutocompleteViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user_model = get_user_model()
+        user_model.objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        user_model.objects.create_user(
+            username="volunteer", password="test password", role="volunteer")
+        for name in ("anna", "Andrew", "bob"):
+            user_model.objects.create_user(username=name, role="volunteer")
+        Tag.objects.create(name="Garden")
+        Tag.objects.create(name="Food")
+
+    def get(self, name, q=""):
+        return self.client.get(reverse(f"tasks:autocomplete-{name}"),
+                               {"q": q})
+
+    def test_volunteers_match_by_prefix(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.get("volunteers", "an")
+        self.assertEqual([row["text"] for row in response.json()["results"]],
+                         ["Andrew", "anna"])
+
+    def test_coordinators_only_lists_coordinators(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.get("coordinators")
+        self.assertEqual([row["text"] for row in response.json()["results"]],
+                         ["coordinator"])
+
+    @override_settings(AUTOCOMPLETE_LIMIT=2)
+    def test_results_are_limited(self):
+        self.client.login(username="coordinator", password="test password")
+        self.assertEqual(len(self.get("volunteers").json()["results"]), 2)
+
+    def test_volunteers_need_a_coordinator(self):
+        self.client.login(username="volunteer", password="test password")
+        self.assertEqual(self.get("volunteers").status_code, 403)
+        self.assertEqual(
+            self.get("tags", "gar").json()["results"][0]["text"], "Garden")
+
+    def test_report_list_offers_the_picker_to_coordinators(self):
+        url = reverse("tasks:autocomplete-volunteers")
+        self.client.login(username="volunteer", password="test password")
+        self.assertNotContains(self.client.get(reverse("tasks:report-list")),
+                               url)
+        self.client.login(username="coordinator", password="test password")
+        self.assertContains(self.client.get(reverse("tasks:report-list")),
+                            url)
+
+    def test_cached_until_a_tag_changes(self):
+        self.client.login(username="volunteer", password="test password")
+        self.get("tags", "f")
+        with self.assertNumQueries(2):  # session and user only
+            self.get("tags", "f")
+        Tag.objects.create(name="Fundraising")
+        results = self.get("tags", "f").json()["results"]
+        names = [row["text"] for row in results]
+        self.assertEqual(names, ["Food", "Fundraising"])
+
+
+class AutocompleteWidgetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        user_model = get_user_model()
+        self.volunteers = [
+            user_model.objects.create_user(username=f"volunteer{i}",
+                                           role="volunteer")
+            for i in range(5)
+        ]
+        self.category = Category.objects.create(name="Outdoor")
+        Category.objects.create(name="Indoor")
+
+    def test_renders_only_the_selected_option(self):
+        task = Task.objects.create(title="Task", category=self.category,
+                                   assigned_to=self.volunteers[2])
+        html = str(TaskForm(instance=task)["assigned_to"])
+        self.assertIn("data-autocomplete-url", html)
+        self.assertIn("volunteer2", html)
+        self.assertNotIn("volunteer1", html)
+        self.assertNotIn("Indoor", str(TaskForm(instance=task)["category"]))
+
+    def test_unbound_form_renders_without_queries(self):
+        with self.assertNumQueries(0):
+            str(TaskSearchForm()["volunteer"])
+
+    def test_invalid_value_still_renders(self):
+        form = TaskSearchForm({"volunteer": "nope"})
+        self.assertFalse(form.is_valid())
+        self.assertIn("All volunteers", str(form["volunteer"]))
@@ -0,0 +1,180 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from tasks.models import Category, ChangeLogEntry, OutboxEmail, Tag, Task
+from tasks.stats import verify_counters
+
+
+class BulkCreateTest(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.coordinator = user_model.objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        self.volunteers = [
+            user_model.objects.create_user(
+                username=f"volunteer{i}", password="test password",
+                role="volunteer", email=f"volunteer{i}@example.com")
+            for i in range(2)
+        ]
+        self.category = Category.objects.create(name="Relief")
+        self.tags = [Tag.objects.create(name="water"),
+                     Tag.objects.create(name="food")]
+        self.client.login(username="coordinator", password="test password")
+
+    def rows(self, count):
+        return [{
+            "title": f"Task {i}",
+            "deadline": "2026-11-01T10:00",
+            "category": self.category.pk,
+            "assigned_to": self.volunteers[i % 2].pk,
+            "tags": [tag.pk for tag in self.tags],
+        } for i in range(count)]
+
+    def post(self, rows):
+        return self.client.post(reverse("tasks:task-bulk-create"),
+                                json.dumps({"tasks": rows}),
+                                content_type="application/json")
+
+    def test_creates_tasks_with_tags(self):
+        response = self.post(self.rows(4))
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(len(response.json()["created"]), 4)
+        task = Task.objects.get(title="Task 1")
+        self.assertEqual(task.created_by, self.coordinator)
+        self.assertEqual(task.status, "active")
+        self.assertEqual(set(task.tags.all()), set(self.tags))
+        self.assertEqual(verify_counters(), [])
+        self.assertEqual(ChangeLogEntry.objects.filter(model="task").count(),
+                         4)
+
+    def test_one_email_per_volunteer(self):
+        self.post(self.rows(6))
+        emails = OutboxEmail.objects.order_by("to_email")
+        self.assertEqual([email.subject for email in emails],
+                         ["You have been assigned 3 new tasks"] * 2)
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        self.post(self.rows(2))  # creates the counter rows
+        counts = []
+        for size in (2, 40):
+            with CaptureQueriesContext(connection) as queries:
+                self.post(self.rows(size))
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_invalid_rows_write_nothing(self):
+        rows = self.rows(3)
+        rows[1]["title"] = ""
+        rows[2]["tags"] = [self.tags[0].pk, 999]
+        response = self.post(rows)
+        self.assertEqual(response.status_code, 400)
+        errors = response.json()["errors"]
+        self.assertEqual(set(errors), {"1", "2"})
+        self.assertIn("tags", errors["2"])
+        self.assertFalse(Task.objects.exists())
+
+    def test_rejects_coordinators_as_assignees(self):
+        rows = self.rows(1)
+        rows[0]["assigned_to"] = self.coordinator.pk
+        response = self.post(rows)
+        self.assertIn("assigned_to", response.json()["errors"]["0"])
+
+    def test_bad_payload(self):
+        response = self.client.post(reverse("tasks:task-bulk-create"),
+                                    "not json",
+                                    content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.post([]).status_code, 400)
+
+    def test_coordinators_only(self):
+        self.client.login(username="volunteer0", password="test password")
+        self.assertEqual(self.post(self.rows(1)).status_code, 403)
+
+
+class BulkUpdateTest(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.coordinator = user_model.objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        self.alice, self.bob = (
+            user_model.objects.create_user(
+                username=name, password="test password", role="volunteer",
+                email=f"{name}@example.com")
+            for name in ("alice", "bob"))
+        self.tasks = [
+            Task.objects.create(title=f"Task {i}",
+                                assigned_to=self.alice if i < 2 else None)
+            for i in range(4)
+        ]
+        self.client.login(username="coordinator", password="test password")
+
+    def post(self, data, **extra):
+        data = {"tasks": [task.pk for task in self.tasks], **data}
+        return self.client.post(reverse("tasks:task-bulk-update"), data,
+                                **extra)
+
+    def test_status_in_one_update(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.post({"action": "status",
+                                  "status": "completed"})
+        updates = [query for query in queries.captured_queries
+                   if query["sql"].startswith('UPDATE "tasks_task"')]
+        self.assertEqual(len(updates), 1)
+        self.assertRedirects(response, reverse("tasks:task-list"))
+        self.assertEqual(
+            set(Task.objects.values_list("status", flat=True)),
+            {"completed"})
+        self.assertEqual(verify_counters(), [])
+
+    def test_reassign_notifies_only_changed_assignees(self):
+        self.tasks[0].assigned_to = self.bob
+        self.tasks[0].save()
+        OutboxEmail.objects.all().delete()
+        self.post({"action": "assign", "assigned_to": self.bob.pk})
+        self.assertEqual(
+            set(Task.objects.values_list("assigned_to", flat=True)),
+            {self.bob.pk})
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.to_email, "bob@example.com")
+        self.assertEqual(email.subject, "You have been assigned 3 new tasks")
+        self.assertEqual(verify_counters(), [])
+        self.assertTrue(ChangeLogEntry.objects.filter(
+            user=self.alice, object_id=self.tasks[1].pk).exists())
+
+    def test_unassign(self):
+        self.post({"action": "assign", "assigned_to": ""})
+        self.assertFalse(Task.objects.filter(
+            assigned_to__isnull=False).exists())
+        self.assertFalse(OutboxEmail.objects.exists())
+        self.assertEqual(verify_counters(), [])
+
+    def test_set_deadline_and_return_to_the_filtered_list(self):
+        next_url = reverse("tasks:task-list") + "?status=active"
+        response = self.post({"action": "deadline",
+                              "deadline": "2026-12-01T09:00",
+                              "next": next_url})
+        self.assertRedirects(response, next_url)
+        self.assertFalse(Task.objects.filter(deadline__isnull=True).exists())
+
+    def test_invalid_action_updates_nothing(self):
+        response = self.post({"action": "status", "status": ""},
+                             follow=True)
+        self.assertContains(response, "No tasks were updated")
+        self.assertFalse(Task.objects.exclude(status="active").exists())
+
+    def test_external_next_is_ignored(self):
+        response = self.post({"action": "status", "status": "completed",
+                              "next": "https://example.com/"})
+        self.assertRedirects(response, reverse("tasks:task-list"))
+
+    def test_coordinators_only(self):
+        self.client.login(username="alice", password="test password")
+        response = self.post({"action": "status", "status": "completed"})
+        self.assertEqual(response.status_code, 403)
@@ -0,0 +1,60 @@
+import tempfile
+from unittest.mock import Mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from tasks.caching import bump_version, get_or_compute, get_version
+
+
+class VersionedCacheMixin:
+    def setUp(self):
+        cache.clear()
+
+    def test_value_is_cached_per_version(self):
+        compute = Mock(return_value={"num_tasks": 1})
+        self.assertEqual(get_or_compute("test", "stats", compute),
+                         {"num_tasks": 1})
+        get_or_compute("test", "stats", compute)
+        self.assertEqual(compute.call_count, 1)
+
+        bump_version("test")
+        compute.return_value = {"num_tasks": 2}
+        self.assertEqual(get_or_compute("test", "stats", compute),
+                         {"num_tasks": 2})
+        self.assertEqual(compute.call_count, 2)
+
+    def test_bump_changes_version(self):
+        version = get_version("test")
+        bump_version("test")
+        self.assertGreater(get_version("test"), version)
+
+    def test_locked_rebuild_serves_previous_value(self):
+        get_or_compute("test", "stats", lambda: "old")
+        bump_version("test")
+        key = f"tasks:test:stats:{get_version('test')}"
+        cache.add(f"{key}:lock", True)
+        compute = Mock(return_value="new")
+        self.assertEqual(get_or_compute("test", "stats", compute), "old")
+        compute.assert_not_called()
+
+    @override_settings(CACHE_LOCK_TIMEOUT=0.1)
+    def test_locked_rebuild_without_previous_value_computes(self):
+        key = f"tasks:test:stats:{get_version('test')}"
+        cache.add(f"{key}:lock", True)
+        self.assertEqual(get_or_compute("test", "stats", lambda: "new"),
+                         "new")
+
+
+class LocMemVersionedCacheTest(VersionedCacheMixin, TestCase):
+    pass
+
+
+@override_settings(CACHES={
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": tempfile.mkdtemp(),
+    }
+})
+class FileBasedVersionedCacheTest(VersionedCacheMixin, TestCase):
+    pass
@@ -0,0 +1,127 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from tasks.models import Category, Report, StatCounter, Tag, Task
+from tasks.stats import bump_counters, read_counters, verify_counters
+
+
+class StatCounterSignalsTest(TestCase):
+    def setUp(self):
+        self.volunteer1 = get_user_model().objects.create_user(
+            username="volunteer1",
+            password="test password",
+            role="volunteer",
+        )
+        self.volunteer2 = get_user_model().objects.create_user(
+            username="volunteer2",
+            password="test password",
+            role="volunteer",
+        )
+        self.tag1 = Tag.objects.create(name="urgent")
+        self.tag2 = Tag.objects.create(name="medicine")
+
+    def assertCountersValid(self):
+        self.assertEqual(verify_counters(), [])
+
+    def test_task_create_and_status_change(self):
+        task = Task.objects.create(title="test task",
+                                   assigned_to=self.volunteer1)
+        task.status = "completed"
+        task.save()
+        counters = read_counters(
+            "tasks", "tasks:status:active", "tasks:status:completed",
+            f"volunteer:{self.volunteer1.pk}:tasks:status:completed",
+        )
+        self.assertEqual(list(counters.values()), [1, 0, 1, 1])
+        self.assertCountersValid()
+
+    def test_task_reassign_and_delete(self):
+        task = Task.objects.create(title="test task",
+                                   assigned_to=self.volunteer1)
+        task.assigned_to = self.volunteer2
+        task.save()
+        self.assertEqual(
+            read_counters(f"volunteer:{self.volunteer1.pk}:tasks",
+                          f"volunteer:{self.volunteer2.pk}:tasks"),
+            {f"volunteer:{self.volunteer1.pk}:tasks": 0,
+             f"volunteer:{self.volunteer2.pk}:tasks": 1})
+        task.delete()
+        self.assertEqual(read_counters("tasks")["tasks"], 0)
+        self.assertCountersValid()
+
+    def test_deferred_task_update(self):
+        Task.objects.create(title="test task", assigned_to=self.volunteer1)
+        task = Task.objects.only("title").get()
+        task.status = "suspended"
+        task.save()
+        self.assertCountersValid()
+        Task.objects.only("title").get().delete()
+        self.assertCountersValid()
+
+    def test_task_delete_cascades_reports(self):
+        task = Task.objects.create(title="test task")
+        Report.objects.create(comment="test report", task=task,
+                              author=self.volunteer1)
+        self.assertEqual(read_counters("reports")["reports"], 1)
+        task.delete()
+        self.assertEqual(read_counters("reports")["reports"], 0)
+        self.assertCountersValid()
+
+    def test_tag_links(self):
+        task = Task.objects.create(title="test task")
+        task.tags.add(self.tag1, self.tag2)
+        self.tag1.tasks.add(Task.objects.create(title="other task"))
+        task.tags.remove(self.tag2)
+        key = f"tag:{self.tag1.pk}:tasks"
+        self.assertEqual(read_counters(key)[key], 2)
+        task.tags.clear()
+        self.assertCountersValid()
+        Task.objects.get(title="other task").delete()
+        self.assertCountersValid()
+
+    def test_volunteer_role_change_and_delete(self):
+        self.volunteer1.role = "coordinator"
+        self.volunteer1.save()
+        self.assertEqual(read_counters("volunteers")["volunteers"], 1)
+        Task.objects.create(title="test task", assigned_to=self.volunteer2)
+        self.volunteer2.delete()
+        self.assertFalse(StatCounter.objects.filter(
+            key__startswith=f"volunteer:{self.volunteer2.pk}:").exists())
+        self.assertCountersValid()
+
+    def test_category_counter(self):
+        category = Category.objects.create(name="test category")
+        self.assertEqual(read_counters("categories")["categories"], 1)
+        category.delete()
+        self.assertCountersValid()
+
+
+class BumpCountersTest(TestCase):
+    def test_query_count_does_not_grow_with_keys(self):
+        StatCounter.objects.create(key="a", value=5)
+        with self.assertNumQueries(2):
+            bump_counters({"a": 2, "b": -1, "c": 0})
+        with self.assertNumQueries(2):
+            bump_counters({f"key{i}": i + 1 for i in range(20)})
+        self.assertEqual(read_counters("a", "b", "c", "key19"),
+                         {"a": 7, "b": -1, "c": 0, "key19": 20})
+
+
+class RebuildCountersCommandTest(TestCase):
+    def setUp(self):
+        Task.objects.create(title="test task")
+        StatCounter.objects.filter(key="tasks").update(value=42)
+
+    def test_check_reports_drift(self):
+        with self.assertRaises(CommandError):
+            call_command("rebuild_counters", "--check",
+                         stdout=StringIO(), stderr=StringIO())
+
+    def test_rebuild_fixes_drift(self):
+        out = StringIO()
+        call_command("rebuild_counters", stdout=out)
+        self.assertEqual(read_counters("tasks")["tasks"], 1)
+        self.assertIn("Counters match", out.getvalue())
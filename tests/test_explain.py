@@ -0,0 +1,18 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from tasks.models import Task
+
+
+class ExplainViewsCommandTest(TestCase):
+    def test_list_views_use_indexes(self):
+        out = StringIO()
+        call_command("explain_views", seed=2000, stdout=out)
+        self.assertIn("tasks by status (next page): ok", out.getvalue())
+        self.assertIn("Every list view query uses an index.", out.getvalue())
+
+    def test_seeded_rows_are_rolled_back(self):
+        call_command("explain_views", seed=200, stdout=StringIO())
+        self.assertFalse(Task.objects.exists())
@@ -0,0 +1,73 @@
+import csv
+import gzip
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tasks.models import Category, Report, Tag, Task
+
+
+class ExportViewTest(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.coordinator = user_model.objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        self.volunteer = user_model.objects.create_user(
+            username="volunteer", password="test password", role="volunteer")
+        category = Category.objects.create(name="Outdoor")
+        garden, urgent = (Tag.objects.create(name="garden"),
+                          Tag.objects.create(name="urgent"))
+        for i in range(5):
+            task = Task.objects.create(
+                title=f"Task {i}", description="Line one,\nline two",
+                status="completed" if i % 2 else "active",
+                category=category, assigned_to=self.volunteer,
+                created_by=self.coordinator)
+            task.tags.add(garden, urgent)
+            Report.objects.create(comment=f"Report {i}", task=task,
+                                  author=self.volunteer)
+        self.client.login(username="coordinator", password="test password")
+
+    def download(self, name, params=None):
+        response = self.client.get(reverse(f"tasks:{name}-export"),
+                                   params or {})
+        self.assertTrue(response.streaming)
+        return response, b"".join(response.streaming_content)
+
+    def test_csv_applies_the_list_filters(self):
+        response, content = self.download("task", {"status": "active"})
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(csv.DictReader(io.StringIO(content.decode())))
+        self.assertEqual([row["title"] for row in rows],
+                         ["Task 0", "Task 2", "Task 4"])
+        self.assertEqual(rows[0]["description"], "Line one,\nline two")
+        self.assertEqual(rows[0]["category"], "Outdoor")
+        self.assertEqual(rows[0]["tags"], "garden;urgent")
+
+    @override_settings(EXPORT_CHUNK_SIZE=2)
+    def test_ndjson_in_chunks(self):
+        response, content = self.download("report", {"format": "ndjson"})
+        rows = [json.loads(line) for line in content.decode().splitlines()]
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[0]["author"], "volunteer")
+        self.assertIsNone(rows[0]["verified_at"])
+
+    def test_gzip(self):
+        response, content = self.download("task", {"gzip": "1"})
+        self.assertIn("tasks.csv.gz", response["Content-Disposition"])
+        lines = gzip.decompress(content).decode().splitlines()
+        self.assertTrue(lines[0].startswith("id,title,description"))
+
+    def test_unknown_format(self):
+        response = self.client.get(reverse("tasks:task-export"),
+                                   {"format": "xml"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_coordinators_only(self):
+        self.client.login(username="volunteer", password="test password")
+        response = self.client.get(reverse("tasks:task-export"))
+        self.assertEqual(response.status_code, 403)
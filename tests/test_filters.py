@@ -0,0 +1,121 @@
+from datetime import date, datetime
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.filters import (date_range_q, exists_all_tags, exists_any_tag,
+                           filter_by_tags, filters_digest, having_all_tags,
+                           in_any_tag, task_facets)
+from tasks.models import Category, Report, Tag, Task
+
+
+class FilterByTagsTest(TestCase):
+    def setUp(self):
+        self.red, self.green, self.blue = (
+            Tag.objects.create(name=name) for name in ("red", "green", "blue"))
+        self.red_green = Task.objects.create(title="red and green")
+        self.red_green.tags.set([self.red, self.green])
+        self.red_only = Task.objects.create(title="red only")
+        self.red_only.tags.set([self.red])
+        self.untagged = Task.objects.create(title="untagged")
+
+    def test_any_returns_each_task_once(self):
+        tasks = list(filter_by_tags(Task.objects.all(),
+                                    [self.red, self.green]))
+        self.assertEqual(sorted(task.pk for task in tasks),
+                         [self.red_green.pk, self.red_only.pk])
+
+    def test_all_requires_every_tag(self):
+        tasks = filter_by_tags(Task.objects.all(),
+                               [self.red, self.green], "all")
+        self.assertEqual(list(tasks), [self.red_green])
+
+    def test_all_with_unused_tag_matches_nothing(self):
+        tasks = filter_by_tags(Task.objects.all(),
+                               [self.red, self.blue], "all")
+        self.assertFalse(tasks.exists())
+
+    def test_strategies_agree(self):
+        tag_ids = [self.red.pk, self.green.pk]
+        tasks = Task.objects.order_by("pk")
+        self.assertEqual(list(exists_any_tag(tasks, tag_ids)),
+                         list(in_any_tag(tasks, tag_ids)))
+        self.assertEqual(list(exists_all_tags(tasks, tag_ids)),
+                         list(having_all_tags(tasks, tag_ids)))
+
+    def test_query_has_no_join_on_tags(self):
+        tasks = filter_by_tags(Task.objects.all(), [self.red], "any")
+        self.assertNotIn("JOIN", str(tasks.query).upper())
+
+
+class DateRangeTest(TestCase):
+    def test_range_is_half_open(self):
+        task = Task.objects.create(title="test task")
+        report = Report.objects.create(comment="test report", task=task)
+        Report.objects.filter(pk=report.pk).update(
+            created_at=timezone.make_aware(datetime(2025, 3, 2)))
+
+        def matches(start, end):
+            return Report.objects.filter(date_range_q("created_at", start,
+                                                      end)).exists()
+
+        self.assertTrue(matches(date(2025, 3, 2), date(2025, 3, 2)))
+        self.assertFalse(matches(None, date(2025, 3, 1)))
+        self.assertTrue(matches(date(2025, 3, 2), None))
+
+
+class TaskFacetsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.coordinator = get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        self.volunteer = get_user_model().objects.create_user(
+            username="volunteer",
+            password="test password",
+            role="volunteer",
+        )
+        self.category = Category.objects.create(name="Garden")
+        self.tag = Tag.objects.create(name="outdoor")
+        active = Task.objects.create(title="active task", status="active",
+                                     category=self.category,
+                                     assigned_to=self.volunteer)
+        active.tags.add(self.tag)
+        Task.objects.create(title="done task", status="completed",
+                            category=self.category)
+        Task.objects.create(title="other task", status="active")
+
+    def test_each_dimension_ignores_only_its_own_filter(self):
+        facets = task_facets(Task.objects.all(), {
+            "status": "active", "category": self.category})
+        self.assertEqual(facets["status"], {"active": 1, "completed": 1})
+        self.assertEqual(facets["category"], {self.category.pk: 1, None: 1})
+        self.assertEqual(facets["volunteer"], {self.volunteer.pk: 1})
+        self.assertEqual(facets["tags"], {self.tag.pk: 1})
+
+    def test_list_shows_counts_and_caches_them(self):
+        self.client.login(username="coordinator", password="test password")
+        url = reverse("tasks:task-list")
+        self.client.get(url)  # warm the cached dropdown choices
+        with CaptureQueriesContext(connection) as first:
+            response = self.client.get(url, {"status": "active"})
+        self.assertContains(response, "Completed (1)")
+        self.assertContains(response, "Garden (1)")
+        self.assertContains(response, "outdoor (1)")
+
+        with CaptureQueriesContext(connection) as second:
+            self.client.get(url, {"status": "active"})
+        self.assertEqual(len(first) - len(second), 4)
+
+    def test_digest_ignores_tag_order(self):
+        other = Tag.objects.create(name="indoor")
+        self.assertEqual(
+            filters_digest({"tags": [self.tag, other], "status": ""}),
+            filters_digest({"status": "", "tags": [other, self.tag]}))
@@ -1,4 +1,5 @@
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.test import TestCase
 from tasks.forms import (CategoryForm,
                          CategorySearchForm,
@@ -226,7 +227,7 @@ class TaskSearchFormTest(TestCase):
             "title": "test title",
             "status": "active",
             "category": self.category.id,
-            "tags": self.tag.id,
+            "tags": [self.tag.id],
             "volunteer": self.volunteer.id,
         }
         form = TaskSearchForm(data=form_data)
@@ -251,13 +252,13 @@ class TaskSearchFormTest(TestCase):
     def test_form_fields_category_tags_volunteer_with_empty_label(self):
         form = TaskSearchForm()
         self.assertEqual(form.fields["category"].empty_label, "All categories")
-        self.assertEqual(form.fields["tags"].empty_label, "All tags")
+        self.assertIsNone(form.fields["tags"].empty_label)
         self.assertEqual(form.fields["volunteer"].empty_label, "All volunteers")
 
     def test_form_placeholder_in_title(self):
         form = TaskSearchForm()
         placeholder = form.fields["title"].widget.attrs["placeholder"]
-        self.assertEqual(placeholder, "Search by title")
+        self.assertEqual(placeholder, "Search title and description")
 
 
 class TagFormTest(TestCase):
@@ -403,6 +404,14 @@ class ReportSearchFormTest(TestCase):
         self.assertNotIn(self.coordinator, filter_queryset)
         self.assertEqual(filter_queryset.count(), 2)
 
+    def test_form_created_range_must_be_ordered(self):
+        form = ReportSearchForm(data={"created_from": "2025-03-02",
+                                      "created_to": "2025-03-01"})
+        self.assertFalse(form.is_valid())
+        form = ReportSearchForm(data={"created_from": "2025-03-01",
+                                      "created_to": "2025-03-01"})
+        self.assertTrue(form.is_valid())
+
     def test_form_with_widget(self):
         form = ReportSearchForm()
         widget = form.fields["created_filter"].widget
@@ -412,3 +421,45 @@ class ReportSearchFormTest(TestCase):
         form = ReportSearchForm()
         placeholder = form.fields["author"].widget.attrs["placeholder"]
         self.assertEqual(placeholder, "Search by author")
+
+
+class CachedChoicesTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.volunteer = get_user_model().objects.create_user(
+            username="volunteer",
+            role="volunteer",
+        )
+        get_user_model().objects.create_user(
+            username="coordinator",
+            role="coordinator",
+        )
+        self.category = Category.objects.create(name="Garden")
+        Tag.objects.create(name="outdoor")
+
+    def test_rendering_again_costs_no_queries(self):
+        str(TaskSearchForm())
+        with self.assertNumQueries(0):
+            html = str(TaskSearchForm())
+        self.assertIn("Garden", html)
+        self.assertIn("outdoor", html)
+
+    def test_write_invalidates_choices(self):
+        str(TaskSearchForm())
+        Category.objects.create(name="Kitchen")
+        self.assertIn("Kitchen", str(TaskSearchForm()))
+
+    def test_differently_filtered_fields_do_not_share(self):
+        form = TaskForm()
+        assigned = [label for _, label in form.fields["assigned_to"].choices]
+        created = [label for _, label in form.fields["created_by"].choices]
+        self.assertIn("volunteer", assigned)
+        self.assertNotIn("coordinator", assigned)
+        self.assertIn("coordinator", created)
+
+    def test_selected_value_and_validation(self):
+        form = TaskSearchForm(data={"category": self.category.pk})
+        self.assertIn(f'value="{self.category.pk}" selected', str(form))
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["category"], self.category)
+        self.assertFalse(TaskSearchForm(data={"category": 999}).is_valid())
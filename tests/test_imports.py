@@ -0,0 +1,166 @@
+import io
+import os
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import CommandError, call_command
+from django.db import DatabaseError
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.bulk import create_tasks
+from tasks.imports import import_tasks
+from tasks.models import Category, ChangeLogEntry, Tag, Task
+from tasks.stats import verify_counters
+
+HEADER = "title,description,status,deadline,category,assigned_to,tags\n"
+
+
+class ImportTasksTest(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.coordinator = user_model.objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        self.volunteer = user_model.objects.create_user(
+            username="Alice", password="test password", role="volunteer")
+        self.category = Category.objects.create(name="Relief")
+        self.tags = [Tag.objects.create(name="water"),
+                     Tag.objects.create(name="food")]
+
+    def run_import(self, text, **kwargs):
+        return import_tasks(io.StringIO(HEADER + text), **kwargs)
+
+    def test_resolves_names_case_insensitively(self):
+        result = self.run_import(
+            "Fill tanks,Carry water,,2026-11-01 10:00,relief,alice,"
+            "Water; FOOD\n", created_by=self.coordinator)
+        self.assertEqual((result.created, result.errors), (1, []))
+        task = Task.objects.get(title="Fill tanks")
+        self.assertEqual(task.category, self.category)
+        self.assertEqual(task.assigned_to, self.volunteer)
+        self.assertEqual(task.created_by, self.coordinator)
+        self.assertEqual(task.status, "active")
+        self.assertEqual(set(task.tags.all()), set(self.tags))
+
+    def test_bad_rows_are_reported_and_skipped(self):
+        Category.objects.create(name="RELIEF")
+        result = self.run_import(
+            "Good,,,2026-11-01 10:00,,,\n"
+            ",,,2026-11-01 10:00,,,\n"
+            "Unknown,,,2026-11-01 10:00,,bob,rain\n"
+            "Ambiguous,,,2026-11-01 10:00,Relief,,\n"
+            "Also good,,completed,2026-11-02 10:00,,Alice,\n")
+        self.assertEqual(result.created, 2)
+        self.assertEqual([number for number, errors in result.errors],
+                         [3, 4, 5])
+        self.assertIn("title", result.errors[0][1])
+        self.assertEqual(set(result.errors[1][1]), {"assigned_to", "tags"})
+        self.assertEqual(result.errors[2][1]["category"],
+                         ["Ambiguous name: Relief."])
+        self.assertEqual(
+            sorted(Task.objects.values_list("title", flat=True)),
+            ["Also good", "Good"])
+
+    def test_writes_in_batches(self):
+        rows = "".join(f"Task {i},,,2026-11-01 10:00,Relief,Alice,water\n"
+                       for i in range(5))
+        sizes = []
+
+        def record(batch, created_by):
+            sizes.append(len(batch))
+            return create_tasks(batch, created_by)
+
+        with mock.patch("tasks.imports.create_tasks", record):
+            result = self.run_import(rows, batch_size=2)
+        self.assertEqual(sizes, [2, 2, 1])
+        self.assertEqual(result.created, 5)
+        self.assertEqual(verify_counters(), [])
+        self.assertEqual(ChangeLogEntry.objects.filter(model="task").count(),
+                         5)
+
+    def test_failed_batch_does_not_abort_the_file(self):
+        rows = "".join(f"Task {i},,,2026-11-01 10:00,,,\n" for i in range(3))
+        calls = []
+
+        def fail_first(batch, created_by):
+            calls.append(len(batch))
+            if len(calls) == 1:
+                raise DatabaseError("disk full")
+            return create_tasks(batch, created_by)
+
+        with mock.patch("tasks.imports.create_tasks", fail_first):
+            result = self.run_import(rows, batch_size=2)
+        self.assertEqual(result.created, 1)
+        self.assertEqual(result.errors, [(2, {"__all__": ["disk full"]}),
+                                         (3, {"__all__": ["disk full"]})])
+        self.assertEqual(list(Task.objects.values_list("title", flat=True)),
+                         ["Task 2"])
+
+
+class ImportTasksCommandTest(TestCase):
+    def setUp(self):
+        self.coordinator = get_user_model().objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "w", encoding="utf-8-sig") as csv_file:
+            csv_file.write(HEADER)
+            csv_file.write("Fill tanks,,,2026-11-01 10:00,,,\n")
+            csv_file.write("Someday,,someday,,,,\n")
+        self.addCleanup(os.remove, self.path)
+
+    def test_reports_counts_and_row_errors(self):
+        out, err = io.StringIO(), io.StringIO()
+        call_command("import_tasks", self.path, created_by="coordinator",
+                     stdout=out, stderr=err)
+        self.assertIn("Imported 1 task(s), rejected 1 row(s).",
+                      out.getvalue())
+        self.assertIn("Row 3: status:", err.getvalue())
+        self.assertEqual(Task.objects.get().created_by, self.coordinator)
+
+    def test_unknown_creator(self):
+        with self.assertRaises(CommandError):
+            call_command("import_tasks", self.path, created_by="nobody")
+
+    def test_missing_file(self):
+        with self.assertRaises(CommandError):
+            call_command("import_tasks", self.path + ".missing")
+
+
+class TaskImportViewTest(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        user_model.objects.create_user(
+            username="coordinator", password="test password",
+            role="coordinator")
+        user_model.objects.create_user(
+            username="volunteer", password="test password",
+            role="volunteer")
+        self.url = reverse("tasks:task-import")
+
+    def upload(self, text):
+        return self.client.post(self.url, {"file": SimpleUploadedFile(
+            "tasks.csv", text.encode("utf-8"), content_type="text/csv")})
+
+    def test_upload_shows_result(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.upload(HEADER
+                               + "Fill tanks,,,2026-11-01 10:00,,,\n"
+                               + "Missing,,,2026-11-01 10:00,Nowhere,,\n")
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, "Imported 1 task(s), rejected 1 row(s).")
+        self.assertContains(response, "Unknown name: Nowhere.")
+        self.assertTrue(Task.objects.filter(title="Fill tanks").exists())
+
+    def test_undecodable_file_stops_with_an_error(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.post(self.url, {"file": SimpleUploadedFile(
+            "tasks.csv", HEADER.encode() + b"\xff\xfe,,\n")})
+        self.assertContains(response, "Stopped reading the file")
+
+    def test_volunteers_cannot_import(self):
+        self.client.login(username="volunteer", password="test password")
+        self.assertEqual(self.client.get(self.url).status_code, 403)
@@ -0,0 +1,105 @@
+import io
+import json
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from tasks.loading import bulk_create_raw, iter_json_array, load_fixture
+from tasks.models import ChangeLogEntry, Report, Tag, Task
+from tasks.stats import verify_counters
+
+FIXTURE = settings.BASE_DIR / "fixtures" / "data.json"
+
+
+class IterJsonArrayTest(TestCase):
+    def test_items_split_across_reads(self):
+        items = [{"pk": i, "fields": {"name": "x" * i, "tags": [1, 22]}}
+                 for i in range(20)] + [12345, "tail"]
+        text = json.dumps(items, indent=2)
+        for chunk_size in (1, 3, 7, 64):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    list(iter_json_array(io.StringIO(text), chunk_size)),
+                    items)
+
+    def test_empty_array(self):
+        self.assertEqual(list(iter_json_array(io.StringIO(" [ ] "))), [])
+
+    def test_rejects_other_documents(self):
+        for text in ('{"model": "tasks.tag"}', "[1, 2", "[1 2]", "[1,]"):
+            with self.subTest(text=text), self.assertRaises(ValueError):
+                list(iter_json_array(io.StringIO(text), 2))
+
+
+class LoadFixtureTest(TestCase):
+    def load(self, **kwargs):
+        with open(FIXTURE, encoding="utf-8") as stream:
+            return load_fixture(stream, **kwargs)
+
+    def test_loads_the_same_rows_as_loaddata(self):
+        call_command("loaddata", FIXTURE, verbosity=0)
+        expected = {task.pk: (task.title, task.assigned_to_id,
+                              {tag.pk for tag in task.tags.all()})
+                    for task in Task.objects.prefetch_related("tags")}
+        Task.objects.all().delete()
+
+        loaded = self.load(batch_size=5)
+        self.assertEqual(loaded["tasks.Task"], len(expected))
+        self.assertEqual(
+            {task.pk: (task.title, task.assigned_to_id,
+                       {tag.pk for tag in task.tags.all()})
+             for task in Task.objects.prefetch_related("tags")},
+            expected)
+
+    def test_queries_per_batch_not_per_object(self):
+        with CaptureQueriesContext(connection) as context:
+            loaded = self.load()
+        # A few per model and per checked table, whatever the row count.
+        self.assertLess(len(context), 40)
+        self.assertGreater(sum(loaded.values()), 100)
+
+    def test_keeps_derived_data_consistent(self):
+        self.load()
+        self.assertEqual(verify_counters(), [])
+        self.assertEqual(
+            ChangeLogEntry.objects.filter(model="task").count(),
+            Task.objects.count())
+        self.assertTrue(Task.objects.filter(
+            updated_at__year=2025).exists())
+
+    def test_loading_twice_overwrites(self):
+        self.load()
+        Tag.objects.filter(pk=17).update(name="renamed")
+        task = Task.objects.filter(tags=17).first()
+        task.tags.clear()
+        counts = (Task.objects.count(), Report.objects.count())
+
+        self.load()
+        self.assertNotEqual(Tag.objects.get(pk=17).name, "renamed")
+        self.assertTrue(task.tags.filter(pk=17).exists())
+        self.assertEqual((Task.objects.count(), Report.objects.count()),
+                         counts)
+        self.assertEqual(verify_counters(), [])
+
+    def test_new_rows_get_fresh_primary_keys(self):
+        self.load()
+        highest = Task.objects.order_by("-pk").values_list("pk", flat=True)[0]
+        self.assertGreater(Task.objects.create(title="New").pk, highest)
+
+
+class BulkCreateRawTest(TestCase):
+    def test_keeps_set_timestamps_only(self):
+        old = timezone.now() - timedelta(days=30)
+        kept, fresh = Task(title="Old", updated_at=old), Task(title="New")
+        bulk_create_raw(Task, [kept, fresh])
+        self.assertEqual(Task.objects.get(pk=kept.pk).updated_at, old)
+        self.assertGreater(Task.objects.get(pk=fresh.pk).updated_at, old)
+        # The model's own fields are left alone.
+        self.assertTrue(Task._meta.get_field("updated_at").auto_now)
+        kept.save()
+        self.assertGreater(Task.objects.get(pk=kept.pk).updated_at, old)
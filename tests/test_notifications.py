@@ -0,0 +1,246 @@
+from datetime import timedelta
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.core import mail
+from django.core.mail import EmailMultiAlternatives
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.benchmarks import ConnectionCountingBackend
+from tasks.models import Category, OutboxEmail, PendingAssignment, Task
+from tasks.notifications import (deliver_outbox, flush_assignment_digests,
+                                 notify_task_assigned, send_email_messages)
+
+
+class OutboxQueueTest(TestCase):
+    def setUp(self):
+        self.coordinator = get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        self.volunteer = get_user_model().objects.create_user(
+            username="volunteer",
+            password="other test password",
+            role="volunteer",
+            email="volunteer@gmail.com",
+        )
+        self.category = Category.objects.create(
+            name="test category",
+        )
+
+    def test_task_create_queues_email_without_sending(self):
+        self.client.login(username="coordinator", password="test password")
+        self.client.post(reverse("tasks:task-create"), {
+            "title": "test task",
+            "created_by": self.coordinator.id,
+            "assigned_to": self.volunteer.id,
+            "status": "active",
+            "category": self.category.id,
+        })
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.to_email, "volunteer@gmail.com")
+        self.assertEqual(email.status, "pending")
+        self.assertIn("test task", email.subject)
+        self.assertIn("test task", email.html_body)
+
+    def test_no_email_queued_without_address(self):
+        self.volunteer.email = ""
+        self.volunteer.save()
+        task = Task.objects.create(title="test task",
+                                   assigned_to=self.volunteer)
+        notify_task_assigned(task)
+        self.assertFalse(OutboxEmail.objects.exists())
+
+
+class OutboxDeliveryTest(TestCase):
+    def setUp(self):
+        self.email = OutboxEmail.objects.create(
+            to_email="volunteer@gmail.com",
+            subject="test subject",
+            body="test body",
+            html_body="<p>test body</p>",
+        )
+
+    def test_process_outbox_sends_pending_emails(self):
+        out = StringIO()
+        call_command("process_outbox", stdout=out)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["volunteer@gmail.com"])
+        self.assertEqual(mail.outbox[0].subject, "test subject")
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "sent")
+        self.assertIsNotNone(self.email.sent_at)
+        self.assertIn("Sent 1 email(s)", out.getvalue())
+
+    def test_emails_not_due_are_skipped(self):
+        self.email.available_at = timezone.now() + timedelta(minutes=5)
+        self.email.save()
+        self.assertEqual(deliver_outbox(), (0, 0))
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_batch_size_limits_delivery(self):
+        OutboxEmail.objects.create(to_email="other@gmail.com",
+                                   subject="second", body="body")
+        self.assertEqual(deliver_outbox(batch_size=1), (1, 0))
+        self.assertEqual(
+            OutboxEmail.objects.filter(status="pending").count(), 1)
+
+    @override_settings(EMAIL_OUTBOX_RETRY_DELAY=60)
+    @patch("django.core.mail.backends.locmem.EmailBackend.send_messages",
+           side_effect=OSError("relay down"))
+    def test_failure_is_rescheduled_with_backoff(self, mock_send):
+        before = timezone.now()
+        self.assertEqual(deliver_outbox(), (0, 1))
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "pending")
+        self.assertEqual(self.email.attempts, 1)
+        self.assertIn("relay down", self.email.last_error)
+        self.assertGreaterEqual(self.email.available_at,
+                                before + timedelta(seconds=60))
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=2)
+    @patch("django.core.mail.backends.locmem.EmailBackend.send_messages",
+           side_effect=OSError("relay down"))
+    def test_failure_gives_up_after_max_attempts(self, mock_send):
+        OutboxEmail.objects.filter(pk=self.email.pk).update(attempts=1)
+        deliver_outbox()
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "failed")
+        self.assertEqual(self.email.attempts, 2)
+
+    @override_settings(EMAIL_OUTBOX_MAX_ATTEMPTS=1)
+    def test_claim_counts_as_an_attempt(self):
+        with patch("tasks.notifications.send_email_messages",
+                   side_effect=SystemExit):
+            with self.assertRaises(SystemExit):
+                deliver_outbox()
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.attempts, 1)
+        # The claim of the dead worker expires.
+        OutboxEmail.objects.update(available_at=timezone.now())
+        self.assertEqual(deliver_outbox(), (0, 1))
+        self.assertEqual(len(mail.outbox), 0)
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "failed")
+
+    def test_batch_is_claimed_before_sending(self):
+        seen = {}
+
+        def send(messages):
+            seen["due"] = OutboxEmail.objects.filter(
+                available_at__lte=timezone.now()).count()
+            seen["savepoints"] = list(connection.savepoint_ids)
+            return len(messages)
+
+        outer = list(connection.savepoint_ids)
+        with patch("django.core.mail.backends.locmem.EmailBackend"
+                   ".send_messages", side_effect=send):
+            self.assertEqual(deliver_outbox(), (1, 0))
+        # The claim hid the row from other workers and was committed
+        # before the SMTP round trip.
+        self.assertEqual(seen, {"due": 0, "savepoints": outer})
+        self.email.refresh_from_db()
+        self.assertEqual(self.email.status, "sent")
+
+
+@override_settings(EMAIL_BACKEND="tasks.benchmarks.ConnectionCountingBackend")
+class BatchedDeliveryTest(TestCase):
+    def setUp(self):
+        ConnectionCountingBackend.opened = 0
+        self.messages = [
+            EmailMultiAlternatives(f"subject {i}", "body", None,
+                                   [f"volunteer{i}@gmail.com"])
+            for i in range(10)
+        ]
+
+    def test_one_connection_per_batch(self):
+        results = send_email_messages(self.messages, batch_size=4)
+        self.assertEqual(results, [None] * 10)
+        self.assertEqual(len(mail.outbox), 10)
+        self.assertEqual(ConnectionCountingBackend.opened, 3)
+
+    def test_outbox_batch_reuses_connection(self):
+        for i in range(5):
+            OutboxEmail.objects.create(to_email=f"volunteer{i}@gmail.com",
+                                       subject="subject", body="body",
+                                       html_body="<p>body</p>")
+        self.assertEqual(deliver_outbox(), (5, 0))
+        self.assertEqual(ConnectionCountingBackend.opened, 1)
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+
+
+@override_settings(NOTIFICATION_DIGEST_WINDOW=60)
+class AssignmentDigestTest(TestCase):
+    def setUp(self):
+        self.volunteer = get_user_model().objects.create_user(
+            username="volunteer",
+            password="test password",
+            role="volunteer",
+            email="volunteer@gmail.com",
+        )
+        self.tasks = [
+            Task.objects.create(title=f"test task{i}",
+                                assigned_to=self.volunteer)
+            for i in range(3)
+        ]
+
+    def expire_window(self):
+        PendingAssignment.objects.update(
+            created_at=timezone.now() - timedelta(seconds=61))
+
+    def test_assignments_are_buffered(self):
+        for task in self.tasks:
+            notify_task_assigned(task)
+        self.assertEqual(PendingAssignment.objects.count(), 3)
+        self.assertFalse(OutboxEmail.objects.exists())
+
+    def test_open_window_is_not_flushed(self):
+        notify_task_assigned(self.tasks[0])
+        self.assertEqual(flush_assignment_digests(), 0)
+        self.assertEqual(PendingAssignment.objects.count(), 1)
+
+    def test_elapsed_window_sends_one_digest(self):
+        for task in self.tasks:
+            notify_task_assigned(task)
+        self.expire_window()
+        self.assertEqual(flush_assignment_digests(), 1)
+        email = OutboxEmail.objects.get()
+        self.assertIn("3 new tasks", email.subject)
+        for task in self.tasks:
+            self.assertIn(task.title, email.html_body)
+        self.assertFalse(PendingAssignment.objects.exists())
+
+    def test_single_assignment_uses_regular_template(self):
+        notify_task_assigned(self.tasks[0])
+        self.expire_window()
+        flush_assignment_digests()
+        email = OutboxEmail.objects.get()
+        self.assertIn("assigned a task test task0", email.subject)
+
+    def test_reassigned_task_is_dropped_from_digest(self):
+        other = get_user_model().objects.create_user(
+            username="other", password="test password", role="volunteer")
+        for task in self.tasks:
+            notify_task_assigned(task)
+        self.tasks[0].assigned_to = other
+        self.tasks[0].save()
+        self.expire_window()
+        flush_assignment_digests()
+        email = OutboxEmail.objects.get()
+        self.assertIn("2 new tasks", email.subject)
+        self.assertNotIn("test task0", email.html_body)
+
+    def test_process_outbox_flushes_and_sends_digest(self):
+        for task in self.tasks:
+            notify_task_assigned(task)
+        self.expire_window()
+        call_command("process_outbox", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["volunteer@gmail.com"])
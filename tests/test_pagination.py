@@ -0,0 +1,200 @@
+from datetime import timedelta
+from urllib.parse import urlencode
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import EmptyPage
+from django.db import connection
+from django.http import Http404
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from tasks.models import Report, Task
+from tasks.pagination import (CountlessPaginator, KeysetPaginator,
+                              estimate_count)
+from tasks.templatetags.query_transform import query_transform
+
+
+class KeysetPaginatorTest(TestCase):
+    def setUp(self):
+        now = timezone.now()
+        for i in range(7):
+            Task.objects.create(title=f"test task{i}",
+                                deadline=now + timedelta(days=i % 3))
+        for i in range(4):
+            Task.objects.create(title=f"no deadline{i}")
+        self.expected = [
+            task.pk for task in sorted(
+                Task.objects.all(),
+                key=lambda t: (t.deadline is None, t.deadline or now, t.pk))
+        ]
+        self.paginator = KeysetPaginator(Task.objects.all(), 3, "deadline")
+
+    def walk_forward(self):
+        pages, cursor = [], None
+        while True:
+            page = self.paginator.page(cursor)
+            pages.append(page)
+            if not page.has_next():
+                return pages
+            cursor = page.next_cursor
+
+    def test_forward_walk_visits_every_row_once(self):
+        pages = self.walk_forward()
+        self.assertEqual([task.pk for page in pages for task in page],
+                         self.expected)
+        self.assertFalse(pages[0].has_previous())
+        self.assertEqual(len(pages), 4)
+
+    def test_backward_walk_returns_same_pages(self):
+        pages = self.walk_forward()
+        page = pages[-1]
+        for expected in reversed(pages[:-1]):
+            page = self.paginator.page(page.previous_cursor)
+            self.assertEqual([task.pk for task in page],
+                             [task.pk for task in expected])
+        self.assertFalse(page.has_previous())
+
+    def test_descending_key(self):
+        task = Task.objects.create(title="test task")
+        for i in range(5):
+            Report.objects.create(comment=f"test report{i}", task=task)
+        paginator = KeysetPaginator(Report.objects.all(), 2, "created_at",
+                                    descending=True)
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+        ids = [report.pk for page in (first, second, third)
+               for report in page]
+        self.assertEqual(ids, list(Report.objects.order_by(
+            "-created_at", "-pk").values_list("pk", flat=True)))
+        self.assertFalse(third.has_next())
+
+    def test_page_costs_one_query(self):
+        cursor = self.paginator.page().next_cursor
+        with self.assertNumQueries(1):
+            self.paginator.page(cursor)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(Http404):
+            self.paginator.page("not-a-cursor")
+
+
+class CursorPaginationViewTest(TestCase):
+    def setUp(self):
+        get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        for i in range(8):
+            Task.objects.create(title=f"test task{i}")
+
+    def test_view_next_page_by_cursor(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.get(reverse("tasks:task-list"))
+        page = response.context["page_obj"]
+        self.assertTrue(response.context["is_paginated"])
+        self.assertContains(response,
+                            urlencode({"cursor": page.next_cursor}))
+
+        response = self.client.get(reverse("tasks:task-list"),
+                                   {"cursor": page.next_cursor})
+        self.assertEqual(len(response.context["task_list"]), 3)
+        self.assertFalse(response.context["page_obj"].has_next())
+
+    def test_view_invalid_cursor(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.get(reverse("tasks:task-list"),
+                                   {"cursor": "broken"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_query_transform_swaps_page_for_cursor(self):
+        request = RequestFactory().get("/", {"status": "active", "page": 3})
+        self.assertEqual(query_transform(request, cursor="abc"),
+                         "status=active&cursor=abc")
+
+
+class CountlessPaginatorTest(TestCase):
+    def setUp(self):
+        for i in range(7):
+            Task.objects.create(title=f"test task{i}")
+        self.paginator = CountlessPaginator(Task.objects.order_by("pk"), 3)
+
+    def test_page_costs_one_query_without_count(self):
+        with CaptureQueriesContext(connection) as queries:
+            page = self.paginator.page(2)
+        self.assertEqual(len(queries), 1)
+        self.assertNotIn("COUNT", queries[0]["sql"].upper())
+        self.assertEqual(len(page), 3)
+        self.assertTrue(page.has_next())
+        self.assertTrue(page.has_previous())
+        self.assertIsNone(self.paginator.count)
+
+    def test_last_page_knows_exact_count(self):
+        page = self.paginator.page(3)
+        self.assertFalse(page.has_next())
+        self.assertEqual(self.paginator.count, 7)
+        self.assertEqual(self.paginator.num_pages, 3)
+
+    def test_page_past_end(self):
+        with self.assertRaises(EmptyPage):
+            self.paginator.page(4)
+
+    def test_no_estimate_outside_postgres(self):
+        if connection.vendor != "postgresql":
+            self.assertIsNone(estimate_count(Task.objects.all()))
+
+
+class CountlessPaginationViewTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        for i in range(7):
+            get_user_model().objects.create_user(
+                username=f"volunteer{i}",
+                password="test password",
+                role="volunteer",
+            )
+        self.client.login(username="coordinator", password="test password")
+
+    def list_queries(self, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("tasks:volunteer-list"),
+                                       params)
+        return response, [query["sql"] for query in queries
+                          if "tasks_customuser" in query["sql"]]
+
+    def test_filtered_list_runs_no_count(self):
+        response, queries = self.list_queries({"username": "volunteer"})
+        self.assertEqual(len(response.context["volunteer_list"]), 5)
+        self.assertTrue(response.context["page_obj"].has_next())
+        self.assertIsNone(response.context["paginator"].count)
+        self.assertFalse(any("COUNT" in sql.upper() for sql in queries))
+
+    def test_unfiltered_total_comes_from_counter(self):
+        response, _ = self.list_queries({})
+        self.assertEqual(response.context["paginator"].count, 7)
+        self.assertContains(response, "1 / 2")
+
+    def test_total_is_cached_after_last_page(self):
+        params = {"username": "volunteer"}
+        self.list_queries({**params, "page": 2})
+        response, _ = self.list_queries(params)
+        self.assertEqual(response.context["paginator"].count, 7)
+
+        get_user_model().objects.create_user(
+            username="volunteer7", password="test password",
+            role="volunteer")
+        response, _ = self.list_queries(params)
+        self.assertIsNone(response.context["paginator"].count)
+
+    def test_invalid_page(self):
+        response, _ = self.list_queries({"page": 9})
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,117 @@
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.urls import reverse
+
+from tasks.models import Tag, Task
+from tasks.search import fts5_query, search_tasks, similar_names
+
+
+class SearchTasksTest(TestCase):
+    def setUp(self):
+        self.in_title = Task.objects.create(
+            title="Garden cleanup", description="Bring gloves")
+        self.in_description = Task.objects.create(
+            title="Weekend shift", description="Help with the garden beds")
+        self.unrelated = Task.objects.create(
+            title="Food bank", description="Sort donations")
+
+    def search(self, text):
+        return list(search_tasks(Task.objects.all(), text))
+
+    def test_matches_title_and_description(self):
+        results = self.search("garden")
+        self.assertEqual(set(results), {self.in_title, self.in_description})
+
+    def test_title_match_ranks_first(self):
+        self.assertEqual(self.search("garden")[0], self.in_title)
+
+    def test_index_follows_updates_and_deletes(self):
+        self.unrelated.description = "Garden tools"
+        self.unrelated.save()
+        self.assertIn(self.unrelated, self.search("garden"))
+        self.in_title.delete()
+        self.assertNotIn(self.in_title, self.search("garden"))
+
+    def test_other_columns_leave_the_index_alone(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("Postgres has no search trigger.")
+        connection.ensure_connection()
+        sqlite = connection.connection
+        before = sqlite.total_changes
+        Task.objects.filter(pk=self.unrelated.pk).update(status="completed")
+        # One row in tasks_task and none in the index.
+        self.assertEqual(sqlite.total_changes - before, 1)
+        Task.objects.filter(pk=self.unrelated.pk).update(title="Garden")
+        self.assertGreater(sqlite.total_changes - before, 2)
+        self.assertIn(self.unrelated, self.search("garden"))
+
+    def test_prefix_and_punctuation(self):
+        self.assertEqual(self.search("gard"),
+                         self.search("garden"))
+        self.assertEqual(self.search('food" (bank'), [self.unrelated])
+
+    def test_fts5_query_quotes_words(self):
+        self.assertEqual(fts5_query('foo "bar" OR'), '"foo" "bar" "OR"*')
+        self.assertEqual(fts5_query("!!"), "")
+
+
+class TaskListSearchViewTest(TestCase):
+    def setUp(self):
+        get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        for i in range(7):
+            Task.objects.create(title=f"Garden task{i}")
+        Task.objects.create(title="Food bank")
+        self.client.login(username="coordinator", password="test password")
+
+    def test_search_pages_by_number(self):
+        response = self.client.get(reverse("tasks:task-list"),
+                                   {"title": "garden"})
+        self.assertEqual(len(response.context["task_list"]), 5)
+        self.assertTrue(response.context["paginator"].is_countless)
+
+        response = self.client.get(reverse("tasks:task-list"),
+                                   {"title": "garden", "page": 2})
+        self.assertEqual(len(response.context["task_list"]), 2)
+        self.assertEqual(response.context["paginator"].count, 7)
+
+
+class SimilarNamesTest(TestCase):
+    def setUp(self):
+        for name in ("gardening", "garbage", "cooking", "driving"):
+            Tag.objects.create(name=name)
+
+    def test_closest_names_first(self):
+        names = similar_names(Tag.objects.all(), "name", "gardenign")
+        self.assertEqual(names[0], "gardening")
+        self.assertNotIn("cooking", names)
+
+    def test_nothing_similar(self):
+        self.assertEqual(similar_names(Tag.objects.all(), "name", "zzz"), [])
+
+
+class SuggestionViewTest(TestCase):
+    def setUp(self):
+        get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        Tag.objects.create(name="gardening")
+        self.client.login(username="coordinator", password="test password")
+
+    def test_empty_search_offers_suggestion(self):
+        response = self.client.get(reverse("tasks:tag-list"),
+                                   {"name": "gardenign"})
+        self.assertEqual(response.context["suggestions"],
+                         [("gardening", "name=gardening")])
+        self.assertContains(response, "Did you mean")
+
+    def test_no_suggestions_when_results_found(self):
+        response = self.client.get(reverse("tasks:tag-list"),
+                                   {"name": "garden"})
+        self.assertNotIn("suggestions", response.context)
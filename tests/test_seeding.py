@@ -0,0 +1,75 @@
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.db.models import Count
+from django.test import TestCase
+
+from tasks.models import ChangeLogEntry, CustomUser, Report, Tag, Task
+from tasks.seeding import seed_tasks
+from tasks.stats import verify_counters
+
+
+class SeedCommandTest(TestCase):
+    def seed(self, **options):
+        options = {"coordinators": 2, "volunteers": 20, "categories": 5,
+                   "tags": 30, "tasks": 300, "reports": 600,
+                   "batch_size": 64, **options}
+        out = StringIO()
+        call_command("seed", stdout=out, **options)
+        return out.getvalue()
+
+    def test_creates_the_requested_volumes(self):
+        output = self.seed()
+        self.assertIn("Seeded", output)
+        self.assertEqual(CustomUser.objects.filter(role="volunteer").count(),
+                         20)
+        self.assertEqual(Task.objects.count(), 300)
+        self.assertEqual(Report.objects.count(), 600)
+        self.assertEqual(Tag.objects.count(), 30)
+        self.assertEqual(verify_counters(), [])
+        self.assertEqual(ChangeLogEntry.objects.count(), 900)
+
+    def test_same_seed_same_rows(self):
+        def snapshot():
+            return list(Task.objects.order_by("pk").values_list(
+                "title", "status", "assigned_to__username",
+                "category__name"))
+
+        self.seed(seed=3)
+        first = snapshot()
+        for model in (Task, Tag, CustomUser):
+            model.objects.all().delete()
+        self.seed(seed=3)
+        self.assertEqual(snapshot(), first)
+
+    def test_realistic_shape(self):
+        self.seed()
+        # A few volunteers do most of the work.
+        busiest = (Task.objects.exclude(assigned_to=None)
+                   .values("assigned_to").annotate(n=Count("pk"))
+                   .order_by("-n").values_list("n", flat=True))
+        self.assertGreater(busiest[0], 3 * busiest[len(busiest) - 1])
+        # Reports are written on tasks someone worked on.
+        self.assertFalse(Report.objects.filter(
+            task__status__in=["active", "suspended"]).exists())
+        self.assertFalse(Report.objects.filter(
+            created_at__year__lt=2000).exists())
+
+    def test_refuses_to_load_a_seed_twice(self):
+        self.seed(tasks=10, reports=10)
+        with self.assertRaises(CommandError):
+            self.seed(tasks=10, reports=10)
+
+
+class SeedTasksTest(TestCase):
+    def test_skips_a_loaded_seed(self):
+        call_command("seed", tasks=10, reports=10, volunteers=5, tags=5,
+                     stdout=StringIO())
+        seeder = seed_tasks(100, tags_per_task=4)
+        self.assertEqual(seeder.prefix, "seed1-")
+        self.assertEqual(Task.objects.count(), 110)
+        tag_counts = set(Task.objects.filter(
+            created_by__username__startswith="seed1-")
+            .annotate(n=Count("tags")).values_list("n", flat=True))
+        self.assertEqual(tag_counts, {4})
+        self.assertEqual(verify_counters(), [])
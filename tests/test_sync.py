@@ -0,0 +1,129 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from tasks.models import Category, ChangeLogEntry, Report, Tag, Task
+from tasks.sync import changes_since
+
+
+@override_settings(SYNC_SAFETY_LAG=0)
+class ChangesSinceTest(TestCase):
+    def setUp(self):
+        user_model = get_user_model()
+        self.coordinator = user_model.objects.create_user(
+            username="coordinator", role="coordinator")
+        self.volunteer = user_model.objects.create_user(
+            username="volunteer", role="volunteer")
+        self.other = user_model.objects.create_user(
+            username="other", role="volunteer")
+        self.task = Task.objects.create(title="Mine",
+                                        assigned_to=self.volunteer)
+        self.foreign = Task.objects.create(title="Theirs",
+                                           assigned_to=self.other)
+
+    def token(self):
+        return ChangeLogEntry.objects.order_by("-id").values_list(
+            "id", flat=True).first()
+
+    def test_full_sync_from_zero(self):
+        changes = changes_since(self.volunteer, 0)
+        self.assertEqual([row["title"] for row in changes["tasks"]],
+                         ["Mine"])
+        self.assertEqual(changes["token"], ChangeLogEntry.objects.filter(
+            user=self.volunteer).last().pk)
+        self.assertFalse(changes["has_more"])
+
+    def test_only_the_delta(self):
+        token = self.token()
+        self.foreign.save()
+        self.assertEqual(changes_since(self.volunteer, token)["tasks"], [])
+        self.task.status = "completed"
+        self.task.save()
+        changes = changes_since(self.volunteer, token)
+        self.assertEqual([row["status"] for row in changes["tasks"]],
+                         ["completed"])
+
+    def test_deleted_and_reassigned_rows(self):
+        token = self.token()
+        deleted_pk = self.task.pk
+        self.task.delete()
+        self.foreign.assigned_to = self.volunteer
+        self.foreign.save()
+        changes = changes_since(self.volunteer, token)
+        self.assertEqual(changes["deleted_tasks"], [deleted_pk])
+        self.assertEqual([row["id"] for row in changes["tasks"]],
+                         [self.foreign.pk])
+        self.assertEqual(changes_since(self.other, token)["deleted_tasks"],
+                         [self.foreign.pk])
+
+    def test_tags_and_reports(self):
+        token = self.token()
+        tag = Tag.objects.create(name="urgent")
+        self.task.tags.add(tag)
+        Report.objects.create(comment="Done", task=self.task,
+                              author=self.volunteer)
+        changes = changes_since(self.volunteer, token)
+        self.assertEqual(changes["tasks"][0]["tags"], ["urgent"])
+        self.assertEqual(changes["reports"][0]["comment"], "Done")
+        tag.name = "critical"
+        tag.save()
+        changes = changes_since(self.volunteer, changes["token"])
+        self.assertEqual(changes["tasks"][0]["tags"], ["critical"])
+
+    def test_category_rename(self):
+        category = Category.objects.create(name="Outdoor")
+        self.task.category = category
+        self.task.save()
+        token = self.token()
+        category.name = "Garden"
+        category.save()
+        changes = changes_since(self.coordinator, token)
+        self.assertEqual(changes["tasks"][0]["category"], "Garden")
+
+    def test_deleted_labels(self):
+        category = Category.objects.create(name="Outdoor")
+        tag = Tag.objects.create(name="urgent")
+        self.task.category = category
+        self.task.save()
+        self.task.tags.add(tag)
+        token = self.token()
+        category.delete()
+        tag.delete()
+        changes = changes_since(self.volunteer, token)
+        self.assertEqual([row["id"] for row in changes["tasks"]],
+                         [self.task.pk])
+        self.assertIsNone(changes["tasks"][0]["category"])
+        self.assertEqual(changes["tasks"][0]["tags"], [])
+
+    def test_pages(self):
+        for i in range(3):
+            self.task.save()
+        first = changes_since(self.coordinator, 0, limit=2)
+        self.assertTrue(first["has_more"])
+        rest = changes_since(self.coordinator, first["token"], limit=10)
+        self.assertFalse(rest["has_more"])
+        self.assertEqual(rest["token"], self.token())
+
+    @override_settings(SYNC_SAFETY_LAG=60)
+    def test_recent_changes_are_held_back(self):
+        changes = changes_since(self.coordinator, 0)
+        self.assertEqual(changes["tasks"], [])
+        self.assertEqual(changes["token"], 0)
+
+
+@override_settings(SYNC_SAFETY_LAG=0)
+class SyncViewTest(TestCase):
+    def setUp(self):
+        volunteer = get_user_model().objects.create_user(
+            username="volunteer", password="test password",
+            role="volunteer")
+        Task.objects.create(title="Mine", assigned_to=volunteer)
+        self.client.login(username="volunteer", password="test password")
+
+    def test_json(self):
+        response = self.client.get(reverse("tasks:sync"), {"since": 0})
+        self.assertEqual(response.json()["tasks"][0]["title"], "Mine")
+
+    def test_invalid_token(self):
+        response = self.client.get(reverse("tasks:sync"), {"since": "x"})
+        self.assertEqual(response.status_code, 404)
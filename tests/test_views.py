@@ -1,13 +1,18 @@
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 from django.utils import timezone
 from unittest.mock import patch
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils.http import http_date
 
 
 from tasks.models import Category, Task, Tag, Report
+from tasks.views import TaskListView
 
 
 class IndexViewTest(TestCase):
@@ -44,6 +49,7 @@ class IndexViewTest(TestCase):
 
 class CoordinatorIndexViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = Client()
         self.coordinator = get_user_model().objects.create_user(
             username="coordinator",
@@ -71,9 +77,46 @@ class CoordinatorIndexViewTest(TestCase):
         response = self.client.get(reverse("tasks:coordinator-index"))
         self.assertEqual(response.status_code, 403)
 
+    def test_view_statistics_values(self):
+        category = Category.objects.create(name="test category")
+        Task.objects.create(title="test task1", status="active",
+                            category=category)
+        Task.objects.create(title="test task2", status="active")
+        task = Task.objects.create(title="test task3", status="completed")
+        Report.objects.create(comment="test report", task=task,
+                              author=self.volunteer)
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.get(reverse("tasks:coordinator-index"))
+
+        self.assertEqual(response.context["num_volunteers"], 1)
+        self.assertEqual(response.context["num_tasks"], 3)
+        self.assertEqual(response.context["num_categories"], 1)
+        self.assertEqual(response.context["num_reports"], 1)
+        self.assertEqual(response.context["status_counts"], [
+            {"status": "active", "count": 2},
+            {"status": "completed", "count": 1},
+        ])
+
+    def test_view_statistics_query_budget(self):
+        self.client.login(username="coordinator", password="test password")
+        # session, user and a single statistics query
+        with self.assertNumQueries(3):
+            self.client.get(reverse("tasks:coordinator-index"))
+        # cached until something is written
+        with self.assertNumQueries(2):
+            self.client.get(reverse("tasks:coordinator-index"))
+
+    def test_view_statistics_invalidated_on_write(self):
+        self.client.login(username="coordinator", password="test password")
+        self.client.get(reverse("tasks:coordinator-index"))
+        Task.objects.create(title="test task")
+        response = self.client.get(reverse("tasks:coordinator-index"))
+        self.assertEqual(response.context["num_tasks"], 1)
+
 
 class VolunteerIndexViewTest(TestCase):
     def setUp(self):
+        cache.clear()
         self.client = Client()
         self.volunteer = get_user_model().objects.create_user(
             username="volunteer",
@@ -134,6 +177,13 @@ class VolunteerListViewTest(TestCase):
         self.assertEqual(len(volunteers), 1)
         self.assertEqual(volunteers[0].username, "volunteer1")
 
+    def test_view_loads_only_rendered_columns(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.get(reverse("tasks:volunteer-list"))
+        deferred = response.context["volunteer_list"][0].get_deferred_fields()
+        self.assertIn("password", deferred)
+        self.assertIn("profile_image", deferred)
+
     def test_view_redirect_for_anonymous(self):
         response = self.client.get(reverse("tasks:volunteer-list"))
         self.assertEqual(response.status_code, 302)
@@ -529,6 +579,24 @@ class TaskListViewTest(TestCase):
         self.assertIn(self.task2, tasks)
         self.assertEqual(len(tasks), 2)
 
+    def test_view_loads_only_rendered_columns(self):
+        self.task1.description = "A long description " * 20
+        self.task1.save()
+        self.client.login(username="coordinator", password="test password")
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("tasks:task-list"),
+                                       {"status": "active"})
+        # Rendering must not fall back to loading deferred columns per row.
+        deferred_loads = [
+            query for query in queries.captured_queries
+            if '"tasks_task"."description" FROM' in query["sql"]]
+        self.assertFalse(deferred_loads)
+        task = response.context["task_list"][0]
+        self.assertIn("description", task.get_deferred_fields())
+        self.assertIn("password", task.assigned_to.get_deferred_fields())
+        self.assertEqual(len(task.description_preview), 200)
+        self.assertContains(response, "volunteer1")
+
     def test_view_volunteer_see_only_yourself_tasks(self):
         self.client.login(username="volunteer1", password="other test password")
         response = self.client.get(reverse("tasks:task-list"))
@@ -727,7 +795,7 @@ class TaskUpdateViewTest(TestCase):
         self.task.refresh_from_db()
         self.assertEqual(self.task.status, "in_progress")
 
-    @patch("tasks.views.notify_task_assigned")
+    @patch("tasks.views.tasks.notify_task_assigned")
     def test_view_check_notify_task_if_change_assigned_to(self, mock_notify):
         self.client.login(username="coordinator", password="test password")
         response = self.client.post(reverse("tasks:task-update", args=[self.task.id]), {
@@ -996,6 +1064,14 @@ class ReportListViewTest(TestCase):
         self.assertIn(self.report2, reports)
         self.assertEqual(len(reports), 2)
 
+    def test_view_loads_only_rendered_columns(self):
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.get(reverse("tasks:report-list"))
+        report = response.context["report_list"][0]
+        self.assertIn("updated_at", report.get_deferred_fields())
+        self.assertIn("description", report.task.get_deferred_fields())
+        self.assertIn("password", report.author.get_deferred_fields())
+
     def test_view_volunteer_see_only_yourself_reports(self):
         self.client.login(username="volunteer1", password="other test password1")
         response = self.client.get(reverse("tasks:report-list"))
@@ -1021,6 +1097,39 @@ class ReportListViewTest(TestCase):
         self.assertIn(self.report1, reports)
         self.assertNotIn(self.report2, reports)
 
+    def test_view_filtering_by_created_range(self):
+        start = timezone.make_aware(datetime(2025, 3, 1))
+        Report.objects.filter(pk=self.report1.pk).update(
+            created_at=start + timedelta(hours=23, minutes=59))
+        Report.objects.filter(pk=self.report2.pk).update(
+            created_at=start + timedelta(days=1))
+        self.client.login(username="coordinator", password="test password")
+
+        response = self.client.get(reverse("tasks:report-list"),
+                                   {"created_filter": "2025-03-01"})
+        self.assertEqual(list(response.context["report_list"]),
+                         [self.report1])
+
+        response = self.client.get(reverse("tasks:report-list"),
+                                   {"created_from": "2025-03-02"})
+        self.assertEqual(list(response.context["report_list"]),
+                         [self.report2])
+
+        response = self.client.get(reverse("tasks:report-list"),
+                                   {"created_from": "2025-03-01",
+                                    "created_to": "2025-03-02"})
+        self.assertEqual(len(response.context["report_list"]), 2)
+
+    def test_view_filtering_unverified(self):
+        self.report1.verified_at = timezone.now()
+        self.report1.save()
+        self.client.login(username="coordinator", password="test password")
+        response = self.client.get(reverse("tasks:report-list"),
+                                   {"unverified": "on"})
+        reports = response.context["report_list"]
+        self.assertNotIn(self.report1, reports)
+        self.assertIn(self.report2, reports)
+
     def test_view_pagination(self):
         self.client.login(username="coordinator", password="test password")
         for report in range(15):
@@ -1211,3 +1320,95 @@ class ReportDeleteViewTest(TestCase):
         response = self.client.post(reverse("tasks:report-delete", args=[self.report.id]))
         self.assertEqual(response.status_code, 302)
         self.assertIn("/login", response.url)
+
+
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        self.coordinator = get_user_model().objects.create_user(
+            username="coordinator",
+            password="test password",
+            role="coordinator",
+        )
+        volunteer = get_user_model().objects.create_user(
+            username="volunteer", role="volunteer")
+        self.task = Task.objects.create(title="test task",
+                                        assigned_to=volunteer)
+        self.report = Report.objects.create(comment="test report",
+                                            task=self.task)
+        self.client.login(username="coordinator", password="test password")
+
+    def revalidate(self, url, response):
+        return self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+    def test_unchanged_pages_answer_304_without_rendering(self):
+        for url in (reverse("tasks:task-list"),
+                    reverse("tasks:task-detail", args=[self.task.pk]),
+                    reverse("tasks:report-list"),
+                    reverse("tasks:report-detail", args=[self.report.pk])):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertIn("private", response["Cache-Control"])
+            again = self.revalidate(url, response)
+            self.assertEqual(again.status_code, 304, url)
+            self.assertFalse(again.templates)
+
+    def test_filtered_queryset_is_built_once(self):
+        with patch.object(TaskListView, "get_queryset", autospec=True,
+                          side_effect=TaskListView.get_queryset) as built:
+            response = self.client.get(reverse("tasks:task-list"),
+                                       {"title": "test"})
+        self.assertContains(response, "test task")
+        self.assertEqual(built.call_count, 1)
+
+    def test_flash_messages_are_not_cached(self):
+        response = self.client.post(
+            reverse("tasks:task-bulk-update"),
+            {"tasks": [self.task.pk], "action": "status",
+             "status": "completed"}, follow=True)
+        self.assertContains(response, "Updated 1 task(s).")
+        self.assertNotIn("ETag", response)
+        self.assertNotIn("Last-Modified", response)
+        self.assertIn("no-store", response["Cache-Control"])
+        again = self.client.get(reverse("tasks:task-list"))
+        self.assertEqual(again.status_code, 200)
+        self.assertNotContains(again, "Updated 1 task(s).")
+        self.assertEqual(self.revalidate(reverse("tasks:task-list"),
+                                         again).status_code, 304)
+
+    def test_if_modified_since(self):
+        url = reverse("tasks:task-detail", args=[self.task.pk])
+        response = self.client.get(url)
+        again = self.client.get(
+            url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(again.status_code, 304)
+
+    def test_lists_have_no_last_modified(self):
+        url = reverse("tasks:task-list")
+        self.assertNotIn("Last-Modified", self.client.get(url))
+        # A delete leaves MAX(updated_at) of the remaining rows as it was.
+        self.task.delete()
+        again = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date())
+        self.assertEqual(again.status_code, 200)
+
+    def test_task_changes_invalidate(self):
+        url = reverse("tasks:task-list")
+        response = self.client.get(url)
+        self.task.title = "renamed"
+        self.task.save()
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_retagging_touches_the_task(self):
+        url = reverse("tasks:task-detail", args=[self.task.pk])
+        response = self.client.get(url)
+        before = self.task.updated_at
+        self.task.tags.add(Tag.objects.create(name="urgent"))
+        self.task.refresh_from_db()
+        self.assertGreater(self.task.updated_at, before)
+        self.assertEqual(self.revalidate(url, response).status_code, 200)
+
+    def test_filters_have_their_own_etag(self):
+        url = reverse("tasks:task-list")
+        response = self.client.get(url)
+        other = self.client.get(url, {"status": "completed"},
+                                HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(other.status_code, 200)
@@ -145,3 +145,45 @@ EMAIL_USE_TLS = True
 EMAIL_HOST_USER = os.getenv("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = os.getenv("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+
+# Notification outbox, drained by `manage.py process_outbox`
+EMAIL_OUTBOX_BATCH_SIZE = int(os.getenv("EMAIL_OUTBOX_BATCH_SIZE", 50))
+EMAIL_OUTBOX_MAX_ATTEMPTS = int(os.getenv("EMAIL_OUTBOX_MAX_ATTEMPTS", 5))
+EMAIL_OUTBOX_RETRY_DELAY = 60
+EMAIL_OUTBOX_MAX_RETRY_DELAY = 60 * 60
+# Seconds a claimed batch stays hidden from other workers while it is sent
+EMAIL_OUTBOX_CLAIM_TIMEOUT = 5 * 60
+# Messages sent over a single SMTP connection before it is recycled
+EMAIL_SEND_BATCH_SIZE = int(os.getenv("EMAIL_SEND_BATCH_SIZE", 100))
+# Seconds to collect assignment emails per volunteer into one digest (0 = off)
+NOTIFICATION_DIGEST_WINDOW = int(os.getenv("NOTIFICATION_DIGEST_WINDOW", 0))
+
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+    }
+}
+# Seconds a cached dashboard may live; writes invalidate it sooner
+DASHBOARD_CACHE_TIMEOUT = 300
+# Seconds other workers wait for the one rebuilding an invalidated entry
+CACHE_LOCK_TIMEOUT = 5
+# Seconds filter facet counts are reused for the same filter combination
+FACET_CACHE_TIMEOUT = 30
+# Seconds cached <select> choices live; writes invalidate them sooner
+CHOICES_CACHE_TIMEOUT = 60 * 60
+# Most options an autocomplete endpoint returns per request
+AUTOCOMPLETE_LIMIT = 20
+# Rows fetched per round trip while streaming a CSV/NDJSON export
+EXPORT_CHUNK_SIZE = int(os.getenv("EXPORT_CHUNK_SIZE", 2000))
+# Most tasks accepted by one bulk create request
+BULK_CREATE_MAX_TASKS = int(os.getenv("BULK_CREATE_MAX_TASKS", 1000))
+# Tasks inserted per transaction by CSV imports
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", 1000))
+# Changes returned per sync request
+SYNC_PAGE_SIZE = int(os.getenv("SYNC_PAGE_SIZE", 500))
+# Seconds a change log entry waits before sync serves it, so entries from
+# transactions still in flight are not skipped
+SYNC_SAFETY_LAG = int(os.getenv("SYNC_SAFETY_LAG", 5))
+
+# Show a planner row estimate as the list total on Postgres (off = no total)
+PAGINATION_ESTIMATE_COUNT = os.getenv("PAGINATION_ESTIMATE_COUNT") == "1"
@@ -1,3 +1,5 @@
+import os
+
 from dotenv import load_dotenv
 from .base import *
 
@@ -19,3 +21,12 @@ DATABASES = {
         "PORT": int(os.environ["POSTGRES_DB_PORT"]),
     }
 }
+
+# Shared between worker processes so cache invalidation reaches all of them
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": os.getenv("CACHE_DIR",
+                              "/tmp/volunteer_task_manager_cache"),
+    }
+}